@@ -8,6 +8,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.board import Board
 from core.player import Player
 from core.ai import AIPlayer
+from core.game import Game, NO_PLAY, FORCED
 
 
 def _candidate_from_points(board: Board, player: Player) -> List[int]:
@@ -61,49 +62,60 @@ def _input_from_point(
         print(f"Invalid point. Valid options: {sorted(valid_choices)} (or 'pass').")
 
 
-def _play_human_turn(board: Board, player: Player) -> None:
+def _play_forced_turn(game: Game) -> bool:
+    """Lets the game play the turn when the dice leave no choice, printing it. Returns True if the turn is over."""
+    kind = game.classify_roll()
+    if kind == NO_PLAY:
+        print("- Sin movimientos posibles.")
+    elif kind == FORCED:
+        for from_point, to_point, die in game.get_legal_plays()[0]:
+            print(f"Jugada forzada: desde {from_point} a {to_point} con dado {die}.")
+    return game.play_forced_turn()
+
+
+def _roll(game: Game) -> None:
+    """Rolls the dice for the turn and shows them."""
+    game.roll_dice()
+    print(f"Dados: {game.dice.get_values()}")
+
+
+def _play_human_turn(game: Game, player: Player) -> None:
     print(f"\nTurno de {player.get_name()} ({player.get_color()}).")
-    dice = board.roll_dice()
-    print(f"Dados: {dice}")
-
-    for die in dice:
-        valid_froms = [
-            fp
-            for fp in range(24)
-            if board.get_point(fp) and board.get_point(fp)[0].get_owner() == player
-        ]
-        if len(board.get_bar()[player]) > 0:
-            valid_froms = ["bar"]
-
-        if not any(board.is_valid_move(fp, die, player) for fp in valid_froms):
-            print(f"- Sin movimientos válidos para dado {die}.")
+    _roll(game)
+    if _play_forced_turn(game):
+        game.board.display()
+        return
+
+    while game.dice.get_values():
+        moves = game.get_legal_moves()
+        if not moves:
+            print("- Sin movimientos posibles.")
+            break
+        print(f"Dados restantes: {game.dice.get_values()}")
+        raw = input("Elige punto de origen (o 'pass'): ").strip().lower()
+        if raw == "pass":
+            break
+        try:
+            from_point = "bar" if raw == "bar" else int(raw)
+        except ValueError:
+            print("Entrada inválida. Ingresa un número de punto o 'bar'.")
             continue
 
-        while True:
-            try:
-                from_point_str = input(
-                    f"Elige punto de origen para mover con dado {die} (o 'pass'): "
-                )
-                if from_point_str.lower() == "pass":
-                    break
-                
-                from_point = (
-                    "bar"
-                    if from_point_str.lower() == "bar"
-                    else int(from_point_str)
-                )
-
-                if board.is_valid_move(from_point, die, player):
-                    board.move_piece(from_point, die, player)
-                    print(f"Movido desde {from_point_str} con {die}.")
-                    break
-                else:
-                    print("Movimiento inválido. Intenta de nuevo.")
-            except ValueError:
-                print("Entrada inválida. Ingresa un número de punto o 'bar'.")
-            except IndexError:
-                print("Número de punto fuera de rango.")
-    board.display()
+        options = [move for move in moves if move[0] == from_point]
+        if not options:
+            print("Movimiento inválido. Intenta de nuevo.")
+            continue
+        if len(options) > 1:
+            raw = input(f"Elige dado {[die for _, _, die in options]}: ").strip()
+            options = [move for move in options if str(move[2]) == raw]
+            if not options:
+                print("Dado inválido. Intenta de nuevo.")
+                continue
+
+        from_point, to_point, die = options[0]
+        game.move(from_point, to_point, die)
+        print(f"Movido desde {from_point} a {to_point} con {die}.")
+    game.board.display()
 
 
 def _can_bear_off(board: Board, player: Player, die: int) -> bool:
@@ -125,44 +137,26 @@ def _parse_from_point(choice: str, player: Player) -> int:
     return int(choice)
 
 
-def _play_ai_turn(board: Board, player: Player) -> None:
+def _play_ai_turn(game: Game, player: Player) -> None:
     print(f"\nTurno de {player.get_name()} ({player.get_color()}).")
-    dice = board.roll_dice()
-    print(f"Dados: {dice}")
+    _roll(game)
+    if _play_forced_turn(game):
+        game.board.display()
+        return
 
-    moves = player.choose_moves(board, dice)
-    
+    moves = player.choose_moves(game.board, list(game.dice.get_values()))
     if not moves:
         print("La IA no tiene movimientos.")
-    else:
-        for from_point, to_point in moves:
-            try:
-                # We need to calculate the die used for the move to call `move_piece`
-                if to_point == "off":
-                    required_die = (
-                        (from_point + 1)
-                        if player.get_color() == "white"
-                        else (24 - from_point)
-                    )
-                    die = next(
-                        (d for d in dice if d >= required_die), max(dice)
-                    )
-                elif from_point == "bar":
-                    die = (
-                        (24 - to_point)
-                        if player.get_color() == "white"
-                        else (to_point + 1)
-                    )
-                else:
-                    die = abs(to_point - from_point)
-
-                board.move_piece(from_point, die, player)
-                from_display = "bar" if from_point == "bar" else from_point
-                print(f"IA movió desde {from_display} a {to_point} con dado {die}.")
-            except ValueError as e:
-                print(f"La IA intentó un movimiento inválido: {e}")
-    
-    board.display()
+    for move in moves:
+        try:
+            # Search-based AIs give the die as a third element, otherwise the game infers it
+            die = game.move(*move)
+            print(f"IA movió desde {move[0]} a {move[1]} con dado {die}.")
+        except ValueError as e:
+            print(f"La IA intentó un movimiento inválido: {e}")
+            break
+
+    game.board.display()
 
 
 def _choose_mode() -> str:
@@ -189,22 +183,22 @@ def main() -> None:
             name = input("Nombre del jugador humano: ").strip() or "Humano"
             human = Player(name, "white")
             ai_player = AIPlayer("Computer", "black")
-            board = Board(human, ai_player)
+            game = Game([human, ai_player])
             print(
                 f"Juego iniciado: Humano ({human.get_name()}) vs IA ({ai_player.get_name()})."
             )
-            play_game(board, human, ai_player)
+            play_game(game)
         elif choice == "2":
             # Humano vs Humano
             name1 = input("Nombre del Jugador 1 (blanco): ").strip() or "Jugador 1"
             name2 = input("Nombre del Jugador 2 (negro): ").strip() or "Jugador 2"
             p1 = Player(name1, "white")
             p2 = Player(name2, "black")
-            board = Board(p1, p2)
+            game = Game([p1, p2])
             print("Juego iniciado: Humano vs Humano.")
-            play_game(board, p1, p2)
+            play_game(game)
 
-        winner = board.get_winner() if board.is_game_over() else None
+        winner = game.get_winner() if game.is_game_over() else None
         if winner:
             print(f"\n¡{winner.get_name()} ({winner.get_color()}) gana!")  # Usa getters
         else:
@@ -213,20 +207,20 @@ def main() -> None:
         print("\nInterrumpido por el usuario.")
 
 
-def play_game(board, p1, p2):
-    while not board.is_game_over():
-        current_player = board.get_current_player()
+def play_game(game: Game):
+    while not game.is_game_over():
+        current_player = game.get_current_player()
         print(f"Turno: {current_player.get_name()}")
-        board.display()
+        game.board.display()
 
         if isinstance(current_player, AIPlayer):
-            _play_ai_turn(board, current_player)
+            _play_ai_turn(game, current_player)
         else:
-            _play_human_turn(board, current_player)
+            _play_human_turn(game, current_player)
 
-        board.switch_player()
+        game.switch_player()
 
-    winner = board.get_winner()
+    winner = game.get_winner()
     if winner:
         print(f"¡{winner.get_name()} gana!")  # Usa getter
     else:
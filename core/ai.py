@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING, List
 from .player import Player
-import copy
 
 if TYPE_CHECKING:
     from .board import Board
@@ -10,22 +9,42 @@ class AIPlayer(Player):
     Represents an AI player that can choose its own moves. Inherits from Player.
     """
 
-    def choose_moves(self, board: 'Board', dice: List[int]) -> List[tuple]:
+    def choose_moves(self, board: 'Board', dice: List[int], time_budget_ms: float = None) -> List[tuple]:
         """
         Chooses a sequence of moves for the AI based on the current board state and dice.
 
         This implementation uses a simple greedy algorithm that prioritizes higher dice values
-        and bearing off. It simulates moves on a temporary board to find a valid sequence.
+        and bearing off. It simulates moves on the board itself with ``apply_move`` and
+        reverts them with ``undo_move`` before returning, so the board is left unchanged.
 
         Args:
             board (Board): The current state of the game board.
             dice (List[int]): The dice values available for the turn.
+            time_budget_ms (float, optional): Time budget for searching AIs. The greedy
+                choice is immediate, so it is ignored here.
 
         Returns:
             List[tuple]: A list of move tuples, e.g., [('bar', 22), (5, 3)].
         """
         best_moves = []
-        temp_board = copy.deepcopy(board)
+        undo_records = []
+        try:
+            self._search_greedy(board, dice, best_moves, undo_records)
+        finally:
+            for record in reversed(undo_records):
+                board.undo_move(record)
+        return best_moves
+
+    def _search_greedy(self, board: 'Board', dice: List[int], best_moves: List[tuple], undo_records: list):
+        """
+        Fills ``best_moves`` with the greedy move sequence, applying each move to the board.
+
+        Args:
+            board (Board): The board to simulate on. Every applied move is recorded.
+            dice (List[int]): The dice values available for the turn.
+            best_moves (List[tuple]): Receives the chosen (from, to) moves.
+            undo_records (list): Receives the undo records of the applied moves.
+        """
         temp_dice = sorted(list(set(dice)), reverse=True)  # Use unique dice, higher first
         
         if len(dice) > len(temp_dice): # Handle doubles
@@ -38,10 +57,10 @@ class AIPlayer(Player):
             move_found = None
 
             # Priority 1: Find a valid move from the bar
-            if temp_board.get_bar().get(self):
+            if board.get_bar().get(self):
                 for d in temp_dice:
                     # The move logic in board.py handles the conversion from die to point
-                    if temp_board.is_valid_move('bar', d, self):
+                    if board.is_valid_move('bar', d, self):
                         to_point = (d - 1) if self.get_color() == 'black' else (24 - d)
                         move_found = ('bar', to_point)
                         die_to_use = d
@@ -55,10 +74,10 @@ class AIPlayer(Player):
                     point_range = range(24) if self.get_color() == 'black' else range(23, -1, -1)
                     for i in point_range:
                         # Check if a checker of the AI's color is on this point
-                        if temp_board.get_point(i) and temp_board.get_point(i)[0].get_owner() == self:
-                            if temp_board.is_valid_move(i, d, self):
+                        if board.get_point(i) and board.get_point(i)[0].get_owner() == self:
+                            if board.is_valid_move(i, d, self):
                                 # Check for bear-off first if eligible
-                                if temp_board.can_player_bear_off(self):
+                                if board.can_player_bear_off(self):
                                     # Exact bear-off
                                     if (self.get_color() == 'white' and (i + 1) == d) or \
                                        (self.get_color() == 'black' and (24 - i) == d):
@@ -71,7 +90,7 @@ class AIPlayer(Player):
                                     to_point_calc = i + (d * direction)
                                     if 0 <= to_point_calc < 24:
                                          # Check if the destination point is valid
-                                        target_point_content = temp_board.get_point(to_point_calc)
+                                        target_point_content = board.get_point(to_point_calc)
                                         if not target_point_content or len(target_point_content) <= 1 or target_point_content[0].get_owner() == self:
                                             move_found = (i, to_point_calc)
                                             die_to_use = d
@@ -84,12 +103,10 @@ class AIPlayer(Player):
                 if die_to_use in temp_dice:
                     temp_dice.remove(die_to_use)
                 
-                # Simulate the move on the temp board for the next iteration
+                # Simulate the move on the board for the next iteration
                 from_point_sim, _ = move_found
-                temp_board.move_piece(from_point_sim, die_to_use, self)
+                undo_records.append(board.apply_move(from_point_sim, die_to_use, self))
 
             else:
                 # No more moves possible with the remaining dice
                 break
-
-        return best_moves
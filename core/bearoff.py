@@ -0,0 +1,338 @@
+"""
+One-sided bear-off database.
+
+For every distribution of up to 15 checkers on the six home points it stores the
+expected number of rolls needed to bear them all off and the distribution of that
+number, assuming the side plays to minimise the expected rolls. Once both sides are
+bearing off the game is a pure race, so these two tables give the winning chances
+without searching.
+
+The file is a small header followed by fixed-size records in position-index order
+and is memory-mapped, so loading it costs nothing. Build it with:
+
+    python -m core.bearoff [--checkers 15] [--output assets/bearoff.db]
+"""
+import argparse
+import mmap
+import os
+import struct
+from math import comb
+from typing import List, Optional, TYPE_CHECKING
+from .movetables import HOME_POINT, SIGNS
+
+if TYPE_CHECKING:
+    from .board import Board
+
+HOME_POINTS = 6
+MAX_CHECKERS = 15
+# Probabilities kept per position, starting at the first roll count with any weight
+DIST_WIDTH = 16
+# Probabilities are stored as fractions of DIST_SCALE
+DIST_SCALE = 65535
+
+MAGIC = b'BGBO'
+VERSION = 1
+# magic, version, maximum checkers
+HEADER = struct.Struct('<4sBB')
+# expected rolls, first roll count, probabilities
+RECORD = struct.Struct('<fB%dH' % DIST_WIDTH)
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'bearoff.db')
+
+# Race values are scaled so they stay below a finished game
+RACE_SCALE = 0.99
+
+
+def _build_offsets(max_checkers: int) -> list:
+    """
+    Builds the ranking table: OFFSETS[i][m][c] is the number of positions that come
+    before a position with ``c`` checkers on point ``i`` when ``m`` checkers were
+    still unplaced, among those sharing the earlier points.
+    """
+    offsets = []
+    for i in range(HOME_POINTS):
+        rest = HOME_POINTS - 1 - i
+        offsets.append([
+            [sum(comb(m - v + rest, rest) for v in range(c)) for c in range(m + 1)]
+            for m in range(max_checkers + 1)
+        ])
+    return offsets
+
+
+_OFFSETS = _build_offsets(MAX_CHECKERS)
+
+
+def position_count(max_checkers: int) -> int:
+    """Returns the number of positions with up to ``max_checkers`` checkers."""
+    return comb(max_checkers + HOME_POINTS, HOME_POINTS)
+
+
+def position_index(counts, max_checkers: int = MAX_CHECKERS) -> int:
+    """
+    Returns the index of a home-board position.
+
+    Args:
+        counts (tuple): Checkers on the points 1 to 6 pips away from bearing off.
+        max_checkers (int, optional): The database size. Defaults to 15.
+
+    Returns:
+        int: The index, positions being numbered in lexicographic order.
+    """
+    index, left = 0, max_checkers
+    for i, count in enumerate(counts):
+        index += _OFFSETS[i][left][count]
+        left -= count
+    return index
+
+
+def home_counts(board: 'Board', side: int) -> tuple:
+    """Returns the checkers of ``side`` on its home points, nearest to bearing off first."""
+    cells, sign = board.get_cells(), SIGNS[side]
+    return tuple(cells[HOME_POINT[side][pip]] * sign for pip in range(1, HOME_POINTS + 1))
+
+
+def _positions(max_checkers: int) -> List[tuple]:
+    """Lists every position in index order."""
+    positions = []
+
+    def place(point, left, counts):
+        if point == HOME_POINTS:
+            positions.append(tuple(counts))
+            return
+        for count in range(left + 1):
+            counts.append(count)
+            place(point + 1, left - count, counts)
+            counts.pop()
+
+    place(0, max_checkers, [])
+    return positions
+
+
+def _single_moves(counts: tuple, die: int) -> set:
+    """Returns the positions reachable by playing one die, bearing off as allowed."""
+    highest = max(i for i in range(HOME_POINTS) if counts[i])
+    results = set()
+    for i in range(HOME_POINTS):
+        if not counts[i]:
+            continue
+        after = list(counts)
+        after[i] -= 1
+        if i + 1 > die:
+            after[i - die] += 1
+        elif i + 1 < die and i != highest:
+            # A larger die only bears off from the highest point
+            continue
+        results.add(tuple(after))
+    return results
+
+
+def _roll_results(counts: tuple, dice: tuple) -> set:
+    """Returns the positions reachable by playing a whole roll."""
+    orders = [(dice[0],) * 4] if dice[0] == dice[1] else [dice, dice[::-1]]
+    results = set()
+    for order in orders:
+        current = {counts}
+        for die in order:
+            current = {after for position in current
+                       for after in (_single_moves(position, die) if any(position) else (position,))}
+        results |= current
+    return results
+
+
+def build_database(path: str, max_checkers: int = MAX_CHECKERS) -> int:
+    """
+    Generates the database and writes it to ``path``.
+
+    Positions are solved in order of increasing pip count, so every position a roll
+    leads to is already known. For each roll the play with the fewest expected rolls
+    is taken.
+
+    Args:
+        path (str): Where to write the file.
+        max_checkers (int, optional): Largest number of checkers covered. Defaults to 15.
+
+    Returns:
+        int: The number of positions written.
+
+    Raises:
+        ValueError: If ``max_checkers`` is not between 1 and 15.
+    """
+    if not 1 <= max_checkers <= MAX_CHECKERS:
+        raise ValueError("max_checkers must be between 1 and %d" % MAX_CHECKERS)
+    rolls = [((d1, d2), (1 if d1 == d2 else 2) / 36) for d1 in range(1, 7) for d2 in range(d1, 7)]
+    positions = _positions(max_checkers)
+    means = [0.0] * len(positions)
+    dists = [None] * len(positions)
+    by_pips = sorted(range(len(positions)),
+                     key=lambda n: sum((i + 1) * c for i, c in enumerate(positions[n])))
+
+    for n in by_pips:
+        counts = positions[n]
+        if not any(counts):
+            dists[n] = [1.0]
+            continue
+        dist = [0.0]
+        for dice, probability in rolls:
+            best = min((position_index(after, max_checkers) for after in _roll_results(counts, dice)),
+                       key=means.__getitem__)
+            following = dists[best]
+            if len(dist) < len(following) + 1:
+                dist.extend([0.0] * (len(following) + 1 - len(dist)))
+            for rolls_left, p in enumerate(following):
+                dist[rolls_left + 1] += probability * p
+        dists[n] = dist
+        means[n] = sum(k * p for k, p in enumerate(dist))
+
+    with open(path, 'wb') as handle:
+        handle.write(HEADER.pack(MAGIC, VERSION, max_checkers))
+        for mean, dist in zip(means, dists):
+            handle.write(RECORD.pack(mean, *_quantize(dist)))
+    return len(positions)
+
+
+def _quantize(dist: List[float]) -> list:
+    """Packs a distribution as its first roll count and DIST_WIDTH scaled probabilities."""
+    first = next(k for k, p in enumerate(dist) if p * DIST_SCALE >= 0.5)
+    values = [round(p * DIST_SCALE) for p in dist[first:first + DIST_WIDTH]]
+    return [first] + values + [0] * (DIST_WIDTH - len(values))
+
+
+class BearoffDatabase:
+    """
+    Read-only view of a bear-off database file, memory-mapped.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens a database file.
+
+        Args:
+            path (str): The file written by ``build_database``.
+
+        Raises:
+            ValueError: If the file is not a bear-off database of a known version.
+        """
+        with open(path, 'rb') as handle:
+            self.__map__ = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_checkers = HEADER.unpack_from(self.__map__, 0)
+        if magic != MAGIC or version != VERSION:
+            self.__map__.close()
+            raise ValueError("Not a bear-off database: %s" % path)
+        if len(self.__map__) != HEADER.size + position_count(max_checkers) * RECORD.size:
+            self.__map__.close()
+            raise ValueError("Truncated bear-off database: %s" % path)
+        self.__max_checkers__ = max_checkers
+
+    def get_max_checkers(self) -> int:
+        """Returns the largest number of checkers the database covers."""
+        return self.__max_checkers__
+
+    def covers(self, counts) -> bool:
+        """Returns whether a position is in the database."""
+        return sum(counts) <= self.__max_checkers__
+
+    def _record(self, counts) -> tuple:
+        if not self.covers(counts):
+            raise ValueError("Position has more than %d checkers" % self.__max_checkers__)
+        offset = HEADER.size + position_index(counts, self.__max_checkers__) * RECORD.size
+        return RECORD.unpack_from(self.__map__, offset)
+
+    def expected_rolls(self, counts) -> float:
+        """
+        Returns the expected number of rolls to bear off a position.
+
+        Args:
+            counts (tuple): Checkers on the points 1 to 6 pips away from bearing off.
+
+        Returns:
+            float: The expected number of rolls.
+
+        Raises:
+            ValueError: If the position has more checkers than the database covers.
+        """
+        return self._record(counts)[0]
+
+    def distribution(self, counts) -> List[float]:
+        """
+        Returns the distribution of the number of rolls to bear off a position.
+
+        Args:
+            counts (tuple): Checkers on the points 1 to 6 pips away from bearing off.
+
+        Returns:
+            List[float]: Element ``n`` is the probability of needing exactly ``n`` rolls.
+
+        Raises:
+            ValueError: If the position has more checkers than the database covers.
+        """
+        record = self._record(counts)
+        values = record[2:]
+        total = sum(values)
+        return [0.0] * record[1] + [value / total for value in values]
+
+    def win_probability(self, board: 'Board', side: int) -> Optional[float]:
+        """
+        Returns the chance that ``side``, on roll, wins the race when both sides are bearing off.
+
+        Args:
+            board (Board): The position. Both sides must have every checker home or off.
+            side (int): The side on roll.
+
+        Returns:
+            float or None: The winning chance, or None if a side is not covered.
+        """
+        ours, theirs = home_counts(board, side), home_counts(board, 1 - side)
+        if not (self.covers(ours) and self.covers(theirs)):
+            return None
+        ours, theirs = self.distribution(ours), self.distribution(theirs)
+        # The side on roll wins when it needs no more rolls than the opponent
+        win, at_least = 0.0, 1.0
+        for rolls in range(len(ours)):
+            if rolls > 0 and rolls - 1 < len(theirs):
+                at_least -= theirs[rolls - 1]
+            win += ours[rolls] * max(at_least, 0.0)
+        return win
+
+    def close(self):
+        """Releases the memory map."""
+        self.__map__.close()
+
+
+_default_database = None
+_default_loaded = False
+
+
+def get_default_database() -> Optional[BearoffDatabase]:
+    """
+    Returns the database at DEFAULT_PATH, opened on first use.
+
+    Returns:
+        BearoffDatabase or None: None if the file has not been built.
+    """
+    global _default_database, _default_loaded
+    if not _default_loaded:
+        _default_loaded = True
+        if os.path.exists(DEFAULT_PATH):
+            _default_database = BearoffDatabase(DEFAULT_PATH)
+    return _default_database
+
+
+def set_default_database(database: Optional[BearoffDatabase]):
+    """Replaces the database used by the evaluator. None disables lookups."""
+    global _default_database, _default_loaded
+    _default_database = database
+    _default_loaded = True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the one-sided bear-off database.")
+    parser.add_argument('--checkers', type=int, default=MAX_CHECKERS,
+                        help="largest number of checkers covered (default: %(default)s)")
+    parser.add_argument('--output', default=DEFAULT_PATH, help="output file (default: %(default)s)")
+    args = parser.parse_args(argv)
+    count = build_database(args.output, args.checkers)
+    print(f"Wrote {count} positions to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
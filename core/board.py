@@ -1,6 +1,14 @@
 from __future__ import annotations
-from typing import Dict, List, TYPE_CHECKING
+from array import array
+from collections.abc import MutableMapping, Sequence
+from typing import List, TYPE_CHECKING
 from .checkers import Checkers
+from .turnstate import TurnState
+from .zobrist import CELL_KEYS, OFF_KEYS, SIDE_KEY, VALUES_PER_CELL, compute_hash
+from .movetables import (
+    WHITE, BLACK, WHITE_BAR, BLACK_BAR, NUM_CELLS, SIGNS, BARS, OFF,
+    PIPS, DESTINATIONS, BEAR_OFF_DIE, HOME_POINT, FULL_MASK,
+)
 import random
 
 if TYPE_CHECKING:
@@ -8,12 +16,81 @@ if TYPE_CHECKING:
     from .ai import AIPlayer
 
 
+def side_of_color(color: str) -> int:
+    """Returns the side index (WHITE or BLACK) for a color name."""
+    return WHITE if color == 'white' else BLACK
+
+
+class _PointsView(Sequence):
+    """
+    Read/write view of the 24 points as lists of Checkers, kept for
+    compatibility with code written against the old list-of-lists layout.
+    """
+
+    def __init__(self, board: 'Board'):
+        self.__board__ = board
+
+    def __len__(self):
+        return 24
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.__board__.get_point(i) for i in range(24)[index]]
+        if index < 0:
+            index += 24
+        return self.__board__.get_point(index)
+
+    def __setitem__(self, index: int, checkers: List[Checkers]):
+        if index < 0:
+            index += 24
+        if not 0 <= index < 24:
+            raise IndexError("Invalid point index")
+        self.__board__._set_cell(index, self.__board__._signed_count(checkers))
+
+
+class _BarView(MutableMapping):
+    """
+    Read/write view of the bar as a {player: [Checkers]} mapping, kept for
+    compatibility with code written against the old dict layout.
+    """
+
+    def __init__(self, board: 'Board'):
+        self.__board__ = board
+
+    def __getitem__(self, player: 'Player'):
+        side = self.__board__._side(player)
+        return self.__board__._checkers_list(side, self.__board__._cell_count(BARS[side], side))
+
+    def __setitem__(self, player: 'Player', checkers: List[Checkers]):
+        side = self.__board__._side(player)
+        self.__board__._set_cell(BARS[side], len(checkers) * SIGNS[side])
+
+    def __delitem__(self, player: 'Player'):
+        side = self.__board__._side(player)
+        self.__board__._set_cell(BARS[side], 0)
+
+    def __iter__(self):
+        return iter(self.__board__._players())
+
+    def __len__(self):
+        return 2
+
+
 class Board:
     """
     Manages the Backgammon board state and move validation.
+
+    The position is stored as 26 signed small integers (see the layout in
+    ``core.movetables``) plus one borne-off counter per side. ``get_point``,
+    ``get_points`` and ``get_bar`` expose it as lists of ``Checkers`` for
+    callers that still expect the old representation.
+
+    Whose turn it is comes from a ``TurnState``, normally the one owned by the
+    ``Game``. The board only reads it.
     """
 
-    def __init__(self, player1: 'Player', player2: 'Player', random_positions: bool = False):
+    def __init__(self, player1: 'Player', player2: 'Player', random_positions: bool = False,
+                 turn_state: TurnState = None):
         """
         Initializes the Board object.
 
@@ -21,42 +98,88 @@ class Board:
             player1 (Player): The first player (white).
             player2 (Player): The second player (black).
             random_positions (bool, optional): Whether to set up the board with random checker positions. Defaults to False.
+            turn_state (TurnState, optional): The side to move and its dice, owned by the game.
+                Defaults to a new state with player1 to move.
         """
         self.__player1__ = player1  # White
         self.__player2__ = player2  # Black
         self.__winner__ = None
-        self.__points__ = self._create_points(random_positions)
-        self.__bar__: Dict['Player', List[Checkers]] = {player1: [], player2: []}
-        self.__off_board__: Dict['Player', int] = {player1: 0, player2: 0}
-        self.__current_player__ = player1
-        self.__dice__ = []
+        self.__side1__ = side_of_color(player1.get_color())
+        self.__side2__ = 1 - self.__side1__
+        self.__by_side__ = [None, None]
+        self.__by_side__[self.__side1__] = player1
+        self.__by_side__[self.__side2__] = player2
+        # One shared Checkers per side backs every compatibility list
+        self.__checkers__ = (Checkers(self.__by_side__[WHITE]), Checkers(self.__by_side__[BLACK]))
+        self.__cells__ = self._create_cells(random_positions)
+        self.__off__ = [0, 0]
+        self.__turn__ = turn_state if turn_state is not None else TurnState(self.__side1__)
+        self.__zobrist__ = 0
+        self.__pips__ = [0, 0]
+        self.__outside__ = [0, 0]
+        self.__top__ = [0, 0]
+        # Per-side point bitmasks: any checker, two or more checkers, exactly one checker
+        self.__owned__ = [0, 0]
+        self.__made__ = [0, 0]
+        self.__blots__ = [0, 0]
+        self._recompute()
 
 
     def get_current_player(self):
         """
         Returns the current player.
         """
-        return self.__current_player__
+        return self.__by_side__[self.__turn__.get_side()]
 
-    def roll_dice(self):
+    def get_turn_state(self) -> TurnState:
         """
-        Rolls the dice for the current turn and handles doubles.
+        Returns the side to move, its remaining dice and the turn number.
+
+        Returns:
+            TurnState: The state shared with the game. Treat it as read-only.
         """
-        die1 = random.randint(1, 6)
-        die2 = random.randint(1, 6)
-        if die1 == die2:
-            self.__dice__ = [die1] * 4
-        else:
-            self.__dice__ = [die1, die2]
-        return self.__dice__
+        return self.__turn__
+
+    def copy(self) -> 'Board':
+        """
+        Returns an independent copy of the board that shares the same players.
+
+        Searching on a copy leaves this board untouched, so it can be done on another
+        thread while this one is drawn. The copy gets its own copy of the turn state.
 
-    def switch_player(self):
+        Returns:
+            Board: The copy.
         """
-        Switches the turn to the other player.
+        clone = Board.__new__(Board)
+        clone.__dict__.update(self.__dict__)
+        clone.__cells__ = array('b', self.__cells__)
+        clone.__turn__ = self.__turn__.copy()
+        for name in ('__off__', '__pips__', '__outside__', '__top__',
+                     '__owned__', '__made__', '__blots__'):
+            clone.__dict__[name] = list(self.__dict__[name])
+        return clone
+
+    def set_position(self, cells, off):
         """
-        self.__current_player__ = self.__player2__ if self.__current_player__ == self.__player1__ else self.__player1__
+        Loads a position, e.g. one sent to another process as ``get_cells()`` and the off counts.
 
-    def _create_points(self, random_positions: bool = False):
+        Args:
+            cells (Sequence[int]): The 26 signed cell counts.
+            off (Sequence[int]): Checkers borne off by white and black.
+        """
+        self.__cells__ = array('b', cells)
+        self.__off__ = [off[WHITE], off[BLACK]]
+        self.__winner__ = None
+        for side in (WHITE, BLACK):
+            if self.__off__[side] == 15:
+                self.__winner__ = self.__by_side__[side]
+        self._recompute()
+
+    def get_off_counts(self) -> tuple:
+        """Returns the checkers borne off by white and black."""
+        return (self.__off__[WHITE], self.__off__[BLACK])
+
+    def _create_cells(self, random_positions: bool = False):
         """
         Creates the initial layout of the checkers on the board.
 
@@ -64,38 +187,279 @@ class Board:
             random_positions (bool, optional): If True, places checkers randomly. Defaults to False.
 
         Returns:
-            list: A list of 24 lists, where each inner list represents a point on the board.
+            array: 26 signed counts, one per point plus the two bars.
         """
-        points = [[] for _ in range(24)]
+        cells = array('b', [0] * NUM_CELLS)
         if not random_positions:
-            # Player 1 (White) moves from 23 down to 0
-            points[23] = [Checkers(self.__player1__) for _ in range(2)]
-            points[12] = [Checkers(self.__player1__) for _ in range(5)]
-            points[7] = [Checkers(self.__player1__) for _ in range(3)]
-            points[5] = [Checkers(self.__player1__) for _ in range(5)]
-            
-            # Player 2 (Black) moves from 0 up to 23
-            points[0] = [Checkers(self.__player2__) for _ in range(2)]
-            points[11] = [Checkers(self.__player2__) for _ in range(5)]
-            points[16] = [Checkers(self.__player2__) for _ in range(3)]
-            points[18] = [Checkers(self.__player2__) for _ in range(5)]
+            # White moves from 23 down to 0
+            cells[23] = 2
+            cells[12] = 5
+            cells[7] = 3
+            cells[5] = 5
+
+            # Black moves from 0 up to 23
+            cells[0] = -2
+            cells[11] = -5
+            cells[16] = -3
+            cells[18] = -5
         else:
             # Random setup
-            for player in [self.__player1__, self.__player2__]:
+            for side in (self.__side1__, self.__side2__):
+                sign = SIGNS[side]
                 remaining_checkers = 15
                 while remaining_checkers > 0:
                     point_index = random.randrange(24)
-                    if not points[point_index] or points[point_index][0].get_owner() == player:
+                    if cells[point_index] * sign >= 0:
                         num_to_place = random.randint(1, remaining_checkers)
-                        for _ in range(num_to_place):
-                            points[point_index].append(Checkers(player))
+                        cells[point_index] += num_to_place * sign
                         remaining_checkers -= num_to_place
-        return points
+        return cells
+
+    # --- Internal helpers for the compact representation ---
+
+    def _side(self, player: 'Player') -> int:
+        """Returns the side index of a player, avoiding string comparisons for known players."""
+        if player is self.__player1__:
+            return self.__side1__
+        if player is self.__player2__:
+            return self.__side2__
+        return side_of_color(player.get_color())
+
+    def _players(self):
+        """Returns the players in construction order."""
+        return (self.__player1__, self.__player2__)
+
+    def _cell_count(self, index: int, side: int) -> int:
+        """Returns how many checkers of ``side`` sit on a cell (negative if the opponent holds it)."""
+        return self.__cells__[index] * SIGNS[side]
+
+    def _checkers_list(self, side: int, count: int) -> List[Checkers]:
+        """Builds a compatibility list of ``count`` checkers for ``side``."""
+        return [self.__checkers__[side]] * count if count > 0 else []
+
+    def _signed_count(self, checkers: List[Checkers]) -> int:
+        """Converts a list of Checkers into a signed cell value."""
+        if not checkers:
+            return 0
+        return len(checkers) * SIGNS[self._side(checkers[0].get_owner())]
+
+    def _set_cell(self, index: int, value: int):
+        """Overwrites a cell directly. Used by the compatibility views and test setup."""
+        self.__cells__[index] = value
+        self._recompute()
+
+    def _recompute(self):
+        """Recomputes the hash, pip counts, home-board counters and masks from scratch after a direct edit."""
+        cells = self.__cells__
+        # The side to move is mixed in by position_hash, from the turn state
+        self.__zobrist__ = compute_hash(cells, self.__off__, False)
+        for side in (WHITE, BLACK):
+            sign = SIGNS[side]
+            pips = PIPS[side]
+            total = outside = 0
+            for cell in range(NUM_CELLS):
+                count = cells[cell] * sign
+                if count > 0:
+                    total += count * pips[cell]
+                    if pips[cell] > 6:
+                        outside += count
+            self.__pips__[side] = total
+            self.__outside__[side] = outside
+            self.__top__[side] = self._scan_top(side)
+            self.__owned__[side] = self.__made__[side] = self.__blots__[side] = 0
+            for point in range(24):
+                self._update_masks(side, point, cells[point] * sign)
+
+    def _update_masks(self, side: int, point: int, count: int):
+        """Sets the mask bits of ``point`` for ``side`` from its checker count there."""
+        bit = 1 << point
+        if count >= 2:
+            self.__owned__[side] |= bit
+            self.__made__[side] |= bit
+            self.__blots__[side] &= ~bit
+        elif count == 1:
+            self.__owned__[side] |= bit
+            self.__made__[side] &= ~bit
+            self.__blots__[side] |= bit
+        else:
+            self.__owned__[side] &= ~bit
+            self.__made__[side] &= ~bit
+            self.__blots__[side] &= ~bit
+
+    def _scan_top(self, side: int) -> int:
+        """Returns the highest home-board point (1-6, in pips) holding a checker of ``side``, or 0."""
+        cells = self.__cells__
+        sign = SIGNS[side]
+        for pip in range(6, 0, -1):
+            if cells[pip - 1 if side == WHITE else 24 - pip] * sign > 0:
+                return pip
+        return 0
+
+    def _lift(self, side: int, cell: int):
+        """Removes one checker of ``side`` from ``cell``, keeping the hash and counters in step."""
+        cells = self.__cells__
+        value = cells[cell]
+        new_value = value - SIGNS[side]
+        base = cell * VALUES_PER_CELL + 15
+        self.__zobrist__ ^= CELL_KEYS[base + value] ^ CELL_KEYS[base + new_value]
+        cells[cell] = new_value
+        if cell < 24:
+            self._update_masks(side, cell, new_value * SIGNS[side])
+        pip = PIPS[side][cell]
+        self.__pips__[side] -= pip
+        if pip > 6:
+            self.__outside__[side] -= 1
+        elif new_value == 0 and pip == self.__top__[side]:
+            self.__top__[side] = self._scan_top(side)
+
+    def _drop(self, side: int, cell: int):
+        """Adds one checker of ``side`` to ``cell``, keeping the hash and counters in step."""
+        cells = self.__cells__
+        value = cells[cell]
+        new_value = value + SIGNS[side]
+        base = cell * VALUES_PER_CELL + 15
+        self.__zobrist__ ^= CELL_KEYS[base + value] ^ CELL_KEYS[base + new_value]
+        cells[cell] = new_value
+        if cell < 24:
+            self._update_masks(side, cell, new_value * SIGNS[side])
+        pip = PIPS[side][cell]
+        self.__pips__[side] += pip
+        if pip > 6:
+            self.__outside__[side] += 1
+        elif pip > self.__top__[side]:
+            self.__top__[side] = pip
+
+    def _set_off(self, side: int, count: int):
+        """Sets the borne-off count of ``side``, keeping the hash in step."""
+        self.__zobrist__ ^= OFF_KEYS[side][self.__off__[side]] ^ OFF_KEYS[side][count]
+        self.__off__[side] = count
+
+    def get_masks(self, player: 'Player'):
+        """
+        Returns the player's point bitmasks, bit ``i`` standing for point ``i``.
+
+        Args:
+            player (Player): The player to check.
+
+        Returns:
+            tuple: (owned, blocked, blots) where ``owned`` has the points holding the
+            player's checkers, ``blocked`` the points the opponent has made (two or more
+            checkers) and ``blots`` the points with a single checker of the player.
+        """
+        side = self._side(player)
+        return self.__owned__[side], self.__made__[1 - side], self.__blots__[side]
+
+    def _source_mask(self, side: int, die: int) -> int:
+        """
+        Returns the points from which ``side`` can legally move with ``die``.
+
+        Assumes ``side`` has no checkers on the bar. Normal moves are found by shifting
+        the open points by the die; bear-offs come from the home-board counters.
+
+        Args:
+            side (int): WHITE or BLACK.
+            die (int): The die value (1-6).
+
+        Returns:
+            int: Bitmask of valid source points.
+        """
+        owned = self.__owned__[side]
+        open_points = ~self.__made__[1 - side] & FULL_MASK
+        if side == WHITE:
+            mask = owned & (open_points << die)
+        else:
+            mask = owned & (open_points >> die)
+
+        if self.__outside__[side] == 0:
+            top = self.__top__[side]
+            if die <= top:
+                mask |= owned & (1 << HOME_POINT[side][die])
+            elif top:
+                mask |= 1 << HOME_POINT[side][top]
+        return mask
+
+    def _can_enter(self, side: int, die: int) -> bool:
+        """Checks if a checker of ``side`` on the bar can enter with ``die``."""
+        return not (self.__made__[1 - side] >> DESTINATIONS[side][BARS[side]][die]) & 1
+
+    def _summary(self, side: int) -> tuple:
+        """
+        Returns the incrementally maintained counters of ``side`` for evaluators.
+
+        Returns:
+            tuple: (pips, outside, off, owned, made, blots).
+        """
+        return (self.__pips__[side], self.__outside__[side], self.__off__[side],
+                self.__owned__[side], self.__made__[side], self.__blots__[side])
+
+    def pip_count(self, player: 'Player') -> int:
+        """
+        Returns the player's pip count (total distance left to bear everything off).
+
+        Args:
+            player (Player): The player to check.
+
+        Returns:
+            int: The pip count, maintained incrementally by every move.
+        """
+        return self.__pips__[self._side(player)]
+
+    def checkers_outside_home(self, player: 'Player') -> int:
+        """
+        Returns how many of the player's checkers are outside their home board, bar included.
+
+        Args:
+            player (Player): The player to check.
+
+        Returns:
+            int: The count, maintained incrementally by every move.
+        """
+        return self.__outside__[self._side(player)]
+
+    def position_hash(self) -> int:
+        """
+        Returns the 64-bit Zobrist hash of the position.
+
+        The hash covers every point, both bars, the borne-off counts and the side to
+        move. The checkers part is updated incrementally by every move, the side to
+        move is read from the turn state.
+
+        Returns:
+            int: The position hash.
+        """
+        return self.position_key(self.__turn__.get_side())
+
+    def position_key(self, side: int) -> int:
+        """
+        Returns the position hash with ``side`` as the side to move, whoever the board
+        currently has on turn. Used by search code that plays both sides in place.
+
+        Args:
+            side (int): WHITE or BLACK.
+
+        Returns:
+            int: The 64-bit key.
+        """
+        if side == BLACK:
+            return self.__zobrist__ ^ SIDE_KEY
+        return self.__zobrist__
+
+    def get_cells(self):
+        """
+        Returns the raw position.
+
+        Returns:
+            array: 26 signed counts (points 0-23, white bar, black bar). Positive is white.
+        """
+        return self.__cells__
 
     def display(self):
         """
         Displays the current state of the board.
         """
+        cells = self.__cells__
+        colors = ('w', 'b')
+
         # Top border
         print("+--------------------------------------------------+")
 
@@ -108,11 +472,10 @@ class Board:
         # Checker representation (top)
         checker_line_top = ""
         for i in range(12, 24):
-            point = self.__points__[i]
-            if not point:
+            if not cells[i]:
                 checker_line_top += "  ."
             else:
-                checker_line_top += f" {len(point)}{point[0].get_owner().get_color()[0]}"
+                checker_line_top += f" {abs(cells[i])}{colors[cells[i] < 0]}"
         print(f"|{checker_line_top} |")
 
         # Middle bar
@@ -121,11 +484,10 @@ class Board:
         # Checker representation (bottom)
         checker_line_bottom = ""
         for i in range(11, -1, -1):
-            point = self.__points__[i]
-            if not point:
+            if not cells[i]:
                 checker_line_bottom += "  ."
             else:
-                checker_line_bottom += f" {len(point)}{point[0].get_owner().get_color()[0]}"
+                checker_line_bottom += f" {abs(cells[i])}{colors[cells[i] < 0]}"
         print(f"|{checker_line_bottom} |")
 
 
@@ -140,10 +502,10 @@ class Board:
         print("+--------------------------------------------------+")
 
         # Bar and off-board checkers
-        bar_p1 = len(self.__bar__.get(self.__player1__, []))
-        bar_p2 = len(self.__bar__.get(self.__player2__, []))
-        off_p1 = self.__off_board__.get(self.__player1__, 0)
-        off_p2 = self.__off_board__.get(self.__player2__, 0)
+        bar_p1 = self._cell_count(BARS[self.__side1__], self.__side1__)
+        bar_p2 = self._cell_count(BARS[self.__side2__], self.__side2__)
+        off_p1 = self.__off__[self.__side1__]
+        off_p2 = self.__off__[self.__side2__]
         print(f"Bar: P1({bar_p1}), P2({bar_p2}) | Off: P1({off_p1}), P2({off_p2})")
 
 
@@ -156,28 +518,33 @@ class Board:
 
         Returns:
             list: A list of Checkers at the specified point.
-        
+
         Raises:
             IndexError: If the index is out of bounds.
         """
-        if 0 <= index < 24: return self.__points__[index]
+        if 0 <= index < 24:
+            value = self.__cells__[index]
+            if value > 0: return [self.__checkers__[WHITE]] * value
+            if value < 0: return [self.__checkers__[BLACK]] * -value
+            return []
         raise IndexError("Invalid point index")
 
     def get_points(self):
-        """Returns the entire list of points on the board."""
-        return self.__points__
+        """Returns a list-like view of the 24 points on the board."""
+        return _PointsView(self)
 
     def get_bar(self):
-        """Returns the dictionary representing the bar."""
-        return self.__bar__
+        """Returns a dict-like view of the bar, keyed by player."""
+        return _BarView(self)
 
     def get_off_board_count(self, player: 'Player'):
         """Returns the number of checkers a player has borne off."""
-        return self.__off_board__.get(player, 0)
+        return self.__off__[self._side(player)]
 
     def _set_off_board_count(self, player: 'Player', count: int):
         """Sets the number of checkers a player has borne off (for testing)."""
-        self.__off_board__[player] = count
+        self.__off__[self._side(player)] = count
+        self._recompute()
 
     def get_winner(self):
         """Returns the winner of the game, if any."""
@@ -190,10 +557,7 @@ class Board:
         Returns:
             bool: True if the game is over, False otherwise.
         """
-        for player in [self.__player1__, self.__player2__]:
-            if self.get_off_board_count(player) == 15:
-                return True
-        return False
+        return self.__off__[WHITE] == 15 or self.__off__[BLACK] == 15
 
 
     def is_valid_move(self, from_point, die: int, player: 'Player'):
@@ -207,28 +571,31 @@ class Board:
 
         Returns:
             bool: True if the move is valid, False otherwise.
+
+        Raises:
+            IndexError: If from_point is neither 'bar' nor a valid point index.
         """
-        if die <= 0: return False
+        if not 0 < die <= 6: return False
+        return self._is_valid_move(from_point, die, self._side(player))
+
+    def _is_valid_move(self, from_point, die: int, side: int) -> bool:
+        """Side-indexed implementation of ``is_valid_move``."""
+        cells = self.__cells__
+        sign = SIGNS[side]
 
-        direction = -1 if player.get_color() == 'white' else 1
-        
         if from_point == 'bar':
-            if not self.__bar__.get(player): return False
-            to_point = 24 + die * direction if player.get_color() == 'white' else -1 + die * direction
+            source = BARS[side]
+            if cells[source] * sign <= 0: return False
         else:
-            if self.__bar__.get(player): return False
-            if not self.__points__[from_point] or self.__points__[from_point][0].get_owner() != player:
-                return False
-            to_point = from_point + (die * direction)
-        
-        is_bear_off = (direction == 1 and to_point > 23) or (direction == -1 and to_point < 0)
-        if is_bear_off:
-            return self.is_valid_bear_off_move(from_point, die, player)
-        
-        if not (0 <= to_point < 24): return False
-        
-        destination = self.__points__[to_point]
-        return not (destination and destination[0].get_owner() != player and len(destination) > 1)
+            if not 0 <= from_point < 24: raise IndexError("Invalid point index")
+            if cells[BARS[side]] * sign > 0: return False
+            if cells[from_point] * sign <= 0: return False
+            source = from_point
+
+        destination = DESTINATIONS[side][source][die]
+        if destination == OFF:
+            return self._is_valid_bear_off_move(from_point, die, side)
+        return cells[destination] * sign >= -1
 
     def move_piece(self, from_point, die: int, player: Player):
         """
@@ -242,30 +609,117 @@ class Board:
         Raises:
             ValueError: If the move is invalid.
         """
-        if not self.is_valid_move(from_point, die, player):
+        self.apply_move(from_point, die, player)
+
+    def apply_move(self, from_point, die: int, player: 'Player'):
+        """
+        Moves a checker and returns a record that ``undo_move`` can revert.
+
+        Args:
+            from_point (str or int): The starting point ('bar' or 0-23).
+            die (int): The die value used for the move.
+            player (Player): The player making the move.
+
+        Returns:
+            tuple: An undo record ``(side, source, destination, hit, previous_winner)``.
+
+        Raises:
+            ValueError: If the move is invalid.
+        """
+        side = self._side(player)
+        if not 0 < die <= 6 or not self._is_valid_move(from_point, die, side):
             raise ValueError("Invalid move")
 
-        direction = -1 if player.get_color() == 'white' else 1
-        
-        if from_point == 'bar':
-            checker = self.__bar__[player].pop(0)
-            to_point = 24 + die * direction if player.get_color() == 'white' else -1 + die * direction
+        source = BARS[side] if from_point == 'bar' else from_point
+        return self._make_move(side, source, DESTINATIONS[side][source][die])
+
+    def _make_move(self, side: int, source: int, destination: int):
+        """
+        Moves a checker between cells without validating it.
+
+        Args:
+            side (int): WHITE or BLACK.
+            source (int): The source cell (0-23 or the side's bar).
+            destination (int): The destination point, or OFF to bear off.
+
+        Returns:
+            tuple: The undo record for ``undo_move``.
+        """
+        previous_winner = self.__winner__
+        hit = False
+
+        self._lift(side, source)
+        if destination == OFF:
+            off = self.__off__[side] + 1
+            self._set_off(side, off)
+            if off == 15: self.__winner__ = self.__by_side__[side]
+        else:
+            if self.__cells__[destination] == -SIGNS[side]:
+                # Hit a lone opponent checker and send it to their bar
+                opponent = 1 - side
+                self._lift(opponent, destination)
+                self._drop(opponent, BARS[opponent])
+                hit = True
+            self._drop(side, destination)
+
+        return (side, source, destination, hit, previous_winner)
+
+    def _key_after_move(self, side: int, source: int, destination: int) -> bytes:
+        """
+        Returns the cells after a move as bytes, without making it.
+
+        Move generation only needs the final position of the last move of a play, so
+        the cells are edited and restored directly, leaving the hash and counters alone.
+
+        Args:
+            side (int): WHITE or BLACK.
+            source (int): The source cell (0-23 or the side's bar).
+            destination (int): The destination point, or OFF to bear off.
+
+        Returns:
+            bytes: ``get_cells().tobytes()`` as it would be after the move.
+        """
+        cells = self.__cells__
+        sign = SIGNS[side]
+        cells[source] -= sign
+        if destination == OFF:
+            key = cells.tobytes()
+        else:
+            value = cells[destination]
+            if value == -sign:
+                bar = BARS[1 - side]
+                cells[destination] = sign
+                cells[bar] -= sign
+                key = cells.tobytes()
+                cells[bar] += sign
+            else:
+                cells[destination] = value + sign
+                key = cells.tobytes()
+            cells[destination] = value
+        cells[source] += sign
+        return key
+
+    def undo_move(self, record):
+        """
+        Reverts a move made with ``apply_move``, including hits and the winner flag.
+
+        Moves must be undone in the reverse order they were applied.
+
+        Args:
+            record (tuple): The record returned by ``apply_move``.
+        """
+        side, source, destination, hit, previous_winner = record
+
+        if destination == OFF:
+            self._set_off(side, self.__off__[side] - 1)
         else:
-            checker = self.__points__[from_point].pop()
-            to_point = from_point + (die * direction)
-
-        is_bear_off = (direction == -1 and to_point < 0) or (direction == 1 and to_point > 23)
-        if is_bear_off:
-            self.__off_board__[player] += 1
-            if self.__off_board__[player] == 15: self.__winner__ = player
-            return
-            
-        destination = self.__points__[to_point]
-        if destination and destination[0].get_owner() != player:
-            opponent_checker = destination.pop()
-            self.__bar__[opponent_checker.get_owner()].append(opponent_checker)
-        
-        self.__points__[to_point].append(checker)
+            self._lift(side, destination)
+            if hit:
+                opponent = 1 - side
+                self._lift(opponent, BARS[opponent])
+                self._drop(opponent, destination)
+        self._drop(side, source)
+        self.__winner__ = previous_winner
 
     def can_player_bear_off(self, player: Player):
         """
@@ -277,21 +731,11 @@ class Board:
         Returns:
             bool: True if the player can bear off, False otherwise.
         """
-        if self.__bar__.get(player):
-            return False
+        return self._can_bear_off(self._side(player))
 
-        color = player.get_color()
-        home_board_indices = range(6) if color == 'white' else range(18, 24)
-        
-        checkers_in_home = 0
-        for i in home_board_indices:
-            point = self.__points__[i]
-            if point and point[0].get_owner() == player:
-                checkers_in_home += len(point)
-        
-        total_checkers = self.get_off_board_count(player) + checkers_in_home
-        
-        return total_checkers == 15
+    def _can_bear_off(self, side: int) -> bool:
+        """Side-indexed implementation of ``can_player_bear_off``."""
+        return self.__outside__[side] == 0
 
     def is_valid_bear_off_move(self, from_point, die, player):
         """
@@ -305,24 +749,24 @@ class Board:
         Returns:
             bool: True if the bear-off move is valid, False otherwise.
         """
-        if not self.can_player_bear_off(player):
+        return self._is_valid_bear_off_move(from_point, die, self._side(player))
+
+    def _is_valid_bear_off_move(self, from_point, die, side):
+        """Side-indexed implementation of ``is_valid_bear_off_move``."""
+        if not self._can_bear_off(side):
             return False
 
-        color = player.get_color()
-        required_die = (from_point + 1) if color == 'white' else (24 - from_point)
+        required_die = BEAR_OFF_DIE[side][from_point]
+        if not required_die:
+            return False
 
         if die == required_die:
             return True
-        
+
         if die > required_die:
-            home_board = range(6) if color == 'white' else range(18, 24)
-            higher_points_range = range(from_point + 1, 6) if color == 'white' else range(18, from_point)
+            # Overshooting is only allowed from the highest occupied home point
+            return self.__top__[side] <= required_die
 
-            for p in higher_points_range:
-                if self.__points__[p] and self.__points__[p][0].get_owner() == player:
-                    return False
-            return True
-        
         return False
 
     def get_possible_moves_for_checker(self, from_point, player, dice):
@@ -337,22 +781,15 @@ class Board:
         Returns:
             list: A list of possible destination points (int or 'off').
         """
+        side = self._side(player)
+        source = BARS[side] if from_point == 'bar' else from_point
         moves = []
-        direction = -1 if player.get_color() == 'white' else 1
         for die in set(dice):
-            if self.is_valid_move(from_point, die, player):
-                if from_point == 'bar':
-                    to_point = 24 + die * direction if player.get_color() == 'white' else -1 + die * direction
-                else:
-                    to_point = from_point + (die * direction)
-                
-                is_bear_off = (direction == -1 and to_point < 0) or (direction == 1 and to_point > 23)
-                if is_bear_off: 
-                    moves.append("off")
-                elif 0 <= to_point < 24: 
-                    moves.append(to_point)
+            if 0 < die <= 6 and self._is_valid_move(from_point, die, side):
+                destination = DESTINATIONS[side][source][die]
+                moves.append("off" if destination == OFF else destination)
         return moves
-        
+
     def has_any_valid_moves(self, player, dice):
         """
         Checks if the player has any valid moves with the available dice.
@@ -364,24 +801,25 @@ class Board:
         Returns:
             bool: True if there is at least one valid move, False otherwise.
         """
-        if self.__bar__.get(player):
+        side = self._side(player)
+        dice = [die for die in set(dice) if 0 < die <= 6]
+        if self.__cells__[BARS[side]] * SIGNS[side] > 0:
             for die in dice:
-                if self.is_valid_move('bar', die, player): return True
+                if self._can_enter(side, die): return True
             return False
-        for i in range(24):
-            if self.__points__[i] and self.__points__[i][0].get_owner() == player:
-                for die in dice:
-                    if self.is_valid_move(i, die, player): return True
+        for die in dice:
+            if self._source_mask(side, die): return True
         return False
-        
+
     def find_die_for_bear_off(self, from_point, player, dice):
         """
         Finds the exact die required for a bear-off move and checks if it's available.
         Returns the die value if valid, otherwise None.
         """
-        required_die = (from_point + 1) if player.get_color() == 'white' else (24 - from_point)
-        
-        if required_die in dice:
-            if self.is_valid_bear_off_move(from_point, required_die, player):
+        side = self._side(player)
+        required_die = BEAR_OFF_DIE[side][from_point]
+
+        if required_die and required_die in dice:
+            if self._is_valid_bear_off_move(from_point, required_die, side):
                 return required_die
         return None
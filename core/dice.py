@@ -1,4 +1,163 @@
 import random
+from abc import ABC, abstractmethod
+from array import array
+from typing import Iterable
+from .turnstate import TurnState
+
+
+class DiceSource(ABC):
+    """
+    Where dice values come from.
+
+    ``Dice``, ``Board`` and ``Game`` take a source, so the same code can play with
+    the shared ``random`` module, a seeded stream, pre-drawn buffers or a fixed script.
+    Sources only hold plain data and can be sent to worker processes.
+    """
+
+    @abstractmethod
+    def roll_one(self) -> int:
+        """Returns the next die, 1 to 6."""
+
+    def roll(self) -> tuple:
+        """Returns the next two dice."""
+        return (self.roll_one(), self.roll_one())
+
+    @abstractmethod
+    def spawn(self, key) -> 'DiceSource':
+        """
+        Returns an independent child stream, e.g. one per worker or per game.
+
+        Args:
+            key: Names the child. The same parent and key give the same stream.
+        """
+
+
+class RandomSource(DiceSource):
+    """
+    Dice from a ``random.Random`` stream.
+
+    Without a seed the shared ``random`` module is used, as before sources existed.
+    With one, ``RandomSource(seed)`` rolls the same values as ``Dice(seed=seed)`` always has.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initializes the source.
+
+        Args:
+            seed (int or str, optional): Seed of a private stream. Defaults to the ``random`` module.
+        """
+        self.__seed__ = seed
+        self.__rng__ = random.Random(seed) if seed is not None else None
+
+    def get_seed(self):
+        """Returns the seed, None for the shared stream."""
+        return self.__seed__
+
+    def roll_one(self) -> int:
+        return (self.__rng__ or random).randint(1, 6)
+
+    def spawn(self, key) -> 'RandomSource':
+        """Child seeded with ``f"{seed}:{key}"``, or with fresh random bits when unseeded."""
+        if self.__seed__ is None:
+            return RandomSource(random.getrandbits(64))
+        return RandomSource(f"{self.__seed__}:{key}")
+
+
+class BufferedSource(DiceSource):
+    """
+    Dice drawn thousands at a time into an ``array`` buffer and handed out one by one.
+
+    Refilling takes one ``random.choices`` call per buffer instead of a ``randint``
+    call per die, which matters for rollouts and simulations that roll millions of times.
+    The values differ from ``RandomSource`` with the same seed.
+    """
+
+    FACES = (1, 2, 3, 4, 5, 6)
+
+    def __init__(self, seed=None, size: int = 4096):
+        """
+        Initializes the source.
+
+        Args:
+            seed (int or str, optional): Seed of the stream. Defaults to fresh random bits.
+            size (int, optional): Dice drawn per refill. Defaults to 4096.
+
+        Raises:
+            ValueError: If ``size`` is not positive.
+        """
+        if size < 1:
+            raise ValueError("size must be positive")
+        self.__seed__ = seed if seed is not None else random.getrandbits(64)
+        self.__rng__ = random.Random(self.__seed__)
+        self.__size__ = size
+        self.__buffer__ = array('b')
+        self.__position__ = 0
+
+    def _refill(self):
+        self.__buffer__ = array('b', self.__rng__.choices(self.FACES, k=self.__size__))
+        self.__position__ = 0
+
+    def roll_one(self) -> int:
+        if self.__position__ >= len(self.__buffer__):
+            self._refill()
+        value = self.__buffer__[self.__position__]
+        self.__position__ += 1
+        return value
+
+    def roll(self) -> tuple:
+        if self.__position__ + 2 > len(self.__buffer__):
+            return (self.roll_one(), self.roll_one())
+        position = self.__position__
+        self.__position__ = position + 2
+        return (self.__buffer__[position], self.__buffer__[position + 1])
+
+    def spawn(self, key) -> 'BufferedSource':
+        return BufferedSource(f"{self.__seed__}:{key}", self.__size__)
+
+
+class ScriptedSource(DiceSource):
+    """
+    Replays a fixed sequence of dice, for tests and for reproducing a game.
+    """
+
+    def __init__(self, rolls: Iterable, repeat: bool = False):
+        """
+        Initializes the source.
+
+        Args:
+            rolls (Iterable): Dice values, or rolls given as pairs, e.g. ``[(3, 1), (6, 6)]``.
+            repeat (bool, optional): Start over at the end instead of failing. Defaults to False.
+
+        Raises:
+            ValueError: If the script is empty or holds a value outside 1 to 6.
+        """
+        values = []
+        for roll in rolls:
+            values.extend(roll if isinstance(roll, (tuple, list)) else (roll,))
+        if not values or any(value not in range(1, 7) for value in values):
+            raise ValueError("a script needs dice values from 1 to 6")
+        self.__values__ = tuple(values)
+        self.__repeat__ = repeat
+        self.__position__ = 0
+
+    def roll_one(self) -> int:
+        if self.__position__ >= len(self.__values__):
+            if not self.__repeat__:
+                raise IndexError("the scripted dice have run out")
+            self.__position__ = 0
+        value = self.__values__[self.__position__]
+        self.__position__ += 1
+        return value
+
+    def remaining(self) -> int:
+        """Returns how many scripted dice have not been rolled yet."""
+        return len(self.__values__) - self.__position__
+
+    def spawn(self, key) -> 'ScriptedSource':
+        """Child replaying the whole script from the start."""
+        return ScriptedSource(self.__values__, self.__repeat__)
+
 
 class Dice:
     """
@@ -7,12 +166,40 @@ class Dice:
     Attributes
     ----------
     values : list of int
-        The current values of the dice.
+        The current values of the dice, kept in a ``TurnState``.
     """
 
-    def __init__(self):
-        """Initializes the Dice object with no values."""
-        self.__values__ = []
+    def __init__(self, seed=None, source: DiceSource = None, turn_state: TurnState = None):
+        """
+        Initializes the Dice object with no values.
+
+        Args:
+            seed (int or str, optional): Seed for a private random stream, so the same seed
+                always rolls the same sequence. Defaults to the shared ``random`` module.
+            source (DiceSource, optional): Where the values come from. Overrides ``seed``.
+            turn_state (TurnState, optional): Holds the values, e.g. the game's turn state.
+                Defaults to a new one.
+        """
+        self.__turn__ = turn_state if turn_state is not None else TurnState()
+        self.__source__ = source if source is not None else RandomSource(seed)
+
+    def get_source(self):
+        """
+        Returns where the dice values come from.
+
+        Returns:
+            DiceSource: The source.
+        """
+        return self.__source__
+
+    def get_turn_state(self) -> TurnState:
+        """
+        Returns the turn state holding the values.
+
+        Returns:
+            TurnState: The turn state.
+        """
+        return self.__turn__
 
     def roll(self):
         """
@@ -21,8 +208,8 @@ class Dice:
         Returns:
             list[int]: The new values of the dice.
         """
-        self.__values__ = [random.randint(1, 6), random.randint(1, 6)]
-        return self.__values__
+        self.__turn__.set_dice(self.__source__.roll())
+        return self.__turn__.get_dice()
 
     def roll_one(self):
         """
@@ -31,7 +218,7 @@ class Dice:
         Returns:
             int: The value of the rolled die.
         """
-        return random.randint(1, 6)
+        return self.__source__.roll_one()
 
     def get_values(self):
         """
@@ -40,7 +227,7 @@ class Dice:
         Returns:
             list[int]: The current dice values.
         """
-        return self.__values__
+        return self.__turn__.get_dice()
 
     def set_values(self, values):
         """
@@ -49,7 +236,7 @@ class Dice:
         Args:
             values (list[int]): The values to set the dice to.
         """
-        self.__values__ = values
+        self.__turn__.set_dice(values)
 
     def remove_value(self, value):
         """
@@ -57,11 +244,8 @@ class Dice:
 
         Args:
             value (int): The die value to remove.
-        
+
         Raises:
             ValueError: If the value is not available in the current dice.
         """
-        if value in self.__values__:
-            self.__values__.remove(value)
-        else:
-            raise ValueError(f"Die value {value} not available in {self.__values__}")
+        self.__turn__.use_die(value)
@@ -0,0 +1,52 @@
+import math
+from typing import TYPE_CHECKING
+from .bearoff import get_default_database, RACE_SCALE
+
+if TYPE_CHECKING:
+    from .board import Board
+
+# Home-board points of each side as bitmasks
+HOME_MASKS = (0x3F, 0x3F << 18)
+
+# Evaluations never reach the win/loss values, which are reserved for finished games
+WIN = 1.0
+LOSS = -1.0
+
+
+def heuristic_evaluate(board: 'Board', side: int) -> float:
+    """
+    Scores a position with a hand-tuned heuristic.
+
+    Looks at the race (pip counts), made points in the home board, blots and
+    checkers already borne off. The score is symmetric, so evaluating from the
+    other side gives the negated value. Once both sides can bear off the winning
+    chances are read from the bear-off database instead, when it has been built.
+
+    Args:
+        board (Board): The position to score.
+        side (int): The side to score for (WHITE or BLACK), assumed to be on roll.
+
+    Returns:
+        float: A value strictly between LOSS and WIN, higher is better for ``side``.
+    """
+    pips, outside, off, _, made, blots = board._summary(side)
+    opp_pips, opp_outside, opp_off, _, opp_made, opp_blots = board._summary(1 - side)
+    if off == 15:
+        return WIN
+    if opp_off == 15:
+        return LOSS
+
+    # Both sides can bear off (checkers on the bar count as outside): a pure race
+    if outside == 0 and opp_outside == 0:
+        database = get_default_database()
+        if database is not None:
+            win = database.win_probability(board, side)
+            if win is not None:
+                return RACE_SCALE * (2.0 * win - 1.0)
+
+    score = (opp_pips - pips) / 60.0
+    score += 0.08 * ((made & HOME_MASKS[side]).bit_count() - (opp_made & HOME_MASKS[1 - side]).bit_count())
+    score += 0.03 * (made.bit_count() - opp_made.bit_count())
+    score -= 0.06 * (blots.bit_count() - opp_blots.bit_count())
+    score += 0.02 * (off - opp_off)
+    return 0.95 * math.tanh(score)
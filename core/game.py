@@ -1,6 +1,30 @@
-from .board import Board
+from .board import Board, side_of_color
 from .player import Player
-from .dice import Dice
+from .dice import Dice, DiceSource
+from .turnstate import TurnState
+from .movetables import dice_for_move
+from .movecache import MoveCache, SHARED_MOVE_CACHE
+
+# Kinds of roll, see classify_plays
+NO_PLAY = 'no_play'
+FORCED = 'forced'
+CHOICE = 'choice'
+
+
+def classify_plays(plays: list) -> str:
+    """
+    Classifies a roll by its legal plays.
+
+    Args:
+        plays (list): The legal full-turn plays from ``generate_plays``.
+
+    Returns:
+        str: NO_PLAY when no checker can move, FORCED when a single play is legal,
+        CHOICE otherwise.
+    """
+    if not plays or plays == [()]:
+        return NO_PLAY
+    return FORCED if len(plays) == 1 else CHOICE
 
 
 class Game:
@@ -13,26 +37,42 @@ class Game:
         The game board.
     players : list of Player
         The list of players.
-    current_player_index : int
-        Index of the current player.
+    turn_state : TurnState
+        The side to move, its remaining dice and the turn number. The board and
+        the dice share it, so it is the only record of whose turn it is.
     dice : Dice
         The dice for the game.
+    move_cache : MoveCache
+        Cache of legal moves, shared between games by default.
+    roll_kind : str or None
+        NO_PLAY, FORCED or CHOICE for the last roll, None before the first one.
     """
 
-    def __init__(self, players: list['Player'], random_positions=False):
+    def __init__(self, players: list['Player'], random_positions=False, move_cache: MoveCache = None,
+                 dice: Dice = None, dice_source: DiceSource = None):
         """
         Initializes the Game object.
 
         Args:
             players (list[Player]): The list of players.
             random_positions (bool, optional): Whether to start with random checker positions. Defaults to False.
+            move_cache (MoveCache, optional): Legal-move cache to use. Defaults to the shared cache.
+            dice (Dice, optional): The dice to roll, e.g. ``Dice(seed=...)`` for a
+                reproducible game. Only its source is used. Defaults to unseeded dice.
+            dice_source (DiceSource, optional): Source of new dice when ``dice`` is not given,
+                e.g. ``RandomSource(seed)`` or a ``ScriptedSource`` replaying a game.
         """
         self.__players__ = players
-        self.__board__ = Board(players[0], players[1], random_positions=random_positions)
-        self.__current_player_index__ = 0
-        self.__dice__ = Dice()
+        self.__turn__ = TurnState(side_of_color(players[0].get_color()))
+        if dice is not None:
+            dice_source = dice.get_source()
+        self.__dice__ = Dice(source=dice_source, turn_state=self.__turn__)
+        self.__board__ = Board(players[0], players[1], random_positions=random_positions,
+                               turn_state=self.__turn__)
         self.__initial_rolls__ = [0, 0]
         self.__initial_roll_winner__ = None
+        self.__move_cache__ = move_cache if move_cache is not None else SHARED_MOVE_CACHE
+        self.__roll_kind__ = None
 
     def get_current_player(self):
         """
@@ -41,18 +81,65 @@ class Game:
         Returns:
             Player: The player whose turn it is.
         """
-        return self.__players__[self.__current_player_index__]
+        return self.__board__.get_current_player()
 
     def switch_player(self):
-        """Switches the turn to the other player."""
-        self.__current_player_index__ = 1 - self.__current_player_index__
+        """Switches the turn to the other player, dropping any dice left."""
+        self.__turn__.pass_turn()
 
     def roll_dice(self):
-        """Rolls the dice for the current turn and handles doubles."""
-        self.__dice__.roll()
-        if self.__dice__.get_values()[0] == self.__dice__.get_values()[1]:
+        """
+        Rolls the dice for the current turn, handles doubles and classifies the roll.
+
+        Returns:
+            str: NO_PLAY, FORCED or CHOICE, see ``classify_roll``.
+        """
+        die1, die2 = self.__dice__.roll()
+        if die1 == die2:
             # Doubles, grant four moves
-            self.__dice__.set_values([self.__dice__.get_values()[0]] * 4)
+            self.__turn__.set_dice([die1] * 4)
+        return self.classify_roll()
+
+    def classify_roll(self) -> str:
+        """
+        Classifies the remaining dice of the current player.
+
+        The legal plays come from the move cache, so the moves offered afterwards
+        are served from the same entry.
+
+        Returns:
+            str: NO_PLAY, FORCED or CHOICE.
+        """
+        self.__roll_kind__ = classify_plays(self.get_legal_plays())
+        return self.__roll_kind__
+
+    def get_legal_plays(self) -> list:
+        """
+        Returns the legal full-turn plays of the current player with the remaining dice.
+
+        Returns:
+            list: The plays, as ``generate_plays``. Treat it as read-only.
+        """
+        return self.__move_cache__.get_plays(self.__board__, self.get_current_player(), self.__turn__.get_dice())
+
+    def play_forced_turn(self) -> bool:
+        """
+        Finishes the turn without asking the player when the dice leave no choice.
+
+        A forced play is applied right away, without searching. With no legal play
+        the remaining dice are dropped.
+
+        Returns:
+            bool: True if the turn is over, False if the player has to choose a play.
+        """
+        kind = self.classify_roll()
+        if kind == CHOICE:
+            return False
+        if kind == FORCED:
+            for move in self.get_legal_plays()[0]:
+                self.move(*move)
+        self.__turn__.set_dice(())
+        return True
 
     def determine_first_player(self):
         """Players roll one die each to determine who goes first, handling ties."""
@@ -63,16 +150,16 @@ class Game:
 
             if p1_roll > p2_roll:
                 self.__initial_roll_winner__ = self.__players__[0]
-                self.__current_player_index__ = 0
                 self.__initial_rolls__ = [p1_roll, p2_roll]
             elif p2_roll > p1_roll:
                 self.__initial_roll_winner__ = self.__players__[1]
-                self.__current_player_index__ = 1
                 self.__initial_rolls__ = [p1_roll, p2_roll]
             # If rolls are equal, the loop continues
         
         # The first turn's dice are the initial winning rolls
-        self.__dice__.set_values(self.__initial_rolls__)
+        self.__turn__.set_side(side_of_color(self.__initial_roll_winner__.get_color()))
+        self.__turn__.set_dice(self.__initial_rolls__)
+        self.classify_roll()
             
     def _calculate_and_validate_die_for_move(self, from_point: str | int, to_point: str | int, player: 'Player') -> int | None:
         """
@@ -85,36 +172,44 @@ class Game:
 
         Returns:
             int or None: The die value if the move is valid with the current dice, otherwise None.
+            Bearing off prefers the exact die and falls back to the smallest larger die
+            the rules allow.
         """
-        if to_point == 'off':
-            return self.__board__.find_die_for_bear_off(from_point, player, self.__dice__.get_values())
-
-        if from_point == 'bar':
-            die = (24 - to_point) if player.get_color() == 'white' else (to_point + 1)
-        else:
-            die = abs(to_point - from_point)
+        values = self.__turn__.get_dice()
+        for die in dice_for_move(from_point, to_point, side_of_color(player.get_color())):
+            if die in values:
+                if to_point != 'off' or self.__board__.is_valid_bear_off_move(from_point, die, player):
+                    return die
+        return None
 
-        return die if die in self.__dice__.get_values() else None
-
-    def move(self, from_point: str | int, to_point: str | int):
+    def move(self, from_point: str | int, to_point: str | int, die: int | None = None):
         """
         Executes a move after validating it.
 
         Args:
             from_point (str or int): The starting point.
             to_point (str or int): The ending point.
-        
+            die (int, optional): The die to use. Inferred from the points when omitted.
+
+        Returns:
+            int: The die used.
+
         Raises:
             ValueError: If the move is invalid.
         """
         player = self.get_current_player()
-        die = self._calculate_and_validate_die_for_move(from_point, to_point, player)
+        if die is None:
+            die = self._calculate_and_validate_die_for_move(from_point, to_point, player)
+        elif die not in self.__turn__.get_dice() or \
+                die not in dice_for_move(from_point, to_point, side_of_color(player.get_color())):
+            die = None
 
         if die is None:
             raise ValueError("Invalid move or no available die for this move.")
 
         self.__board__.move_piece(from_point, die, player)
-        self.__dice__.remove_value(die)
+        self.__turn__.use_die(die)
+        return die
 
     def has_possible_moves(self, player: 'Player') -> bool:
         """
@@ -126,31 +221,93 @@ class Game:
         Returns:
             bool: True if there are possible moves, False otherwise.
         """
-        return self.__board__.has_any_valid_moves(player, self.__dice__.get_values())
+        return bool(self.__move_cache__.get_moves(self.__board__, player, self.__turn__.get_dice()))
 
-    def play_ai_turn(self):
+    def get_legal_moves(self) -> tuple:
+        """
+        Returns the moves the current player may make next with the remaining dice.
+
+        Only moves that start a legal full-turn play are included.
+
+        Returns:
+            tuple: (from_point, to_point, die) moves. Treat it as read-only.
+        """
+        return self.__move_cache__.get_moves(self.__board__, self.get_current_player(), self.__turn__.get_dice())
+
+    def get_possible_moves(self, from_point: str | int) -> list:
+        """
+        Returns the destinations the current player may reach from a point this turn.
+
+        Only moves that start a legal full-turn play are included, so a move that
+        would leave a playable die unused is not offered.
+
+        Args:
+            from_point (str or int): The starting point ('bar' or 0-23).
+
+        Returns:
+            list: Destination points (int or 'off').
+        """
+        return list(dict.fromkeys(to_point for origin, to_point, _ in self.get_legal_moves() if origin == from_point))
+
+    def play_ai_turn(self, time_budget_ms: float = None):
         """
         Executes the AI's turn by choosing and performing its moves.
+        Forced and impossible rolls are played without asking the AI.
         Note: This method does NOT roll dice or switch the turn. The UI is responsible
         for managing the turn flow (roll -> play -> switch).
         A local import is used to avoid circular dependencies.
+
+        Args:
+            time_budget_ms (float, optional): Caps the AI's thinking time, for AIs that search.
         """
         from core.ai import AIPlayer
         player = self.get_current_player()
 
-        if isinstance(player, AIPlayer):
+        if isinstance(player, AIPlayer) and not self.play_forced_turn():
             # The AI determines all its moves for the turn at once
-            moves = player.choose_moves(self.__board__, self.__dice__.get_values())
-            
-            for from_point, to_point in moves:
-                try:
-                    # Each move is executed sequentially
-                    self.move(from_point, to_point)
-                except (ValueError, IndexError) as e:
-                    # This may happen if the AI's logic produces a sequence of moves
-                    # that becomes invalid after an earlier move is made.
-                    print(f"AI tried an invalid move and has forfeited the rest of its turn: {from_point}->{to_point}. Error: {e}")
-                    break # Stop processing further moves
+            moves = player.choose_moves(self.__board__, self.__turn__.get_dice(), time_budget_ms=time_budget_ms)
+            self.apply_ai_moves(moves)
+
+    def start_ai_turn(self, executor, time_budget_ms: float = None):
+        """
+        Starts choosing the AI's moves in the background.
+
+        The AI searches on a copy of the board and dice, so the game can keep being
+        drawn meanwhile. Apply the result with ``apply_ai_moves`` once it is ready.
+
+        Args:
+            executor (concurrent.futures.Executor): Runs the search, normally a thread pool.
+            time_budget_ms (float, optional): Caps the AI's thinking time, for AIs that search.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the chosen moves.
+
+        Raises:
+            ValueError: If the current player is not an AI.
+        """
+        from core.ai import AIPlayer
+        player = self.get_current_player()
+        if not isinstance(player, AIPlayer):
+            raise ValueError("The current player is not an AI")
+        return executor.submit(player.choose_moves, self.__board__.copy(),
+                               list(self.__turn__.get_dice()), time_budget_ms)
+
+    def apply_ai_moves(self, moves: list):
+        """
+        Performs the moves chosen by the AI.
+
+        Args:
+            moves (list): (from_point, to_point) or (from_point, to_point, die) moves.
+        """
+        for move in moves:
+            try:
+                # Each move is executed sequentially. Moves may carry the die as a third element.
+                self.move(*move)
+            except (ValueError, IndexError) as e:
+                # This may happen if the AI's logic produces a sequence of moves
+                # that becomes invalid after an earlier move is made.
+                print(f"AI tried an invalid move and has forfeited the rest of its turn: {move[0]}->{move[1]}. Error: {e}")
+                break # Stop processing further moves
 
     def is_game_over(self):
         """
@@ -181,6 +338,18 @@ class Game:
     @property
     def dice(self):
         return self.__dice__
+
+    @property
+    def turn_state(self):
+        return self.__turn__
+
+    @property
+    def move_cache(self):
+        return self.__move_cache__
+
+    @property
+    def roll_kind(self):
+        return self.__roll_kind__
         
     @property
     def initial_roll_winner(self):
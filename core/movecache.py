@@ -0,0 +1,122 @@
+from __future__ import annotations
+from collections import OrderedDict
+from threading import Lock
+from typing import List, TYPE_CHECKING
+from .movegen import generate_plays
+
+if TYPE_CHECKING:
+    from .board import Board
+    from .player import Player
+
+
+class MoveCache:
+    """
+    LRU-bounded cache of legal plays.
+
+    Entries are keyed by (position hash, sorted remaining dice, side to move), so a
+    cached entry stops matching as soon as the position or the dice change and no
+    explicit invalidation is needed. Entries only hold points and dice, never Player
+    or Board objects, so one cache can be shared between games.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initializes the cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of positions kept. Defaults to 4096.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.__maxsize__ = maxsize
+        self.__entries__ = OrderedDict()
+        self.__lock__ = Lock()
+        self.__hits__ = 0
+        self.__misses__ = 0
+
+    def _entry(self, board: 'Board', player: 'Player', dice: List[int]):
+        """Returns the (plays, moves) entry for a position, generating it on a miss."""
+        side = board._side(player)
+        key = (board.position_hash(), tuple(sorted(dice)), side)
+        with self.__lock__:
+            entry = self.__entries__.get(key)
+            if entry is not None:
+                self.__entries__.move_to_end(key)
+                self.__hits__ += 1
+                return entry
+            self.__misses__ += 1
+
+        plays = generate_plays(board, player, dice)
+        moves = tuple(dict.fromkeys(play[0] for play in plays if play))
+        entry = (plays, moves)
+
+        with self.__lock__:
+            self.__entries__[key] = entry
+            self.__entries__.move_to_end(key)
+            if len(self.__entries__) > self.__maxsize__:
+                self.__entries__.popitem(last=False)
+        return entry
+
+    def get_plays(self, board: 'Board', player: 'Player', dice: List[int]) -> list:
+        """
+        Returns the legal full-turn plays, as produced by ``generate_plays``.
+
+        Args:
+            board (Board): The current board.
+            player (Player): The player to move.
+            dice (List[int]): The remaining dice.
+
+        Returns:
+            list: The plays. Treat it as read-only, it is shared with other callers.
+        """
+        return self._entry(board, player, dice)[0]
+
+    def get_moves(self, board: 'Board', player: 'Player', dice: List[int]) -> tuple:
+        """
+        Returns the legal sub-moves, i.e. the distinct first moves of the legal plays.
+
+        Args:
+            board (Board): The current board.
+            player (Player): The player to move.
+            dice (List[int]): The remaining dice.
+
+        Returns:
+            tuple: (from_point, to_point, die) moves.
+        """
+        return self._entry(board, player, dice)[1]
+
+    def clear(self):
+        """Empties the cache and resets the counters."""
+        with self.__lock__:
+            self.__entries__.clear()
+            self.__hits__ = 0
+            self.__misses__ = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: size, maxsize, hits and misses.
+        """
+        return {
+            'size': len(self.__entries__),
+            'maxsize': self.__maxsize__,
+            'hits': self.__hits__,
+            'misses': self.__misses__,
+        }
+
+    def __len__(self):
+        return len(self.__entries__)
+
+    @property
+    def hits(self):
+        return self.__hits__
+
+    @property
+    def misses(self):
+        return self.__misses__
+
+
+# Cache shared by every Game that does not bring its own
+SHARED_MOVE_CACHE = MoveCache()
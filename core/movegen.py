@@ -0,0 +1,236 @@
+from __future__ import annotations
+from typing import List, Tuple, TYPE_CHECKING
+from .movetables import SIGNS, BARS, OFF, PIPS, DESTINATIONS
+
+if TYPE_CHECKING:
+    from .board import Board
+    from .player import Player
+
+# The 21 distinct rolls with their probabilities: 1/36 for doubles, 2/36 otherwise
+ROLLS = tuple(
+    ((d1, d1, d1, d1) if d1 == d2 else (d1, d2), (1 if d1 == d2 else 2) / 36)
+    for d1 in range(1, 7)
+    for d2 in range(d1, 7)
+)
+
+# ROLL_INDEX[die1][die2] is the index in ROLLS of a roll, the dice in either order
+ROLL_INDEX = [[0] * 7 for _ in range(7)]
+for _index, (_dice, _) in enumerate(ROLLS):
+    ROLL_INDEX[_dice[0]][_dice[1]] = ROLL_INDEX[_dice[1]][_dice[0]] = _index
+
+
+def _sources(board: 'Board', side: int, die: int) -> list:
+    """Lists the from_points ``side`` can legally move with ``die``, the bar taking priority."""
+    if board.get_cells()[BARS[side]] * SIGNS[side] > 0:
+        return ['bar'] if board._can_enter(side, die) else []
+    mask = board._source_mask(side, die)
+    points = []
+    while mask:
+        low = mask & -mask
+        points.append(low.bit_length() - 1)
+        mask ^= low
+    return points
+
+
+def _expand(board: 'Board', side: int, order: tuple, depth: int, max_pips: int, path: list, found: dict):
+    """
+    Depth-first expansion of one dice order, applying and undoing moves in place.
+
+    Args:
+        board (Board): The board to search on. Left unchanged on return.
+        side (int): WHITE or BLACK.
+        order (tuple): The dice in the order they are played.
+        depth (int): Index of the die to play next.
+        max_pips (int): On doubles, the highest source (in pips) the next move may use.
+            Doubles are expanded with sources in travel order only, since any other
+            order of the same moves reaches the same position.
+        path (list): Moves made so far as (from_point, to_point, die) triples.
+        found (dict): Search state with the best dice usage and the plays by final position.
+    """
+    moved = False
+    if depth < len(order):
+        die = order[depth]
+        doubles = found['doubles']
+        last = depth + 1 == len(order)
+        for from_point in _sources(board, side, die):
+            source = BARS[side] if from_point == 'bar' else from_point
+            pips = PIPS[side][source]
+            if doubles and pips > max_pips:
+                continue
+
+            destination = DESTINATIONS[side][source][die]
+            to_point = 'off' if destination == OFF else destination
+
+            path.append((from_point, to_point, die))
+            if last:
+                # The play ends here, only its final position is needed
+                _record(board._key_after_move(side, source, destination), path, found)
+            else:
+                record = board._make_move(side, source, destination)
+                _expand(board, side, order, depth + 1, pips, path, found)
+                board.undo_move(record)
+            path.pop()
+            moved = True
+
+    if not moved:
+        _record(board.get_cells().tobytes(), path, found)
+
+
+def _record(key: bytes, path: list, found: dict):
+    """Records a finished play by its final cells, keeping only the plays that use the most dice."""
+    used = len(path)
+    if used > found['used']:
+        found['used'] = used
+        found['plays'] = {}
+    if used == found['used'] and key not in found['plays']:
+        found['plays'][key] = tuple(path)
+
+
+def _collect(found: dict, dice: tuple) -> list:
+    """Returns the plays found for a roll, requiring the larger die when only one die can be played."""
+    plays = list(found['plays'].values())
+    if found['used'] == 1 and not found['doubles'] and len(dice) == 2:
+        high = max(dice)
+        larger = [play for play in plays if play[0][2] == high]
+        if larger:
+            plays = larger
+    return plays or [()]
+
+
+def generate_plays(board: 'Board', player: 'Player', dice: List[int]) -> List[Tuple[tuple, ...]]:
+    """
+    Generates every distinct legal full-turn play for a roll.
+
+    Only plays that use the maximum possible number of dice are kept, and when
+    just one die of a non-double can be played the larger one is required if it
+    is playable. Plays that reach the same final position are collapsed into one.
+    The board is searched in place with make/unmake and is unchanged on return.
+
+    Args:
+        board (Board): The current board.
+        player (Player): The player to move.
+        dice (List[int]): The remaining dice (two values, or up to four on doubles).
+
+    Returns:
+        List[tuple]: The plays, each a tuple of (from_point, to_point, die) moves where
+        from_point is 'bar' or 0-23 and to_point is 0-23 or 'off'. When no move is
+        possible the list holds a single empty play.
+    """
+    return generate_side_plays(board, board._side(player), dice)
+
+
+def generate_side_plays(board: 'Board', side: int, dice: List[int]) -> List[Tuple[tuple, ...]]:
+    """
+    Side-indexed version of ``generate_plays`` for search code that works with
+    WHITE/BLACK instead of Player objects.
+
+    Args:
+        board (Board): The current board.
+        side (int): WHITE or BLACK.
+        dice (List[int]): The remaining dice.
+
+    Returns:
+        List[tuple]: The plays, as returned by ``generate_plays``.
+    """
+    dice = [die for die in dice if die > 0]
+    if not dice:
+        return [()]
+    found = {'used': 0, 'plays': {}, 'doubles': len(set(dice)) == 1}
+
+    if found['doubles']:
+        orders = [tuple(dice)]
+    else:
+        high, low = max(dice), min(dice)
+        orders = [(high, low), (low, high)] if len(dice) == 2 else [tuple(dice)]
+
+    for order in orders:
+        _expand(board, side, order, 0, 25, [], found)
+    return _collect(found, dice)
+
+
+def generate_roll_plays(board: 'Board', side: int) -> tuple:
+    """
+    Generates the legal plays of all 21 rolls in one pass, for chance nodes.
+
+    The moves of each first die are generated once and every roll starting with
+    that die continues from the same positions, instead of each roll expanding
+    its first move on its own. The plays are the same, in the same order, as
+    ``generate_side_plays`` gives for each roll.
+
+    Args:
+        board (Board): The current board, unchanged on return.
+        side (int): WHITE or BLACK, the side about to roll.
+
+    Returns:
+        tuple: One list of plays per entry of ROLLS, in the same order.
+    """
+    founds = [{'used': 0, 'plays': {}, 'doubles': len(dice) == 4} for dice, _ in ROLLS]
+    bar, destinations = BARS[side], DESTINATIONS[side]
+    path = []
+    # Higher first dice go first so each roll finds its plays in generate_side_plays' order
+    for first in range(6, 0, -1):
+        doubles = founds[ROLL_INDEX[first][first]]
+        others = [(founds[ROLL_INDEX[first][second]], second) for second in range(1, 7) if second != first]
+        sources = _sources(board, side, first)
+        if not sources:
+            key = board.get_cells().tobytes()
+            _record(key, path, doubles)
+            for found, _ in others:
+                _record(key, path, found)
+            continue
+        for from_point in sources:
+            source = bar if from_point == 'bar' else from_point
+            destination = destinations[source][first]
+            record = board._make_move(side, source, destination)
+            path.append((from_point, 'off' if destination == OFF else destination, first))
+            _expand(board, side, (first,) * 4, 1, PIPS[side][source], path, doubles)
+            # The second die of the other rolls ends the play
+            for found, second in others:
+                seconds = _sources(board, side, second)
+                if not seconds:
+                    _record(board.get_cells().tobytes(), path, found)
+                for second_point in seconds:
+                    second_source = bar if second_point == 'bar' else second_point
+                    second_destination = destinations[second_source][second]
+                    path.append((second_point, 'off' if second_destination == OFF else second_destination, second))
+                    _record(board._key_after_move(side, second_source, second_destination), path, found)
+                    path.pop()
+            path.pop()
+            board.undo_move(record)
+    return tuple(_collect(found, dice) for found, (dice, _) in zip(founds, ROLLS))
+
+
+def apply_play(board: 'Board', side: int, play: tuple) -> list:
+    """
+    Applies a generated play without validating it again.
+
+    Args:
+        board (Board): The board to play on.
+        side (int): WHITE or BLACK.
+        play (tuple): A play from ``generate_plays`` for this position.
+
+    Returns:
+        list: Undo records to pass to ``undo_play``.
+    """
+    records = []
+    for from_point, to_point, _ in play:
+        source = BARS[side] if from_point == 'bar' else from_point
+        records.append(board._make_move(side, source, OFF if to_point == 'off' else to_point))
+    return records
+
+
+def undo_play(board: 'Board', records: list):
+    """
+    Reverts a play applied with ``apply_play``.
+
+    Args:
+        board (Board): The board the play was applied to.
+        records (list): The records returned by ``apply_play``.
+    """
+    for record in reversed(records):
+        board.undo_move(record)
+
+
+def play_to_moves(play: tuple) -> List[tuple]:
+    """Converts a play into the (from_point, to_point) moves used by AIPlayer and Game.move."""
+    return [(from_point, to_point) for from_point, to_point, _ in play]
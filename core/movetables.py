@@ -0,0 +1,100 @@
+"""
+Move tables built once at import.
+
+Cells 0-23 are the points, 24 and 25 are the white and black bars. White
+moves from 23 down to 0 and bears off below 0; black moves from 0 up to 23
+and bears off above 23.
+"""
+
+WHITE = 0
+BLACK = 1
+WHITE_BAR = 24
+BLACK_BAR = 25
+NUM_CELLS = 26
+SIGNS = (1, -1)
+BARS = (WHITE_BAR, BLACK_BAR)
+# Destination of a checker borne off
+OFF = -1
+# Destination of a move that does not exist (e.g. from the opponent's bar)
+NO_MOVE = -2
+
+
+def _pips(side: int, cell: int) -> int:
+    if cell == BARS[side]:
+        return 25
+    if cell == BARS[1 - side]:
+        return 0
+    return cell + 1 if side == WHITE else 24 - cell
+
+
+def _destination(side: int, cell: int, die: int) -> int:
+    if die == 0 or cell == BARS[1 - side]:
+        return NO_MOVE
+    pips = _pips(side, cell) - die
+    if pips <= 0:
+        return NO_MOVE if cell == BARS[side] else OFF
+    return pips - 1 if side == WHITE else 24 - pips
+
+
+# PIPS[side][cell] is the distance a checker of ``side`` on ``cell`` still has to travel
+PIPS = tuple(tuple(_pips(side, cell) for cell in range(NUM_CELLS)) for side in (WHITE, BLACK))
+
+# DESTINATIONS[side][cell][die] is the destination point, OFF, or NO_MOVE
+DESTINATIONS = tuple(
+    tuple(tuple(_destination(side, cell, die) for die in range(7)) for cell in range(NUM_CELLS))
+    for side in (WHITE, BLACK)
+)
+
+# BEAR_OFF_DIE[side][point] is the exact die that bears a checker off the point, 0 outside home
+BEAR_OFF_DIE = tuple(
+    tuple(PIPS[side][point] if PIPS[side][point] <= 6 else 0 for point in range(24))
+    for side in (WHITE, BLACK)
+)
+
+# HOME_POINT[side][pip] is the home-board point that is ``pip`` pips from bearing off (1-6)
+HOME_POINT = (
+    (None,) + tuple(pip - 1 for pip in range(1, 7)),
+    (None,) + tuple(24 - pip for pip in range(1, 7)),
+)
+
+# Bitmask with one bit per point, bit ``i`` standing for point ``i``
+FULL_MASK = (1 << 24) - 1
+
+# DICE_FOR[side][cell] maps a destination (point or 'off') to the dice that reach it
+DICE_FOR = tuple(
+    tuple(
+        {
+            ('off' if DESTINATIONS[side][cell][die] == OFF else DESTINATIONS[side][cell][die]):
+                tuple(d for d in range(1, 7) if DESTINATIONS[side][cell][d] == DESTINATIONS[side][cell][die])
+            for die in range(1, 7)
+            if DESTINATIONS[side][cell][die] != NO_MOVE
+        }
+        for cell in range(NUM_CELLS)
+    )
+    for side in (WHITE, BLACK)
+)
+
+
+def source_cell(from_point, side: int) -> int:
+    """Converts a from_point ('bar' or 0-23) into a cell index."""
+    return BARS[side] if from_point == 'bar' else from_point
+
+
+def dice_for_move(from_point, to_point, side: int) -> tuple:
+    """
+    Returns the dice that move a checker from ``from_point`` to ``to_point``.
+
+    Args:
+        from_point (str or int): The starting point ('bar' or 0-23).
+        to_point (str or int): The destination point (0-23 or 'off').
+        side (int): WHITE or BLACK.
+
+    Returns:
+        tuple: The matching dice in increasing order. Bearing off can be done with
+        the exact die or any larger one; other moves need exactly one die value.
+        Empty if no single die makes the move.
+    """
+    cell = source_cell(from_point, side)
+    if not isinstance(cell, int) or not 0 <= cell < NUM_CELLS:
+        return ()
+    return DICE_FOR[side][cell].get(to_point, ())
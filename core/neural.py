@@ -0,0 +1,227 @@
+"""
+Neural network evaluator in the style of TD-Gammon.
+
+A one-hidden-layer perceptron written with NumPy. Positions are encoded from the
+view of the side on roll: for each side, each of the 24 points in travel order
+gets four units (one, two, three checkers, and half the checkers beyond three),
+followed by the bar and off counts. The three sigmoid outputs are the chances of
+winning, of winning a gammon and of losing a gammon.
+
+Only this module and ``core.training`` import NumPy (listed in requirements.txt).
+The game, search and simulator modules do not import them, and the simulator loads
+this module only when a ``neural`` player is asked for.
+"""
+from typing import List, Optional
+import numpy as np
+from .evaluation import WIN
+from .movegen import apply_play, undo_play
+from .movetables import SIGNS, BARS, PIPS
+
+INPUTS_PER_POINT = 4
+INPUTS = 2 * (24 * INPUTS_PER_POINT + 2)
+OUTPUTS = 3
+# Output columns
+OUT_WIN, OUT_GAMMON, OUT_LOSE_GAMMON = range(OUTPUTS)
+DEFAULT_HIDDEN = 40
+
+# Keeps values strictly inside the evaluator range, below a finished game
+VALUE_SCALE = 0.99
+
+# POINT_ORDER[side] lists the points by distance from bearing off, nearest first
+POINT_ORDER = tuple(
+    np.array(sorted(range(24), key=lambda point: PIPS[side][point]), dtype=np.intp)
+    for side in (0, 1)
+)
+
+
+def sigmoid(values: np.ndarray) -> np.ndarray:
+    """Logistic function."""
+    return 1.0 / (1.0 + np.exp(-values))
+
+
+def _encode_side(cells: np.ndarray, off: np.ndarray, side: int) -> np.ndarray:
+    """Encodes the checkers of one side for a batch of positions."""
+    counts = np.maximum(cells[:, POINT_ORDER[side]] * SIGNS[side], 0)
+    units = np.empty((len(cells), 24, INPUTS_PER_POINT))
+    units[:, :, 0] = counts >= 1
+    units[:, :, 1] = counts >= 2
+    units[:, :, 2] = counts >= 3
+    units[:, :, 3] = np.maximum(counts - 3, 0) / 2.0
+    bar = np.abs(cells[:, BARS[side]]) / 2.0
+    return np.concatenate([units.reshape(len(cells), -1), bar[:, None], off[:, None] / 15.0], axis=1)
+
+
+def encode_batch(cells, off, sides) -> np.ndarray:
+    """
+    Encodes positions as network inputs.
+
+    Args:
+        cells (array-like): N x 26 signed cell counts, as ``Board.get_cells()``.
+        off (array-like): N x 2 checkers borne off by white and black.
+        sides (array-like): The side on roll in each position.
+
+    Returns:
+        np.ndarray: N x INPUTS inputs, the side on roll first.
+    """
+    cells = np.asarray(cells, dtype=np.int16).reshape(-1, 26)
+    off = np.asarray(off, dtype=np.float64).reshape(-1, 2)
+    sides = np.asarray(sides, dtype=np.intp).reshape(-1)
+    inputs = np.empty((len(cells), INPUTS))
+    half = INPUTS // 2
+    for side in (0, 1):
+        rows = sides == side
+        if rows.any():
+            inputs[rows, :half] = _encode_side(cells[rows], off[rows, side], side)
+            inputs[rows, half:] = _encode_side(cells[rows], off[rows, 1 - side], 1 - side)
+    return inputs
+
+
+def encode(board, side: int) -> np.ndarray:
+    """Encodes one position with ``side`` on roll."""
+    return encode_batch([board.get_cells().tolist()], [board.get_off_counts()], [side])[0]
+
+
+class NeuralEvaluator:
+    """
+    Multi-layer perceptron evaluator.
+
+    Instances are callable as ``evaluator(board, side)`` like ``heuristic_evaluate``,
+    so they plug into the search and the rollouts. ``evaluate_plays`` scores all the
+    candidate plays of a roll with one matrix product, and callers use it when present.
+    """
+
+    def __init__(self, hidden: int = DEFAULT_HIDDEN, seed: Optional[int] = 0, weights: dict = None):
+        """
+        Initializes the network with small random weights, or with given weights.
+
+        Args:
+            hidden (int, optional): Hidden units. Defaults to 40.
+            seed (int, optional): Seed of the random initial weights. Defaults to 0.
+            weights (dict, optional): Arrays named as in ``get_weights``. Overrides ``hidden`` and ``seed``.
+
+        Raises:
+            ValueError: If the weights do not have the expected shapes.
+        """
+        if weights is None:
+            rng = np.random.default_rng(seed)
+            weights = {
+                'hidden_weights': rng.normal(0.0, 0.1, (INPUTS, hidden)),
+                'hidden_bias': np.zeros(hidden),
+                'output_weights': rng.normal(0.0, 0.1, (hidden, OUTPUTS)),
+                'output_bias': np.zeros(OUTPUTS),
+            }
+        self.set_weights(weights)
+
+    @classmethod
+    def load(cls, path: str) -> 'NeuralEvaluator':
+        """
+        Loads weights saved with ``save``.
+
+        Args:
+            path (str): An ``.npz`` file.
+
+        Returns:
+            NeuralEvaluator: The evaluator.
+        """
+        with np.load(path) as data:
+            return cls(weights={name: data[name] for name in data.files})
+
+    def save(self, path: str):
+        """Saves the weights to an ``.npz`` file."""
+        np.savez(path, **self.get_weights())
+
+    def get_weights(self) -> dict:
+        """Returns the weight arrays by name. They are the live arrays, not copies."""
+        return {
+            'hidden_weights': self.__hidden_weights__,
+            'hidden_bias': self.__hidden_bias__,
+            'output_weights': self.__output_weights__,
+            'output_bias': self.__output_bias__,
+        }
+
+    def set_weights(self, weights: dict):
+        """
+        Replaces the weights.
+
+        Args:
+            weights (dict): 'hidden_weights' (INPUTS x H), 'hidden_bias' (H),
+                'output_weights' (H x OUTPUTS) and 'output_bias' (OUTPUTS).
+
+        Raises:
+            ValueError: If the shapes do not fit together.
+        """
+        hidden_weights = np.asarray(weights['hidden_weights'], dtype=np.float64)
+        hidden = hidden_weights.shape[1] if hidden_weights.ndim == 2 else -1
+        shapes = {
+            'hidden_weights': (INPUTS, hidden),
+            'hidden_bias': (hidden,),
+            'output_weights': (hidden, OUTPUTS),
+            'output_bias': (OUTPUTS,),
+        }
+        arrays = {}
+        for name, shape in shapes.items():
+            arrays[name] = np.asarray(weights[name], dtype=np.float64)
+            if arrays[name].shape != shape:
+                raise ValueError(f"{name} has shape {arrays[name].shape}, expected {shape}")
+        self.__hidden_weights__ = arrays['hidden_weights']
+        self.__hidden_bias__ = arrays['hidden_bias']
+        self.__output_weights__ = arrays['output_weights']
+        self.__output_bias__ = arrays['output_bias']
+
+    def get_hidden(self) -> int:
+        """Returns the number of hidden units."""
+        return self.__hidden_bias__.shape[0]
+
+    def forward(self, inputs: np.ndarray):
+        """
+        Runs the network.
+
+        Args:
+            inputs (np.ndarray): N x INPUTS encoded positions.
+
+        Returns:
+            tuple: The hidden activations (N x H) and the outputs (N x OUTPUTS).
+        """
+        hidden = sigmoid(inputs @ self.__hidden_weights__ + self.__hidden_bias__)
+        return hidden, sigmoid(hidden @ self.__output_weights__ + self.__output_bias__)
+
+    def evaluate_batch(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of encoded positions in one pass.
+
+        Args:
+            positions (np.ndarray): N x INPUTS inputs from ``encode_batch``.
+
+        Returns:
+            np.ndarray: N x OUTPUTS probabilities (win, win gammon, lose gammon) for the side on roll.
+        """
+        return self.forward(np.atleast_2d(positions))[1]
+
+    def __call__(self, board, side: int) -> float:
+        """Returns the value of a position for ``side`` on roll, strictly between -1 and 1."""
+        win = self.evaluate_batch(encode(board, side))[0, OUT_WIN]
+        return VALUE_SCALE * (2.0 * win - 1.0)
+
+    def evaluate_plays(self, board, side: int, plays: List[tuple]) -> List[float]:
+        """
+        Scores every play of a roll with a single batched evaluation.
+
+        Args:
+            board (Board): The position before the plays, left unchanged.
+            side (int): The side making the plays.
+            plays (List[tuple]): The candidate plays.
+
+        Returns:
+            List[float]: The value of each play for ``side``, as ``-evaluator(board, 1 - side)``
+            after it, or WIN for plays that end the game.
+        """
+        cells, off, finished = [], [], []
+        for play in plays:
+            records = apply_play(board, side, play)
+            finished.append(board.is_game_over())
+            cells.append(board.get_cells().tolist())
+            off.append(board.get_off_counts())
+            undo_play(board, records)
+        wins = self.evaluate_batch(encode_batch(cells, off, [1 - side] * len(plays)))[:, OUT_WIN]
+        values = -VALUE_SCALE * (2.0 * wins - 1.0)
+        return [WIN if done else float(value) for done, value in zip(finished, values)]
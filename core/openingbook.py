@@ -0,0 +1,296 @@
+"""
+Opening book.
+
+Holds the best play for known early positions, keyed by position hash (with the
+side to move) and the roll, so the AI can skip its search there. Every game starts
+from the same position with a non-double roll, so the first turn, and with
+``--replies`` the second one, can be looked up.
+
+A play is only stored when its rollout beats the runner-up by ``--separation``
+standard errors of the difference. Positions where the candidates are too close
+to call are left out and the AI searches them as usual.
+
+The book is a JSON file regenerated from rollouts with:
+
+    python -m core.openingbook [--trials 1296] [--candidates 4] [--separation 2] [--replies] [--output PATH]
+"""
+import argparse
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional
+from .board import Board
+from .player import Player
+from .evaluation import heuristic_evaluate
+from .movegen import generate_side_plays, apply_play
+from .rollout import rollout
+from .movetables import WHITE, BLACK
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'opening_book.json')
+
+# The 15 rolls a game can start with: the first roll of each player, never a double
+OPENING_ROLLS = tuple((die1, die2) for die1 in range(1, 7) for die2 in range(die1 + 1, 7))
+
+DEFAULT_TRIALS = 1296
+# Standard errors of the difference by which the best play must beat the runner-up
+DEFAULT_SEPARATION = 2.0
+
+
+def _book_key(board: 'Board', side: int, dice) -> tuple:
+    """Returns the book key of a position: its hash with the side to move, and the roll as (low, high)."""
+    return (board.position_key(side), (min(dice), max(dice)))
+
+
+class OpeningBook:
+    """
+    Book of precomputed plays, indexed by (position key, sorted dice).
+    """
+
+    def __init__(self):
+        """Initializes an empty book."""
+        self.__entries__ = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'OpeningBook':
+        """
+        Loads a book saved with ``save``.
+
+        Args:
+            path (str): The JSON file.
+
+        Returns:
+            OpeningBook: The book.
+        """
+        book = cls()
+        with open(path, encoding='utf-8') as handle:
+            for entry in json.load(handle)['entries']:
+                key = (int(entry['key'], 16), tuple(entry['dice']))
+                book.__entries__[key] = {
+                    'play': tuple(tuple(move) for move in entry['play']),
+                    'equity': entry.get('equity'),
+                    'std_error': entry.get('std_error'),
+                }
+        return book
+
+    def save(self, path: str):
+        """Saves the book as JSON."""
+        entries = [
+            {'key': f"{key:016x}", 'dice': list(dice), 'play': [list(move) for move in entry['play']],
+             'equity': entry['equity'], 'std_error': entry['std_error']}
+            for (key, dice), entry in sorted(self.__entries__.items())
+        ]
+        with open(path, 'w', encoding='utf-8') as handle:
+            # One entry per line keeps regenerated books readable in diffs
+            handle.write('{"entries": [\n')
+            handle.write(',\n'.join(json.dumps(entry) for entry in entries))
+            handle.write('\n]}\n')
+
+    def add(self, board: 'Board', side: int, dice, play: tuple, equity: float = None, std_error: float = None):
+        """
+        Adds or replaces the play for a position.
+
+        Args:
+            board (Board): The position.
+            side (int): The side to move.
+            dice: The roll.
+            play (tuple): The book play, (from_point, to_point, die) moves.
+            equity (float, optional): Its rollout equity.
+            std_error (float, optional): The standard error of that equity.
+        """
+        self.__entries__[_book_key(board, side, dice)] = {
+            'play': tuple(tuple(move) for move in play), 'equity': equity, 'std_error': std_error,
+        }
+
+    def lookup(self, board: 'Board', side: int, dice) -> Optional[tuple]:
+        """
+        Returns the book play for a position, if there is one.
+
+        Args:
+            board (Board): The position.
+            side (int): The side to move.
+            dice: The roll.
+
+        Returns:
+            tuple or None: The play, checked to be legal here so a hash collision can
+            never produce an illegal move.
+        """
+        entry = self.__entries__.get(_book_key(board, side, dice))
+        if entry is None:
+            return None
+        play = entry['play']
+        return play if play in generate_side_plays(board, side, dice) else None
+
+    def __len__(self):
+        return len(self.__entries__)
+
+
+_default_book = None
+
+
+def get_default_book() -> OpeningBook:
+    """
+    Returns the book at DEFAULT_PATH, loaded on first use.
+
+    Returns:
+        OpeningBook: The book, empty if the file is missing.
+    """
+    global _default_book
+    if _default_book is None:
+        _default_book = OpeningBook.load(DEFAULT_PATH) if os.path.exists(DEFAULT_PATH) else OpeningBook()
+    return _default_book
+
+
+def mirror_play(play: tuple) -> tuple:
+    """Returns the same play made by the other side, point ``p`` becoming ``23 - p``."""
+    return tuple(
+        (from_point if from_point == 'bar' else 23 - from_point,
+         to_point if to_point == 'off' else 23 - to_point,
+         die)
+        for from_point, to_point, die in play
+    )
+
+
+def _new_board() -> 'Board':
+    return Board(Player("White", "white"), Player("Black", "black"))
+
+
+def _replay(history: List[tuple], mirrored: bool) -> 'Board':
+    """Plays a sequence of plays from the starting position, white first (black if mirrored)."""
+    board = _new_board()
+    side = BLACK if mirrored else WHITE
+    for play in history:
+        apply_play(board, side, mirror_play(play) if mirrored else play)
+        side = 1 - side
+    return board
+
+
+def best_play(board: 'Board', side: int, dice: tuple, trials: int, candidates: int, seed: int,
+              workers: int = None, executor=None, evaluator: Callable = None,
+              control_variate: bool = True) -> tuple:
+    """
+    Finds the best play by rolling out the most promising candidates.
+
+    Args:
+        board (Board): The position, left unchanged.
+        side (int): The side to move.
+        dice (tuple): The roll.
+        trials (int): Rollout trials per candidate.
+        candidates (int): How many plays, best by static evaluation, to roll out.
+        seed (int): Rollout seed, shared by all candidates so they see the same dice.
+        workers (int, optional): Rollout processes when no executor is given, 1 runs in this process.
+        executor (Executor, optional): Pool for the rollouts.
+        evaluator (Callable, optional): Evaluator for the pre-selection and the rollouts.
+        control_variate (bool, optional): Use the control variate estimate instead of the
+            stratified one. Defaults to True.
+
+    Returns:
+        tuple: The best play, its rollout estimate {'equity', 'std_error'}, and the
+        runner-up's estimate (None when there is a single candidate).
+    """
+    evaluator = evaluator or heuristic_evaluate
+    plays = generate_side_plays(board, side, dice)
+    scored = []
+    for play in plays:
+        after = board.copy()
+        apply_play(after, side, play)
+        scored.append((-evaluator(after, 1 - side), play))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    player = Player("Book", 'white' if side == WHITE else 'black')
+    estimate = 'control_variate' if control_variate else 'stratified'
+    results = []
+    for _, play in scored[:candidates]:
+        stats = rollout(board, player, play, trials=trials, seed=seed, evaluator=evaluator,
+                        workers=workers, executor=executor, control_variate=control_variate)
+        results.append((stats[estimate]['equity'], play, stats[estimate]))
+    results.sort(key=lambda item: item[0], reverse=True)
+    runner_up = results[1][2] if len(results) > 1 else None
+    return results[0][1], results[0][2], runner_up
+
+
+def is_separated(best: dict, runner_up: Optional[dict], separation: float = DEFAULT_SEPARATION) -> bool:
+    """
+    Tells whether a rollout winner is clearly better than the runner-up.
+
+    The candidates' errors are treated as independent, which overstates the error of
+    the difference since they share the same dice, so the test errs towards leaving
+    a position to the search.
+
+    Args:
+        best (dict): The winner's estimate, {'equity', 'std_error'}.
+        runner_up (dict or None): The runner-up's estimate, None when there was no other candidate.
+        separation (float, optional): Standard errors of the difference required. Defaults to 2.
+
+    Returns:
+        bool: True if the gap exceeds ``separation`` standard errors.
+    """
+    if runner_up is None:
+        return True
+    gap = best['equity'] - runner_up['equity']
+    return gap > separation * math.hypot(best['std_error'], runner_up['std_error'])
+
+
+def build_book(trials: int = DEFAULT_TRIALS, candidates: int = 4, replies: bool = False, workers: int = None,
+               seed: int = 0, separation: float = DEFAULT_SEPARATION,
+               report: Optional[Callable] = print) -> OpeningBook:
+    """
+    Builds the book from rollouts.
+
+    Every opening roll is solved for white and stored for both colors, the position
+    being symmetric, unless ``is_separated`` finds the best play too close to the
+    runner-up. With ``replies`` the 21 answers to each stored opening are added.
+
+    Args:
+        trials (int, optional): Rollout trials per candidate play. Defaults to 1296.
+        candidates (int, optional): Plays rolled out per position. Defaults to 4.
+        replies (bool, optional): Also solve the second turn. Defaults to False.
+        workers (int, optional): Rollout processes. Defaults to the CPU count.
+        seed (int, optional): Rollout seed.
+        separation (float, optional): Standard errors of the difference the best play
+            must win by. Defaults to 2.
+        report (Callable, optional): Receives progress lines. None is quiet.
+
+    Returns:
+        OpeningBook: The book.
+    """
+    book = OpeningBook()
+    positions = [([], WHITE, dice) for dice in OPENING_ROLLS]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while positions:
+            history, side, dice = positions.pop(0)
+            board = _replay(history, mirrored=False)
+            play, stats, runner_up = best_play(board, side, dice, trials, candidates, seed, executor=executor)
+            stored = is_separated(stats, runner_up, separation)
+            if stored:
+                book.add(board, side, dice, play, stats['equity'], stats['std_error'])
+                book.add(_replay(history, mirrored=True), 1 - side, dice, mirror_play(play),
+                         stats['equity'], stats['std_error'])
+            if report:
+                gap = "" if runner_up is None else f", {stats['equity'] - runner_up['equity']:+.3f} over the runner-up"
+                report(f"{len(history) + 1}. {dice}: {play} equity {stats['equity']:+.3f} "
+                       f"(+-{stats['std_error']:.3f}{gap}){'' if stored else ', too close, left to the search'}")
+            if replies and stored and not history:
+                positions.extend((history + [play], BLACK, (die1, die2))
+                                 for die1 in range(1, 7) for die2 in range(die1, 7))
+    return book
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate the opening book from rollouts.")
+    parser.add_argument('--trials', type=int, default=DEFAULT_TRIALS,
+                        help="rollout trials per candidate (default: %(default)s)")
+    parser.add_argument('--candidates', type=int, default=4, help="plays rolled out per position (default: %(default)s)")
+    parser.add_argument('--separation', type=float, default=DEFAULT_SEPARATION,
+                        help="standard errors the best play must win by to be stored (default: %(default)s)")
+    parser.add_argument('--replies', action='store_true', help="also solve the replies to each opening")
+    parser.add_argument('--workers', type=int, default=None, help="rollout processes (default: CPU count)")
+    parser.add_argument('--seed', type=int, default=0, help="rollout seed")
+    parser.add_argument('--output', default=DEFAULT_PATH, help="book file (default: %(default)s)")
+    args = parser.parse_args(argv)
+    book = build_book(args.trials, args.candidates, args.replies, args.workers, args.seed, args.separation)
+    book.save(args.output)
+    print(f"Wrote {len(book)} positions to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
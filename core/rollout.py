@@ -0,0 +1,510 @@
+"""
+Monte Carlo rollouts.
+
+A rollout plays a position out to the end many times with a fast 1-ply policy and
+averages the results. Trials are split into batches and run on a process pool.
+Batches send back summed tallies rather than per-game results, and since the dice
+of every trial only depend on the rollout seed and the trial number, the result
+does not depend on the number of workers.
+
+Three variance reductions can be combined: stratified first rolls, rotated dice
+within groups of trials, and a control variate from the cheap evaluator.
+"""
+import math
+import os
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Iterator, List
+from .board import Board
+from .dice import RandomSource
+from .player import Player
+from .evaluation import heuristic_evaluate, WIN, LOSS
+from .movegen import ROLLS, generate_side_plays, generate_roll_plays, apply_play, undo_play
+from .movetables import WHITE, BLACK, SIGNS, BARS, HOME_POINT
+
+# Points for a single game, a gammon and a backgammon
+SINGLE = 1
+GAMMON = 2
+BACKGAMMON = 3
+
+DEFAULT_TRIALS = 1296
+DEFAULT_BATCH_SIZE = 64
+
+# The 36 ordered outcomes of two dice, for stratifying the first rolls
+OUTCOMES = tuple((die1, die2) for die1 in range(1, 7) for die2 in range(1, 7))
+# Trials sharing one random stream, each with the dice shifted by a different number of faces
+ROTATIONS = 6
+# Rolls played before the control variate is evaluated
+CONTROL_ROLLS = 2
+
+# Counters kept per batch, all from the view of the side that made the play
+TRIALS, POINTS, POINTS_SQUARED, WINS, GAMMON_WINS, BACKGAMMON_WINS, GAMMON_LOSSES, BACKGAMMON_LOSSES = range(8)
+NUM_COUNTERS = 8
+
+
+def game_points(board: 'Board', winner: int) -> int:
+    """
+    Returns how many points a finished game is worth.
+
+    Args:
+        board (Board): The final position.
+        winner (int): The side that bore off all its checkers.
+
+    Returns:
+        int: SINGLE, GAMMON if the loser bore off nothing, or BACKGAMMON if the loser
+        also still has a checker on the bar or in the winner's home board.
+    """
+    loser = 1 - winner
+    if board.get_off_counts()[loser] > 0:
+        return SINGLE
+    cells, sign = board.get_cells(), SIGNS[loser]
+    if cells[BARS[loser]] * sign > 0:
+        return BACKGAMMON
+    for pip in range(1, 7):
+        if cells[HOME_POINT[winner][pip]] * sign > 0:
+            return BACKGAMMON
+    return GAMMON
+
+
+def choose_play(board: 'Board', side: int, dice: tuple, evaluator: Callable, plays: list = None) -> tuple:
+    """
+    Picks the play with the best 1-ply evaluation, the rollout policy.
+
+    Args:
+        board (Board): The position, left unchanged.
+        side (int): The side to move.
+        dice (tuple): The roll, doubles given four times.
+        evaluator (Callable): ``evaluator(board, side)`` as used by the search. Its
+            ``evaluate_plays`` method is used instead when it has one.
+        plays (list, optional): The legal plays of the roll, when already generated.
+
+    Returns:
+        tuple: The chosen play.
+    """
+    if plays is None:
+        plays = generate_side_plays(board, side, dice)
+    if len(plays) == 1:
+        return plays[0]
+    evaluate_plays = getattr(evaluator, 'evaluate_plays', None)
+    if evaluate_plays is not None:
+        values = evaluate_plays(board, side, plays)
+        return plays[max(range(len(plays)), key=values.__getitem__)]
+    best_play, best_value = plays[0], None
+    for play in plays:
+        records = apply_play(board, side, play)
+        value = WIN if board.is_game_over() else -evaluator(board, 1 - side)
+        undo_play(board, records)
+        if best_value is None or value > best_value:
+            best_play, best_value = play, value
+    return best_play
+
+
+def expand_roll(die1: int, die2: int) -> tuple:
+    """Returns a roll the way the move generator takes it: low die first, doubles four times."""
+    if die1 == die2:
+        return (die1,) * 4
+    return (die1, die2) if die1 < die2 else (die2, die1)
+
+
+class TrialDice:
+    """
+    The dice of one rollout trial.
+
+    The first ``stratify`` rolls are not random: trial ``t`` gets outcome ``t % 36`` of
+    OUTCOMES for its first roll, ``(t // 36) % 36`` for its second, so every run of 36
+    (or 1296) trials sees each outcome exactly once. Later rolls come from the child
+    stream of the rollout seed for the trial number. With rotation, runs of ROTATIONS trials
+    share one stream and trial ``t`` shifts every die by ``t % ROTATIONS`` faces,
+    so the group plays every rotation of the same luck.
+    """
+
+    def __init__(self, seed, trial: int, stratify: int = 0, rotate: bool = False):
+        """
+        Initializes the dice of a trial.
+
+        Args:
+            seed (int): The rollout seed.
+            trial (int): The trial number.
+            stratify (int, optional): Number of leading rolls to stratify (0, 1 or 2).
+            rotate (bool, optional): Whether to rotate the dice within groups of ROTATIONS trials.
+        """
+        if rotate:
+            stream, self.__shift__ = divmod(trial, ROTATIONS)
+        else:
+            stream, self.__shift__ = trial, 0
+        self.__dice__ = RandomSource(seed).spawn(stream)
+        self.__forced__ = []
+        for _ in range(stratify):
+            trial, outcome = divmod(trial, len(OUTCOMES))
+            self.__forced__.append(OUTCOMES[outcome])
+        self.__rolls__ = 0
+
+    def roll(self) -> tuple:
+        """Returns the next roll, as ``expand_roll`` gives it."""
+        if self.__rolls__ < len(self.__forced__):
+            die1, die2 = self.__forced__[self.__rolls__]
+        else:
+            die1, die2 = self.__dice__.roll()
+            if self.__shift__:
+                die1 = (die1 - 1 + self.__shift__) % 6 + 1
+                die2 = (die2 - 1 + self.__shift__) % 6 + 1
+        self.__rolls__ += 1
+        return expand_roll(die1, die2)
+
+
+def play_out(board: 'Board', side: int, roll: Callable, evaluator: Callable) -> int:
+    """
+    Plays a game to the end on ``board``.
+
+    Args:
+        board (Board): The position, modified in place.
+        side (int): The side about to roll.
+        roll (Callable): Returns the next roll, e.g. ``TrialDice.roll``.
+        evaluator (Callable): The evaluator of the rollout policy.
+
+    Returns:
+        int: The points won by ``side``, negative if it lost.
+    """
+    mover = side
+    while not board.is_game_over():
+        apply_play(board, mover, choose_play(board, mover, roll(), evaluator))
+        mover = 1 - mover
+    winner = WHITE if board.get_off_counts()[WHITE] == 15 else BLACK
+    points = game_points(board, winner)
+    return points if winner == side else -points
+
+
+def _control_value(board: 'Board', side: int, mover: int, evaluator: Callable) -> float:
+    """The cheap evaluation used as control variate, from the view of ``side``, with ``mover`` on roll."""
+    if board.is_game_over():
+        return WIN if board.get_off_counts()[side] == 15 else LOSS
+    value = evaluator(board, mover)
+    return value if mover == side else -value
+
+
+def control_mean(board: 'Board', side: int, evaluator: Callable, rolls: int = CONTROL_ROLLS) -> float:
+    """
+    Returns the exact expectation of the control variate, by enumerating the first rolls.
+
+    Args:
+        board (Board): The position after the play, left unchanged.
+        side (int): The side that made the play. The other side rolls next.
+        evaluator (Callable): The evaluator of the rollout policy.
+        rolls (int, optional): Rolls played before evaluating. Defaults to CONTROL_ROLLS.
+
+    Returns:
+        float: The expected control value.
+    """
+    def expect(mover, left):
+        if left == 0 or board.is_game_over():
+            return _control_value(board, side, mover, evaluator)
+        total = 0.0
+        for (dice, probability), plays in zip(ROLLS, generate_roll_plays(board, mover)):
+            records = apply_play(board, mover, choose_play(board, mover, dice, evaluator, plays))
+            total += probability * expect(1 - mover, left - 1)
+            undo_play(board, records)
+        return total
+
+    return expect(1 - side, rolls)
+
+
+def add_result(counters: List[int], points: int):
+    """Adds one game, worth ``points`` to the side that made the play, to a counter list."""
+    counters[TRIALS] += 1
+    counters[POINTS] += points
+    counters[POINTS_SQUARED] += points * points
+    if points > 0:
+        counters[WINS] += 1
+        counters[GAMMON_WINS] += points >= GAMMON
+        counters[BACKGAMMON_WINS] += points == BACKGAMMON
+    else:
+        counters[GAMMON_LOSSES] += points <= -GAMMON
+        counters[BACKGAMMON_LOSSES] += points == -BACKGAMMON
+
+
+def summarize(counters: List[int]) -> dict:
+    """
+    Turns summed counters into rollout statistics.
+
+    Returns:
+        dict: trials, equity (points per game), std_error, win_rate, gammon_rate,
+        backgammon_rate, gammon_loss_rate and backgammon_loss_rate. Gammon rates
+        include backgammons.
+    """
+    trials = counters[TRIALS]
+    mean = counters[POINTS] / trials
+    if trials > 1:
+        variance = max(counters[POINTS_SQUARED] - trials * mean * mean, 0.0) / (trials - 1)
+        std_error = math.sqrt(variance / trials)
+    else:
+        std_error = 0.0
+    return {
+        'trials': trials,
+        'equity': mean,
+        'std_error': std_error,
+        'win_rate': counters[WINS] / trials,
+        'gammon_rate': counters[GAMMON_WINS] / trials,
+        'backgammon_rate': counters[BACKGAMMON_WINS] / trials,
+        'gammon_loss_rate': counters[GAMMON_LOSSES] / trials,
+        'backgammon_loss_rate': counters[BACKGAMMON_LOSSES] / trials,
+    }
+
+
+def _stratified(strata: list) -> dict:
+    """Stratified estimate over the first-roll strata, with the pooled within-stratum variance."""
+    present = [stratum for stratum in strata if stratum[0]]
+    trials = sum(stratum[0] for stratum in present)
+    equity = sum(total / count for count, total, _ in present) / len(present)
+    within = sum(squares - total * total / count for count, total, squares in present)
+    freedom = trials - len(present)
+    std_error = math.sqrt(max(within, 0.0) / freedom / trials) if freedom > 0 else 0.0
+    return {'equity': equity, 'std_error': std_error}
+
+
+def _rotated(groups: list) -> dict:
+    """Estimate from the means of the rotation groups, which are independent of each other."""
+    count, total, squares = groups
+    equity = total / count
+    if count > 1:
+        std_error = math.sqrt(max(squares - count * equity * equity, 0.0) / (count - 1) / count)
+    else:
+        std_error = 0.0
+    return {'equity': equity, 'std_error': std_error}
+
+
+def _controlled(control: list, expected: float) -> dict:
+    """Control variate estimate with the regression coefficient fitted on the trials."""
+    count, sum_x, sum_c, sum_xx, sum_xc, sum_cc = control
+    mean_x, mean_c = sum_x / count, sum_c / count
+    if count < 2:
+        return {'equity': mean_x, 'std_error': 0.0, 'beta': 0.0}
+    var_x = (sum_xx - count * mean_x * mean_x) / (count - 1)
+    var_c = (sum_cc - count * mean_c * mean_c) / (count - 1)
+    cov = (sum_xc - count * mean_x * mean_c) / (count - 1)
+    beta = cov / var_c if var_c > 1e-12 else 0.0
+    residual = max(var_x - beta * cov, 0.0)
+    return {
+        'equity': mean_x - beta * (mean_c - expected),
+        'std_error': math.sqrt(residual / count),
+        'beta': beta,
+    }
+
+
+def _merge(total, part):
+    """Adds a batch's tallies into the running totals, element by element."""
+    for index, value in enumerate(part):
+        if isinstance(value, list):
+            _merge(total[index], value)
+        else:
+            total[index] += value
+
+
+def _new_board() -> 'Board':
+    return Board(Player("White", "white"), Player("Black", "black"))
+
+
+def _new_tallies(stratify: int, rotate: bool, control: bool) -> list:
+    """Returns empty tallies: the counters, then strata, groups and control sums when enabled."""
+    return [
+        [0] * NUM_COUNTERS,
+        [[0, 0, 0] for _ in OUTCOMES] if stratify else [],
+        [0, 0.0, 0.0] if rotate else [],
+        [0, 0.0, 0.0, 0.0, 0.0, 0.0] if control else [],
+    ]
+
+
+def _run_batch(cells: list, off: tuple, side: int, first: int, trials: int, seed: int, evaluator: Callable,
+               stratify: int = 0, rotate: bool = False, control: bool = False) -> list:
+    """
+    Runs one batch of trials, in a worker process.
+
+    Args:
+        cells (list): The position after the play, as signed cell counts.
+        off (tuple): Checkers borne off by white and black.
+        side (int): The side that made the play. The other side rolls next.
+        first (int): Number of the first trial. Batches start on a rotation group boundary.
+        trials (int): Number of games to play.
+        seed (int): The rollout seed.
+        evaluator (Callable): The evaluator of the rollout policy.
+        stratify (int, optional): Number of leading rolls to stratify.
+        rotate (bool, optional): Whether to rotate the dice within groups.
+        control (bool, optional): Whether to record the control variate.
+
+    Returns:
+        list: The tallies from ``_new_tallies``, summed over the batch.
+    """
+    board = _new_board()
+    counters, strata, groups, sums = tallies = _new_tallies(stratify, rotate, control)
+    group_total = group_count = 0
+    for trial in range(first, first + trials):
+        board.set_position(cells, off)
+        dice = TrialDice(seed, trial, stratify, rotate)
+        mover = 1 - side
+        if control:
+            for _ in range(CONTROL_ROLLS):
+                if board.is_game_over():
+                    break
+                apply_play(board, mover, choose_play(board, mover, dice.roll(), evaluator))
+                mover = 1 - mover
+            value = _control_value(board, side, mover, evaluator)
+        points = play_out(board, mover, dice.roll, evaluator)
+        points = points if mover == side else -points
+        add_result(counters, points)
+
+        if stratify:
+            stratum = strata[trial % len(OUTCOMES)]
+            stratum[0] += 1
+            stratum[1] += points
+            stratum[2] += points * points
+        if rotate:
+            group_total += points
+            group_count += 1
+            if group_count == ROTATIONS or trial == first + trials - 1:
+                mean = group_total / group_count
+                groups[0] += 1
+                groups[1] += mean
+                groups[2] += mean * mean
+                group_total = group_count = 0
+        if control:
+            sums[0] += 1
+            sums[1] += points
+            sums[2] += value
+            sums[3] += points * points
+            sums[4] += points * value
+            sums[5] += value * value
+    return tallies
+
+
+def run_batches(function: Callable, tasks: list, workers: int = None, executor: Executor = None) -> Iterator:
+    """
+    Runs ``function(*task)`` for every task and yields the results in task order.
+
+    Args:
+        function (Callable): A module-level function, so it can be sent to worker processes.
+        tasks (list): Argument tuples.
+        workers (int, optional): Worker processes. 1 runs in this process. Defaults to the CPU count.
+        executor (Executor, optional): An existing pool to use instead of starting one.
+    """
+    if executor is not None:
+        for future in [executor.submit(function, *task) for task in tasks]:
+            yield future.result()
+    elif workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield function(*task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            for future in [pool.submit(function, *task) for task in tasks]:
+                yield future.result()
+
+
+def schedule(function: Callable, tasks: Iterator, workers: int = None) -> Iterator:
+    """
+    Runs ``function(*task)`` for a stream of tasks and yields the results as they finish.
+
+    Only a couple of tasks per worker are submitted at a time, so a caller that stops
+    iterating (e.g. when a stopping rule triggers) leaves little work behind, and that
+    work is cancelled when the generator is closed.
+
+    Args:
+        function (Callable): A module-level function, so it can be sent to worker processes.
+        tasks (Iterator): (key, task arguments) pairs, consumed lazily.
+        workers (int, optional): Worker processes. 1 runs in this process. Defaults to the CPU count.
+
+    Yields:
+        tuple: The key, the task arguments and the result.
+    """
+    tasks = iter(tasks)
+    if workers == 1:
+        for key, task in tasks:
+            yield key, task, function(*task)
+        return
+    workers = workers or os.cpu_count()
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending = {}
+    try:
+        while True:
+            while len(pending) < 2 * workers:
+                item = next(tasks, None)
+                if item is None:
+                    break
+                pending[pool.submit(function, *item[1])] = item
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, task = pending.pop(future)
+                yield key, task, future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def rollout(board: 'Board', player: 'Player', play: tuple, trials: int = DEFAULT_TRIALS, seed: int = 0,
+            workers: int = None, batch_size: int = DEFAULT_BATCH_SIZE, evaluator: Callable = None,
+            executor: Executor = None, stratify: int = 1, rotate: bool = True,
+            control_variate: bool = False) -> dict:
+    """
+    Rolls out a candidate play.
+
+    Args:
+        board (Board): The position before the play. It is left unchanged.
+        player (Player): The player making the play.
+        play (tuple): A legal play from ``generate_plays``.
+        trials (int, optional): Number of games to play. Defaults to 1296.
+        seed (int, optional): Seed of the rollout, the same seed gives the same result.
+        workers (int, optional): Worker processes. 1 runs in this process. Defaults to the CPU count.
+        batch_size (int, optional): Games per task sent to a worker, rounded up to whole
+            rotation groups. Defaults to 64.
+        evaluator (Callable, optional): Evaluator of the rollout policy. Defaults to
+            ``heuristic_evaluate``. Must be picklable when workers are used.
+        executor (Executor, optional): An existing pool, e.g. shared by the rollouts of all candidates.
+        stratify (int, optional): Leading rolls spread evenly over the 36 outcomes (0, 1 or 2).
+            Use a multiple of 36 (or 1296) trials. Defaults to 1.
+        rotate (bool, optional): Rotate the dice within groups of 6 trials. Defaults to True.
+        control_variate (bool, optional): Correct the result with the evaluation after
+            CONTROL_ROLLS rolls, whose exact mean is enumerated. Defaults to False.
+
+    Returns:
+        dict: The statistics from ``summarize``, from the view of ``player``. The plain
+        estimate assumes independent trials. Each enabled variance reduction adds its own
+        estimate with its standard error under 'stratified', 'rotated' and 'control_variate'.
+
+    Raises:
+        ValueError: If ``trials`` or ``batch_size`` is not positive, or ``stratify`` is not 0, 1 or 2.
+    """
+    if trials < 1 or batch_size < 1:
+        raise ValueError("trials and batch_size must be positive")
+    if stratify not in (0, 1, 2):
+        raise ValueError("stratify must be 0, 1 or 2")
+    side = board._side(player)
+    position = board.copy()
+    apply_play(position, side, play)
+    if position.is_game_over():
+        # Nothing left to roll: every trial ends the same way
+        counters = [0] * NUM_COUNTERS
+        points = game_points(position, side)
+        for _ in range(trials):
+            add_result(counters, points)
+        return summarize(counters)
+
+    evaluator = evaluator or heuristic_evaluate
+    if rotate:
+        batch_size = -(-batch_size // ROTATIONS) * ROTATIONS
+    cells, off = position.get_cells().tolist(), position.get_off_counts()
+    tasks = [
+        (cells, off, side, first, min(batch_size, trials - first), seed, evaluator,
+         stratify, rotate, control_variate)
+        for first in range(0, trials, batch_size)
+    ]
+    tallies = _new_tallies(stratify, rotate, control_variate)
+    for result in run_batches(_run_batch, tasks, workers, executor):
+        _merge(tallies, result)
+
+    counters, strata, groups, sums = tallies
+    results = summarize(counters)
+    if stratify:
+        results['stratified'] = _stratified(strata)
+    if rotate:
+        results['rotated'] = _rotated(groups)
+    if control_variate:
+        results['control_variate'] = _controlled(sums, control_mean(position, side, evaluator))
+    return results
@@ -0,0 +1,317 @@
+from __future__ import annotations
+from time import perf_counter
+from typing import Callable, List, TYPE_CHECKING
+from .ai import AIPlayer
+from .evaluation import heuristic_evaluate, WIN, LOSS
+from .movegen import ROLLS, generate_side_plays, generate_roll_plays, apply_play, undo_play
+from .openingbook import OpeningBook, get_default_book
+from .transposition import TranspositionTable, EXACT, LOWER, UPPER
+
+if TYPE_CHECKING:
+    from .board import Board
+
+# Deepest iteration tried by a time-budgeted search
+MAX_DEPTH = 16
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+class SearchAIPlayer(AIPlayer):
+    """
+    AI player that picks its play with an expectiminimax search.
+
+    Max nodes are the full-turn plays of the side to move, chance nodes average
+    over the 21 distinct rolls. Chance nodes are pruned with Star1 (bounding the
+    unexplored rolls by the evaluation range) and Star2 (probing the best-ordered
+    play of every roll first to get a lower bound). Plays are searched in place
+    with make/unmake and ordered by their static evaluation. Chance node results
+    are kept in a transposition table, which survives between turns.
+
+    With a time budget the search deepens one ply at a time, starting each
+    iteration with the previous best play, and returns the best play found when
+    the budget runs out.
+
+    Positions in the opening book are played from the book without searching.
+    """
+
+    def __init__(self, name: str, color: str, depth: int = 2, evaluator: Callable = None,
+                 transposition_table: TranspositionTable = None, opening_book: OpeningBook = None):
+        """
+        Initializes the search AI.
+
+        Args:
+            name (str): The name of the player.
+            color (str): The color of the player's checkers ('white' or 'black').
+            depth (int, optional): Number of plies (full turns) to search when no time budget
+                is given. Defaults to 2.
+            evaluator (Callable, optional): ``evaluator(board, side) -> float`` giving the value
+                for the side on roll, strictly between -1 and 1. Defaults to ``heuristic_evaluate``.
+                If it has an ``evaluate_plays(board, side, plays)`` method (see ``NeuralEvaluator``)
+                plays are ordered with it in one batch.
+            transposition_table (TranspositionTable, optional): Table for chance node results.
+                Only share it between players that use the same evaluator. Defaults to a new table.
+            opening_book (OpeningBook, optional): Book consulted before searching. Defaults to
+                the book shipped in assets; pass an empty ``OpeningBook()`` to always search.
+        """
+        super().__init__(name, color)
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.__depth__ = depth
+        self.__evaluator__ = evaluator or heuristic_evaluate
+        self.__nodes__ = 0
+        self.__depth_reached__ = 0
+        self.__deadline__ = None
+        self.__root_best__ = None
+        self.__table__ = transposition_table if transposition_table is not None else TranspositionTable()
+        self.__book__ = opening_book if opening_book is not None else get_default_book()
+
+    def get_depth(self):
+        """Returns the search depth in plies."""
+        return self.__depth__
+
+    def get_nodes(self):
+        """Returns the number of positions visited by the last search."""
+        return self.__nodes__
+
+    def get_depth_reached(self):
+        """Returns the depth of the last fully searched iteration (0 if no search was needed)."""
+        return self.__depth_reached__
+
+    def get_transposition_table(self):
+        """Returns the transposition table used by the search."""
+        return self.__table__
+
+    def get_opening_book(self):
+        """Returns the opening book consulted before searching."""
+        return self.__book__
+
+    def choose_moves(self, board: 'Board', dice: List[int], time_budget_ms: float = None) -> List[tuple]:
+        """
+        Chooses the play with the best expectiminimax value.
+
+        Args:
+            board (Board): The current state of the game board. It is left unchanged.
+            dice (List[int]): The dice values available for the turn.
+            time_budget_ms (float, optional): Search by iterative deepening for about this
+                many milliseconds instead of to the fixed depth. At least the 1-ply
+                ordering is always done, so the result is never worse than a greedy pick.
+
+        Returns:
+            List[tuple]: (from_point, to_point, die) moves. The die is included so callers
+            do not have to infer it for bear-offs that could use more than one die.
+        """
+        self.__nodes__ = 0
+        self.__depth_reached__ = 0
+        side = board._side(self)
+        plays = generate_side_plays(board, side, dice)
+        if len(plays) == 1:
+            return list(plays[0])
+        book_play = self.__book__.lookup(board, side, dice)
+        if book_play is not None:
+            return list(book_play)
+        ordered = self._order(board, side, plays)
+        if time_budget_ms is None:
+            play = self._search_root(board, side, ordered, self.__depth__)[0]
+            self.__depth_reached__ = self.__depth__
+        else:
+            play = self._deepen(board, side, ordered, time_budget_ms)
+        return list(play)
+
+    def _deepen(self, board: 'Board', side: int, ordered: list, time_budget_ms: float) -> tuple:
+        """
+        Iterative deepening at the root until the time budget runs out.
+
+        Args:
+            board (Board): The board to search on.
+            side (int): The side to move.
+            ordered (list): The legal plays, best-ordered first.
+            time_budget_ms (float): The time budget in milliseconds.
+
+        Returns:
+            tuple: The best play of the deepest iteration, or a better one found by the
+            interrupted iteration (its first play is the previous best, so anything that
+            beat it there is better at the new depth too).
+        """
+        self.__deadline__ = perf_counter() + time_budget_ms / 1000
+        best_play = ordered[0]
+        try:
+            for depth in range(1, MAX_DEPTH + 1):
+                self.__root_best__ = None
+                best_play, ordered = self._search_root(board, side, ordered, depth)
+                self.__depth_reached__ = depth
+        except SearchTimeout:
+            if self.__root_best__ is not None:
+                best_play = self.__root_best__
+        finally:
+            self.__deadline__ = None
+        return best_play
+
+    def _search_root(self, board: 'Board', side: int, ordered: list, depth: int) -> tuple:
+        """Returns the best play at the root and the plays re-ordered by their values."""
+        best_play, alpha = ordered[0], LOSS
+        scored = []
+        for play in ordered:
+            value = self._play_value(board, side, play, depth, alpha, WIN)
+            scored.append((value, play))
+            if value > alpha:
+                best_play, alpha = play, value
+                self.__root_best__ = play
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return best_play, [play for _, play in scored]
+
+    def _order(self, board: 'Board', side: int, plays: list) -> list:
+        """Sorts plays by their static evaluation, best first."""
+        evaluator = self.__evaluator__
+        evaluate_plays = getattr(evaluator, 'evaluate_plays', None)
+        if evaluate_plays is not None:
+            # Batched evaluators score the whole roll at once
+            scored = list(zip(evaluate_plays(board, side, plays), plays))
+        else:
+            scored = []
+            for play in plays:
+                records = apply_play(board, side, play)
+                scored.append((-evaluator(board, 1 - side), play))
+                undo_play(board, records)
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [play for _, play in scored]
+
+    def _play_value(self, board: 'Board', side: int, play: tuple, depth: int, alpha: float, beta: float) -> float:
+        """
+        Applies a play and returns its value for ``side``.
+
+        Args:
+            board (Board): The board to search on.
+            side (int): The side making the play.
+            play (tuple): The play to apply.
+            depth (int): Plies left including this one.
+            alpha (float): Lower bound of the search window.
+            beta (float): Upper bound of the search window.
+
+        Returns:
+            float: The value of the play for ``side``.
+
+        Raises:
+            SearchTimeout: If the time budget ran out. The board is restored first.
+        """
+        self.__nodes__ += 1
+        if self.__deadline__ is not None and perf_counter() > self.__deadline__:
+            raise SearchTimeout()
+        records = apply_play(board, side, play)
+        try:
+            if board.is_game_over():
+                value = WIN
+            elif depth == 1:
+                value = -self.__evaluator__(board, 1 - side)
+            else:
+                value = -self._chance(board, 1 - side, depth - 1, -beta, -alpha)
+        finally:
+            undo_play(board, records)
+        return value
+
+    def _max(self, board: 'Board', side: int, plays: list, depth: int, alpha: float, beta: float,
+             start: int = 0, best: float = LOSS) -> float:
+        """
+        Max node: the best play of ``side`` for a fixed roll.
+
+        Args:
+            board (Board): The board to search on.
+            side (int): The side to move.
+            plays (list): The legal plays, best-ordered first.
+            depth (int): Plies left including this one.
+            alpha (float): Lower bound of the search window.
+            beta (float): Upper bound of the search window.
+            start (int, optional): Index of the first play to search, for resuming after a probe.
+            best (float, optional): Best value already found among the skipped plays.
+
+        Returns:
+            float: The value of the node for ``side`` (a bound if it falls outside the window).
+        """
+        alpha = max(alpha, best)
+        if alpha >= beta:
+            return best
+        for play in plays[start:]:
+            value = self._play_value(board, side, play, depth, alpha, beta)
+            if value > best:
+                best = value
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+        return best
+
+    def _chance(self, board: 'Board', side: int, depth: int, alpha: float, beta: float) -> float:
+        """
+        Chance node: the expected value for ``side``, who is about to roll.
+
+        Args:
+            board (Board): The board to search on.
+            side (int): The side about to roll.
+            depth (int): Plies left, at least 1.
+            alpha (float): Lower bound of the search window.
+            beta (float): Upper bound of the search window.
+
+        Returns:
+            float: The expected value for ``side`` (a bound if it falls outside the window).
+        """
+        key = board.position_key(side)
+        value = self.__table__.probe(key, depth, alpha, beta)
+        if value is not None:
+            return value
+        value = self._expect(board, side, depth, alpha, beta)
+        if value <= alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.__table__.store(key, depth, value, flag)
+        return value
+
+    def _expect(self, board: 'Board', side: int, depth: int, alpha: float, beta: float) -> float:
+        """Searches a chance node that was not answered by the transposition table."""
+        # Generate and order the plays of every roll once, they are reused by both passes
+        children = []
+        for (_, probability), plays in zip(ROLLS, generate_roll_plays(board, side)):
+            if depth > 1 and len(plays) > 1:
+                plays = self._order(board, side, plays)
+            children.append((plays, probability))
+
+        # Star2 probing: the first play of every roll gives a lower bound of its max node.
+        # A probe that fails low is only an upper bound, so it counts as LOSS and the
+        # play is searched again in the second pass.
+        probes = []
+        lower_sum, remaining = 0.0, 1.0
+        for plays, probability in children:
+            remaining -= probability
+            probe_alpha = max((alpha - lower_sum - remaining * WIN) / probability, LOSS)
+            probe = self._play_value(board, side, plays[0], depth, probe_alpha, WIN)
+            if probe <= probe_alpha and probe_alpha > LOSS:
+                probe = None
+            probes.append(probe)
+            lower_sum += probability * (LOSS if probe is None else probe)
+            if lower_sum + remaining * LOSS >= beta:
+                return lower_sum + remaining * LOSS
+
+        # Star1: search the rest of every roll, cutting off once the bounds leave the window
+        total, remaining = 0.0, 1.0
+        probed_rest = lower_sum
+        for (plays, probability), probe in zip(children, probes):
+            remaining -= probability
+            probed_rest -= probability * (LOSS if probe is None else probe)
+            child_alpha = (alpha - total - remaining * WIN) / probability
+            # Later rolls are worth at least their probes
+            child_beta = (beta - total - probed_rest) / probability
+            if probe is None:
+                start, best = 0, LOSS
+            else:
+                start, best = 1, probe
+            value = self._max(board, side, plays, depth, max(child_alpha, LOSS), min(child_beta, WIN),
+                              start=start, best=best)
+            total += probability * value
+            if total + remaining * WIN <= alpha:
+                return total + remaining * WIN
+            if total + probed_rest >= beta:
+                return total + probed_rest
+        return total
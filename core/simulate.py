@@ -0,0 +1,367 @@
+"""
+Headless AI-vs-AI games.
+
+Plays games between two AIs without the CLI or the pygame window and reports the
+throughput, the results and where the time goes. It is the baseline for measuring
+engine speedups and AI strength changes:
+
+    python -m core.simulate --games 200 --player1 greedy --player2 search:1 --workers 4
+
+Players are given as specs: ``greedy`` (``AIPlayer``), ``search[:DEPTH]``
+(``SearchAIPlayer`` with the heuristic evaluator) or ``neural:WEIGHTS[:DEPTH]``
+(``SearchAIPlayer`` with a ``NeuralEvaluator``, needs NumPy). The players swap
+colors every game. Game ``i`` rolls the child stream ``i`` of the seed, so a run gives
+the same games for any number of workers. ``--buffered-dice`` draws the dice in
+batches instead, which is faster but gives other games. The evaluators read race positions from the
+bear-off database.
+
+``--sprt ELO0 ELO1`` tests the second player against the first and stops as soon as
+the test finishes (see ``core.sprt``).
+"""
+import argparse
+import functools
+import math
+import time
+from typing import Callable, List, Optional
+from .ai import AIPlayer
+from .bearoff import BearoffDatabase, DEFAULT_PATH as BEAROFF_PATH, get_default_database, set_default_database
+from .dice import Dice, RandomSource, BufferedSource
+from .game import Game
+from .movetables import WHITE, BLACK
+from .rollout import game_points, schedule, GAMMON, BACKGAMMON
+from .search import SearchAIPlayer
+from .sprt import SPRT, format_sprt
+
+DEFAULT_BATCH_SIZE = 10
+
+# Normal quantile of the reported 95% confidence intervals
+CONFIDENCE_Z = 1.96
+
+# Phases of a turn timed by the simulator: rolling with the legal play generation that
+# classifies the roll, playing forced and impossible rolls, the AI's choice, and applying it
+PHASES = ('movegen', 'forced', 'decide', 'apply')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_network(path: str):
+    """Loads each network once per process."""
+    from .neural import NeuralEvaluator
+    return NeuralEvaluator.load(path)
+
+
+def make_player(spec: str, name: str, color: str) -> AIPlayer:
+    """
+    Builds an AI from its spec.
+
+    Args:
+        spec (str): 'greedy', 'search[:DEPTH]' or 'neural:WEIGHTS[:DEPTH]'.
+        name (str): The name of the player.
+        color (str): 'white' or 'black'.
+
+    Returns:
+        AIPlayer: The player.
+
+    Raises:
+        ValueError: If the spec is not recognized.
+    """
+    kind, _, options = spec.partition(':')
+    try:
+        if kind == 'greedy' and not options:
+            return AIPlayer(name, color)
+        if kind == 'search':
+            return SearchAIPlayer(name, color, depth=int(options or 2))
+        if kind == 'neural' and options:
+            path, _, depth = options.partition(':')
+            return SearchAIPlayer(name, color, depth=int(depth or 1), evaluator=_load_network(path))
+    except ValueError as error:
+        raise ValueError(f"Invalid player spec {spec!r}: {error}") from error
+    raise ValueError(f"Invalid player spec {spec!r}, expected greedy, search[:DEPTH] or neural:WEIGHTS[:DEPTH]")
+
+
+def play_game(specs: tuple, swap: bool, dice: Dice) -> tuple:
+    """
+    Plays one game between two AIs.
+
+    Args:
+        specs (tuple): The player specs, the first one plays white unless ``swap``.
+        swap (bool): Give the first spec black.
+        dice (Dice): The dice of the game, also used for the opening roll.
+
+    Returns:
+        tuple: The index in ``specs`` of the winner, the points won, the turns played,
+        the seconds spent in each of PHASES, and the decisions each spec made with the
+        seconds they took (two lists indexed like ``specs``).
+    """
+    colors = ('black', 'white') if swap else ('white', 'black')
+    players = [make_player(spec, f"Player {index + 1}", color)
+               for index, (spec, color) in enumerate(zip(specs, colors))]
+    order = players[::-1] if swap else players
+    game = Game(order, dice=dice)
+    board = game.board
+    phases = [0.0] * len(PHASES)
+    decisions, thinking = [0, 0], [0.0, 0.0]
+    clock = time.perf_counter
+    game.determine_first_player()
+    turns = 0
+    while True:
+        start = clock()
+        if turns:
+            game.roll_dice()
+        rolled = clock()
+        turns += 1
+        forced = game.play_forced_turn()
+        classified = clock()
+        phases[0] += rolled - start
+        phases[1] += classified - rolled
+        if not forced:
+            player = game.get_current_player()
+            moves = player.choose_moves(board, game.dice.get_values())
+            decided = clock()
+            game.apply_ai_moves(moves)
+            phases[2] += decided - classified
+            phases[3] += clock() - decided
+            decisions[players.index(player)] += 1
+            thinking[players.index(player)] += decided - classified
+        if game.is_game_over():
+            break
+        game.switch_player()
+    winner = players.index(game.get_winner())
+    side = WHITE if colors[winner] == 'white' else BLACK
+    return winner, game_points(board, side), turns, phases, decisions, thinking
+
+
+def play_games(specs: tuple, first: int, count: int, seed, bearoff: Optional[str], buffered: bool = False) -> list:
+    """
+    Plays games ``first`` to ``first + count - 1``, in a worker or inline.
+
+    Game ``i`` rolls child stream ``i`` of a ``RandomSource`` (``BufferedSource`` if
+    ``buffered``) seeded with ``seed``, and gives the first spec black when ``i`` is odd.
+    The bear-off database at ``bearoff`` (None for none) is used for these games only.
+
+    Returns:
+        list: The ``play_game`` result of each game.
+    """
+    previous = get_default_database()
+    database = previous if bearoff == BEAROFF_PATH else (BearoffDatabase(bearoff) if bearoff else None)
+    set_default_database(database)
+    try:
+        source = BufferedSource(seed) if buffered else RandomSource(seed)
+        return [play_game(specs, index % 2 == 1, Dice(source=source.spawn(index)))
+                for index in range(first, first + count)]
+    finally:
+        set_default_database(previous)
+        if database is not None and database is not previous:
+            database.close()
+
+
+def confidence_interval(total: float, squares: float, count: int, z: float = CONFIDENCE_Z) -> tuple:
+    """
+    Normal-approximation confidence interval of a mean from its running sums.
+
+    Args:
+        total (float): Sum of the samples (the wins, for a rate).
+        squares (float): Sum of their squares (the wins again, for a rate).
+        count (int): Number of samples.
+        z (float, optional): Normal quantile. Defaults to 1.96, a 95% interval.
+
+    Returns:
+        tuple: (low, high), (0.0, 0.0) without samples.
+    """
+    if count == 0:
+        return (0.0, 0.0)
+    mean = total / count
+    variance = max(squares - count * mean * mean, 0.0) / (count - 1) if count > 1 else 0.0
+    margin = z * math.sqrt(variance / count)
+    return (mean - margin, mean + margin)
+
+
+def new_totals() -> dict:
+    """Returns empty running totals for ``add_game``."""
+    return {
+        'games': 0, 'turns': 0,
+        'phase_seconds': dict.fromkeys(PHASES, 0.0),
+        'wins': [0, 0], 'gammons': [0, 0], 'backgammons': [0, 0], 'points': [0, 0], 'points_squared': 0,
+        'decisions': [0, 0], 'decision_seconds': [0.0, 0.0],
+    }
+
+
+def add_game(totals: dict, result: tuple):
+    """Adds a ``play_game`` result to running totals."""
+    winner, points, turns, phases, decisions, thinking = result
+    totals['games'] += 1
+    totals['turns'] += turns
+    for phase, seconds in zip(PHASES, phases):
+        totals['phase_seconds'][phase] += seconds
+    totals['wins'][winner] += 1
+    totals['gammons'][winner] += points >= GAMMON
+    totals['backgammons'][winner] += points == BACKGAMMON
+    totals['points'][winner] += points
+    totals['points'][1 - winner] -= points
+    totals['points_squared'] += points * points
+    for index in (0, 1):
+        totals['decisions'][index] += decisions[index]
+        totals['decision_seconds'][index] += thinking[index]
+
+
+def summarize(totals: dict, specs: tuple, seconds: float) -> dict:
+    """
+    Turns running totals into the simulation summary.
+
+    Returns:
+        dict: games, seconds, games_per_second, average_turns, phase_seconds and
+        players: per spec, wins, win_rate, gammon_rate, backgammon_rate (both counting
+        the games that player won), points_per_game, 95% intervals win_rate_ci and
+        points_per_game_ci, and mean_decision_ms.
+    """
+    games = totals['games']
+    return {
+        'games': games,
+        'seconds': seconds,
+        'games_per_second': games / seconds if seconds else 0.0,
+        'average_turns': totals['turns'] / games if games else 0.0,
+        'phase_seconds': dict(totals['phase_seconds']),
+        'players': [
+            {
+                'spec': spec,
+                'wins': totals['wins'][index],
+                'win_rate': totals['wins'][index] / games if games else 0.0,
+                'gammon_rate': totals['gammons'][index] / games if games else 0.0,
+                'backgammon_rate': totals['backgammons'][index] / games if games else 0.0,
+                'points_per_game': totals['points'][index] / games if games else 0.0,
+                'win_rate_ci': confidence_interval(totals['wins'][index], totals['wins'][index], games),
+                'points_per_game_ci': confidence_interval(totals['points'][index], totals['points_squared'], games),
+                'mean_decision_ms': (1000 * totals['decision_seconds'][index] / totals['decisions'][index]
+                                     if totals['decisions'][index] else 0.0),
+            }
+            for index, spec in enumerate(specs)
+        ],
+    }
+
+
+def simulate(games: int, player1: str = 'greedy', player2: str = 'greedy', seed: int = 0,
+             workers: int = 1, batch_size: int = DEFAULT_BATCH_SIZE,
+             bearoff: Optional[str] = BEAROFF_PATH, sprt: dict = None,
+             report: Optional[Callable] = None, report_every: int = 100, buffered_dice: bool = False) -> dict:
+    """
+    Plays games between two AIs.
+
+    With ``sprt`` the second AI is tested against the first and no more games are
+    scheduled once the test has finished, ``games`` being the most that are played.
+
+    Args:
+        games (int): Number of games.
+        player1 (str, optional): Spec of the first AI, white in even games. Defaults to 'greedy'.
+        player2 (str, optional): Spec of the second AI. Defaults to 'greedy'.
+        seed (int, optional): Seed of the dice.
+        workers (int, optional): Worker processes, None for the CPU count. Defaults to 1,
+            which plays in this process.
+        batch_size (int, optional): Games per task sent to a worker. Defaults to 10.
+        bearoff (str, optional): Bear-off database for the evaluators. None disables it.
+        sprt (dict, optional): Arguments of ``SPRT`` (elo0, elo1, alpha, beta) to stop early.
+        report (Callable, optional): Receives the SPRT progress lines. None is quiet.
+        report_every (int, optional): Games between SPRT progress lines. Defaults to 100.
+        buffered_dice (bool, optional): Draw the dice in batches with ``BufferedSource``. Defaults to False.
+
+    Returns:
+        dict: The summary from ``summarize``, with the ``SPRT.stats`` of the test under
+        'sprt' when one was run. Games already running when the test finished are
+        included in the summary but not in the test.
+
+    Raises:
+        ValueError: If ``games`` or ``batch_size`` is not positive, a spec is invalid
+            or the SPRT arguments are.
+    """
+    if games < 1 or batch_size < 1:
+        raise ValueError("games and batch_size must be positive")
+    specs = (player1, player2)
+    for spec in specs:
+        make_player(spec, "Check", 'white')
+    test = SPRT(**sprt) if sprt is not None else None
+    tasks = ((first, (specs, first, min(batch_size, games - first), seed, bearoff, buffered_dice))
+             for first in range(0, games, batch_size)
+             if test is None or test.get_result() is None)
+    totals = new_totals()
+    start = time.perf_counter()
+    batches = schedule(play_games, tasks, workers)
+    try:
+        for first, _, results in batches:
+            for offset, result in enumerate(results):
+                add_game(totals, result)
+                if test is not None:
+                    test.add(result[0] == 1, first + offset)
+            if test is not None and report and (
+                    test.get_result() is not None
+                    or totals['games'] // report_every != (totals['games'] - len(results)) // report_every):
+                report(format_sprt(test.stats()))
+            if test is not None and test.get_result() is not None:
+                break
+    finally:
+        batches.close()
+    summary = summarize(totals, specs, time.perf_counter() - start)
+    if test is not None:
+        summary['sprt'] = test.stats()
+    return summary
+
+
+def format_summary(summary: dict) -> List[str]:
+    """Formats a summary as report lines."""
+    lines = [
+        f"{summary['games']} games in {summary['seconds']:.1f}s: {summary['games_per_second']:.2f} games/s, "
+        f"{summary['average_turns']:.1f} turns per game",
+    ]
+    for player in summary['players']:
+        lines.append(
+            f"  {player['spec']:<20} wins {player['win_rate']:6.1%}  gammons {player['gammon_rate']:6.1%}  "
+            f"backgammons {player['backgammon_rate']:6.1%}  {player['points_per_game']:+.3f} "
+            f"(+-{(player['points_per_game_ci'][1] - player['points_per_game_ci'][0]) / 2:.3f}) ppg  "
+            f"{player['mean_decision_ms']:.2f} ms/decision"
+        )
+    if 'sprt' in summary:
+        lines.append("  " + format_sprt(summary['sprt']))
+    total = sum(summary['phase_seconds'].values()) or 1.0
+    lines.append("  time: " + ", ".join(
+        f"{phase} {seconds:.2f}s ({seconds / total:.0%})" for phase, seconds in summary['phase_seconds'].items()
+    ))
+    return lines
+
+
+def add_sprt_arguments(parser: argparse.ArgumentParser):
+    """Adds the SPRT options shared by the simulator and the tournament runner."""
+    parser.add_argument('--sprt', nargs=2, type=float, metavar=('ELO0', 'ELO1'),
+                        help="stop once an SPRT of ELO0 against ELO1 finishes")
+    parser.add_argument('--alpha', type=float, default=0.05, help="SPRT false positive rate (default: %(default)s)")
+    parser.add_argument('--beta', type=float, default=0.05, help="SPRT false negative rate (default: %(default)s)")
+
+
+def sprt_arguments(args: argparse.Namespace) -> Optional[dict]:
+    """Returns the ``SPRT`` arguments from parsed options, None without --sprt."""
+    if args.sprt is None:
+        return None
+    return {'elo0': args.sprt[0], 'elo1': args.sprt[1], 'alpha': args.alpha, 'beta': args.beta}
+
+
+def main(argv=None, report: Callable = print):
+    parser = argparse.ArgumentParser(description="Play headless AI-vs-AI games.")
+    parser.add_argument('--games', type=int, default=100, help="games to play (default: %(default)s)")
+    parser.add_argument('--player1', default='greedy', help="first AI spec (default: %(default)s)")
+    parser.add_argument('--player2', default='greedy', help="second AI spec (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0, help="dice seed")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes, 0 for the CPU count (default: 1)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="games per worker task")
+    parser.add_argument('--bearoff', default=BEAROFF_PATH, help="bear-off database (default: %(default)s)")
+    parser.add_argument('--no-bearoff', action='store_true', help="evaluate races without the database")
+    parser.add_argument('--buffered-dice', action='store_true', help="draw the dice in batches")
+    add_sprt_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        summary = simulate(args.games, args.player1, args.player2, args.seed, args.workers or None,
+                           args.batch_size, None if args.no_bearoff else args.bearoff,
+                           sprt_arguments(args), report, buffered_dice=args.buffered_dice)
+    except ValueError as error:
+        parser.error(str(error))
+    for line in format_summary(summary):
+        report(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Sequential probability ratio test for AI strength comparisons.
+
+Each game is a win or a loss for the candidate, so the test is Wald's SPRT on a
+Bernoulli variable: H0 says the candidate's Elo advantage is ``elo0``, H1 says it is
+``elo1``, and an Elo difference ``d`` means a per-game win probability of
+``1 / (1 + 10 ** (-d / 400))``. Gammons count as plain wins here. The log-likelihood
+ratio is updated after every game and the test stops as soon as it leaves
+``[log(beta / (1 - alpha)), log((1 - beta) / alpha)]``.
+"""
+import math
+from typing import Optional
+
+# Results of a finished test
+H0 = 'H0'
+H1 = 'H1'
+
+
+def win_probability(elo: float) -> float:
+    """Returns the per-game win probability of an Elo advantage."""
+    return 1.0 / (1.0 + 10.0 ** (-elo / 400.0))
+
+
+class SPRT:
+    """
+    Running SPRT for a candidate against a baseline.
+
+    Games finished out of order by parallel workers can be added with their index:
+    they are held back until every earlier game is in, so the test stops at the same
+    game however the games were scheduled.
+    """
+
+    def __init__(self, elo0: float = 0.0, elo1: float = 35.0, alpha: float = 0.05, beta: float = 0.05):
+        """
+        Initializes the test.
+
+        Args:
+            elo0 (float, optional): Elo advantage of the candidate under H0. Defaults to 0.
+            elo1 (float, optional): Elo advantage under H1. Defaults to 35.
+            alpha (float, optional): Chance of accepting H1 when H0 holds. Defaults to 0.05.
+            beta (float, optional): Chance of accepting H0 when H1 holds. Defaults to 0.05.
+
+        Raises:
+            ValueError: If elo1 is not above elo0 or alpha and beta are not in (0, 1).
+        """
+        if elo1 <= elo0:
+            raise ValueError("elo1 must be greater than elo0")
+        if not (0 < alpha < 1 and 0 < beta < 1):
+            raise ValueError("alpha and beta must be between 0 and 1")
+        self.__elo0__ = elo0
+        self.__elo1__ = elo1
+        self.__alpha__ = alpha
+        self.__beta__ = beta
+        p0, p1 = win_probability(elo0), win_probability(elo1)
+        self.__win_llr__ = math.log(p1 / p0)
+        self.__loss_llr__ = math.log((1.0 - p1) / (1.0 - p0))
+        self.__lower__ = math.log(beta / (1.0 - alpha))
+        self.__upper__ = math.log((1.0 - beta) / alpha)
+        self.__wins__ = 0
+        self.__losses__ = 0
+        self.__result__ = None
+        self.__next_index__ = 0
+        self.__waiting__ = {}
+
+    def add(self, won: bool, index: int = None) -> Optional[str]:
+        """
+        Adds a game. Games after the test has finished are ignored.
+
+        Args:
+            won (bool): Whether the candidate won.
+            index (int, optional): The game's number, counting from 0. Without it games
+                are taken in the order they are added.
+
+        Returns:
+            str or None: H0 or H1 once the test has finished, None while it goes on.
+        """
+        if index is None:
+            index = self.__next_index__
+        self.__waiting__[index] = won
+        while self.__next_index__ in self.__waiting__:
+            self._update(self.__waiting__.pop(self.__next_index__))
+            self.__next_index__ += 1
+        return self.__result__
+
+    def _update(self, won: bool):
+        """Updates the ratio with the next game in order."""
+        if self.__result__ is not None:
+            return
+        if won:
+            self.__wins__ += 1
+        else:
+            self.__losses__ += 1
+        llr = self.llr()
+        if llr >= self.__upper__:
+            self.__result__ = H1
+        elif llr <= self.__lower__:
+            self.__result__ = H0
+
+    def llr(self) -> float:
+        """Returns the log-likelihood ratio of H1 against H0."""
+        return self.__wins__ * self.__win_llr__ + self.__losses__ * self.__loss_llr__
+
+    def get_result(self) -> Optional[str]:
+        """Returns H0 or H1 once the test has finished, otherwise None."""
+        return self.__result__
+
+    def get_bounds(self) -> tuple:
+        """Returns the (lower, upper) LLR bounds."""
+        return (self.__lower__, self.__upper__)
+
+    def stats(self) -> dict:
+        """
+        Returns the state of the test.
+
+        Returns:
+            dict: elo0, elo1, alpha, beta, games, wins, losses, llr, lower, upper and result.
+        """
+        return {
+            'elo0': self.__elo0__,
+            'elo1': self.__elo1__,
+            'alpha': self.__alpha__,
+            'beta': self.__beta__,
+            'games': self.__wins__ + self.__losses__,
+            'wins': self.__wins__,
+            'losses': self.__losses__,
+            'llr': self.llr(),
+            'lower': self.__lower__,
+            'upper': self.__upper__,
+            'result': self.__result__,
+        }
+
+
+def format_sprt(stats: dict) -> str:
+    """Formats ``SPRT.stats`` as a one-line report."""
+    verdict = f"{stats['result']} accepted" if stats['result'] else "running"
+    return (f"SPRT elo0={stats['elo0']:g} elo1={stats['elo1']:g}: LLR {stats['llr']:+.2f} "
+            f"[{stats['lower']:+.2f}, {stats['upper']:+.2f}] after {stats['games']} games, {verdict}")
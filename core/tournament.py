@@ -0,0 +1,274 @@
+"""
+Round-robin AI tournaments.
+
+Every pair of entrants plays the same number of games, swapping colors every game,
+with the games spread over a process pool. Each finished game is appended to a JSONL
+file right away and only running totals are kept in memory, so a tournament of any
+length runs in constant memory. Restarting with the same results file skips the
+games already recorded, which resumes a crashed or interrupted run.
+
+    python -m core.tournament --players greedy search:1 search:2 --games 200 \\
+        --results results.jsonl --workers 4
+
+Entrants are the player specs of ``core.simulate``. Game ``i`` of a pair rolls
+``Dice(seed=f"{seed}:{player1}:{player2}:{i}")``, so results do not depend on the
+scheduling.
+
+With ``--sprt ELO0 ELO1`` every pair runs a sequential test of its later entrant
+against the earlier one, and a pair stops being scheduled as soon as its test
+finishes. ``--games`` is then the most games a pair plays.
+"""
+import argparse
+import itertools
+import json
+import os
+import time
+from typing import Callable, Iterator, List, Optional
+from .bearoff import DEFAULT_PATH as BEAROFF_PATH
+from .rollout import schedule
+from .simulate import (make_player, play_games, new_totals, add_game, summarize, confidence_interval,
+                       add_sprt_arguments, sprt_arguments)
+from .sprt import SPRT, format_sprt
+
+DEFAULT_BATCH_SIZE = 4
+
+
+def load_results(path: str) -> List[dict]:
+    """
+    Reads the games recorded in a results file.
+
+    A last line cut short by a crash is dropped from the file, so appending new games
+    leaves it valid.
+
+    Args:
+        path (str): The JSONL file. A missing file has no games.
+
+    Returns:
+        List[dict]: The game records.
+    """
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, 'rb+') as handle:
+        valid = 0
+        for line in handle:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+            valid += len(line)
+        handle.truncate(valid)
+    return records
+
+
+def _record(pair: tuple, index: int, result: tuple) -> dict:
+    """Turns a ``play_game`` result into a JSONL record."""
+    winner, points, turns, phases, decisions, thinking = result
+    return {
+        'player1': pair[0], 'player2': pair[1], 'game': index,
+        'winner': winner, 'points': points, 'turns': turns,
+        'phase_seconds': phases, 'decisions': decisions, 'decision_seconds': thinking,
+    }
+
+
+def _result(record: dict) -> tuple:
+    """Turns a JSONL record back into a ``play_game`` result."""
+    return (record['winner'], record['points'], record['turns'], record['phase_seconds'],
+            record['decisions'], record['decision_seconds'])
+
+
+def _tasks(pair: tuple, missing: List[int], seed: int, batch_size: int, bearoff: Optional[str]) -> Iterator:
+    """Groups the missing games of a pair into runs of consecutive games, at most ``batch_size`` long."""
+    for _, run in itertools.groupby(enumerate(missing), key=lambda item: item[1] - item[0]):
+        indices = [index for _, index in run]
+        for start in range(0, len(indices), batch_size):
+            chunk = indices[start:start + batch_size]
+            yield (pair, (pair, chunk[0], len(chunk), f"{seed}:{pair[0]}:{pair[1]}", bearoff))
+
+
+def standings(totals: dict, entrants: List[str]) -> List[dict]:
+    """
+    Sums the pair totals per entrant.
+
+    Returns:
+        List[dict]: Per entrant, best first by points per game: spec, games, wins, win_rate,
+        win_rate_ci, gammon_rate, backgammon_rate, points_per_game, points_per_game_ci
+        and mean_decision_ms.
+    """
+    table = []
+    for spec in entrants:
+        games = wins = gammons = backgammons = points = squares = decisions = 0
+        seconds = 0.0
+        for pair, pair_totals in totals.items():
+            if spec not in pair:
+                continue
+            index = pair.index(spec)
+            games += pair_totals['games']
+            wins += pair_totals['wins'][index]
+            gammons += pair_totals['gammons'][index]
+            backgammons += pair_totals['backgammons'][index]
+            points += pair_totals['points'][index]
+            squares += pair_totals['points_squared']
+            decisions += pair_totals['decisions'][index]
+            seconds += pair_totals['decision_seconds'][index]
+        table.append({
+            'spec': spec,
+            'games': games,
+            'wins': wins,
+            'win_rate': wins / games if games else 0.0,
+            'win_rate_ci': confidence_interval(wins, wins, games),
+            'gammon_rate': gammons / games if games else 0.0,
+            'backgammon_rate': backgammons / games if games else 0.0,
+            'points_per_game': points / games if games else 0.0,
+            'points_per_game_ci': confidence_interval(points, squares, games),
+            'mean_decision_ms': 1000 * seconds / decisions if decisions else 0.0,
+        })
+    table.sort(key=lambda row: row['points_per_game'], reverse=True)
+    return table
+
+
+def run_tournament(entrants: List[str], games: int, results: str = None, workers: int = 1, seed: int = 0,
+                   batch_size: int = DEFAULT_BATCH_SIZE, bearoff: Optional[str] = BEAROFF_PATH,
+                   report: Optional[Callable] = print, report_every: int = 100, sprt: dict = None) -> dict:
+    """
+    Plays a round-robin tournament.
+
+    Args:
+        entrants (List[str]): Distinct player specs, at least two.
+        games (int): Games per pair.
+        results (str, optional): JSONL file the games are streamed to and resumed from.
+        workers (int, optional): Worker processes, None for the CPU count. Defaults to 1,
+            which plays in this process.
+        seed (int, optional): Seed of the dice.
+        batch_size (int, optional): Games per task sent to a worker. Defaults to 4.
+        bearoff (str, optional): Bear-off database for the evaluators. None disables it.
+        report (Callable, optional): Receives progress lines. Defaults to ``print``, None is quiet.
+        report_every (int, optional): Games between progress lines. Defaults to 100.
+        sprt (dict, optional): Arguments of ``SPRT`` (elo0, elo1, alpha, beta) for a test
+            per pair, the later entrant being the candidate.
+
+    Returns:
+        dict: games (in total), run_games (played by this run), seconds, games_per_second,
+        pairs (the ``simulate.summarize`` summary of each pair, with the ``SPRT.stats``
+        of its test under 'sprt') and standings.
+
+    Raises:
+        ValueError: If the entrants are not distinct valid specs, ``games`` or
+            ``batch_size`` is not positive, or the SPRT arguments are invalid.
+    """
+    if len(entrants) < 2 or len(set(entrants)) != len(entrants):
+        raise ValueError("a tournament needs at least two distinct entrants")
+    if games < 1 or batch_size < 1:
+        raise ValueError("games and batch_size must be positive")
+    for spec in entrants:
+        make_player(spec, "Check", 'white')
+
+    pairs = list(itertools.combinations(entrants, 2))
+    totals = {pair: new_totals() for pair in pairs}
+    tests = {pair: SPRT(**sprt) for pair in pairs} if sprt is not None else {}
+    played = {pair: set() for pair in pairs}
+    for record in load_results(results) if results else []:
+        pair = (record['player1'], record['player2'])
+        if pair in totals and record['game'] < games and record['game'] not in played[pair]:
+            add_game(totals[pair], _result(record))
+            played[pair].add(record['game'])
+            if tests:
+                tests[pair].add(record['winner'] == 1, record['game'])
+    resumed = sum(len(indices) for indices in played.values())
+    if report and resumed:
+        report(f"Resuming with {resumed} games from {results}")
+
+    tasks = itertools.chain.from_iterable(
+        _tasks(pair, [index for index in range(games) if index not in played[pair]], seed, batch_size, bearoff)
+        for pair in pairs
+    )
+    # Checked as each task is submitted, so a pair stops as soon as its test finishes
+    tasks = (item for item in tasks if not tests or tests[item[0]].get_result() is None)
+    output = open(results, 'a', encoding='utf-8') if results else None
+    start = time.perf_counter()
+    run_games = 0
+    try:
+        for pair, task, batch in schedule(play_games, tasks, workers):
+            first = task[1]
+            decided = tests and tests[pair].get_result() is not None
+            for offset, result in enumerate(batch):
+                add_game(totals[pair], result)
+                if tests:
+                    tests[pair].add(result[0] == 1, first + offset)
+                if output:
+                    output.write(json.dumps(_record(pair, first + offset, result)) + '\n')
+            if output:
+                output.flush()
+            run_games += len(batch)
+            if report and tests and not decided and tests[pair].get_result() is not None:
+                report(f"{pair[0]} vs {pair[1]}: {format_sprt(tests[pair].stats())}")
+            if report and run_games // report_every != (run_games - len(batch)) // report_every:
+                leader = standings(totals, entrants)[0]
+                line = (f"{resumed + run_games}/{games * len(pairs)} games, leader {leader['spec']} "
+                        f"{leader['points_per_game']:+.3f} ppg")
+                if tests:
+                    line += f", {pair[0]} vs {pair[1]} LLR {tests[pair].llr():+.2f}"
+                report(line)
+    finally:
+        if output:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    summaries = []
+    for pair in pairs:
+        summaries.append(summarize(totals[pair], pair, elapsed))
+        if tests:
+            summaries[-1]['sprt'] = tests[pair].stats()
+    return {
+        'games': resumed + run_games,
+        'run_games': run_games,
+        'seconds': elapsed,
+        'games_per_second': run_games / elapsed if elapsed else 0.0,
+        'pairs': summaries,
+        'standings': standings(totals, entrants),
+    }
+
+
+def format_standings(summary: dict) -> List[str]:
+    """Formats the standings of a tournament as report lines."""
+    lines = [f"{summary['games']} games, {summary['games_per_second']:.2f} games/s this run"]
+    for rank, row in enumerate(summary['standings'], start=1):
+        low, high = row['win_rate_ci']
+        lines.append(
+            f"{rank:>2}. {row['spec']:<20} {row['points_per_game']:+.3f} ppg  wins {row['win_rate']:6.1%} "
+            f"[{low:.1%}, {high:.1%}]  gammons {row['gammon_rate']:6.1%}  {row['mean_decision_ms']:.2f} ms/decision"
+        )
+    for pair in summary['pairs']:
+        first, second = pair['players']
+        lines.append(f"    {first['spec']} vs {second['spec']}: {first['wins']}-{second['wins']} "
+                     f"({first['points_per_game']:+.3f} ppg)")
+        if 'sprt' in pair:
+            lines.append(f"      {format_sprt(pair['sprt'])}")
+    return lines
+
+
+def main(argv=None, report: Callable = print):
+    parser = argparse.ArgumentParser(description="Play a round-robin AI tournament.")
+    parser.add_argument('--players', nargs='+', required=True, help="entrant specs, see core.simulate")
+    parser.add_argument('--games', type=int, default=100, help="games per pair (default: %(default)s)")
+    parser.add_argument('--results', default='results.jsonl', help="JSONL results file (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=0, help="worker processes, 0 for the CPU count (default: 0)")
+    parser.add_argument('--seed', type=int, default=0, help="dice seed")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="games per worker task")
+    parser.add_argument('--no-bearoff', action='store_true', help="evaluate races without the bear-off database")
+    add_sprt_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        summary = run_tournament(args.players, args.games, args.results, args.workers or None, args.seed,
+                                 args.batch_size, None if args.no_bearoff else BEAROFF_PATH, report,
+                                 sprt=sprt_arguments(args))
+    except ValueError as error:
+        parser.error(str(error))
+    for line in format_standings(summary):
+        report(line)
+
+
+if __name__ == '__main__':
+    main()
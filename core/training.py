@@ -0,0 +1,383 @@
+"""
+TD(lambda) self-play training for the neural evaluator.
+
+Worker processes play headless games against themselves with the current network
+and stream each game back as a trajectory of positions plus the final result. The
+learner, in the main process, updates the weights after every game and publishes
+them to the workers through shared memory every few games. Training state is
+checkpointed to an ``.npz`` file that ``NeuralEvaluator.load`` reads directly, and
+an interrupted run resumes from it.
+
+Workers only send complete games, so the learner uses the forward view of TD(lambda):
+the lambda-returns of a game are computed from the network's current predictions and
+the whole game is then trained in one batch.
+
+    python -m core.training --games 10000 --workers 4 --checkpoint weights.npz
+"""
+import argparse
+import multiprocessing
+import os
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Callable, Optional
+import numpy as np
+from .board import Board
+from .player import Player
+from .dice import Dice
+from .movegen import apply_play
+from .movetables import WHITE, BLACK
+from .neural import NeuralEvaluator, encode_batch, OUT_WIN, OUT_GAMMON, OUT_LOSE_GAMMON, DEFAULT_HIDDEN
+from .rollout import choose_play, expand_roll, game_points, GAMMON
+
+DEFAULT_ALPHA = 0.1
+DEFAULT_LAMBDA = 0.7
+WEIGHT_NAMES = ('hidden_weights', 'hidden_bias', 'output_weights', 'output_bias')
+
+
+def flip(values: np.ndarray) -> np.ndarray:
+    """Turns (win, win gammon, lose gammon) rows into the opponent's view."""
+    flipped = np.empty_like(values)
+    flipped[..., OUT_WIN] = 1.0 - values[..., OUT_WIN]
+    flipped[..., OUT_GAMMON] = values[..., OUT_LOSE_GAMMON]
+    flipped[..., OUT_LOSE_GAMMON] = values[..., OUT_GAMMON]
+    return flipped
+
+
+def lambda_returns(predictions: np.ndarray, final: np.ndarray, lam: float) -> np.ndarray:
+    """
+    Computes the lambda-returns of a game.
+
+    Args:
+        predictions (np.ndarray): T x 3 predictions for the positions of the game, all in one view.
+        final (np.ndarray): The result of the game in the same view.
+        lam (float): The trace decay.
+
+    Returns:
+        np.ndarray: T x 3 targets. The last position's target is the result, every earlier
+        one mixes the next prediction and the next target.
+    """
+    targets = np.empty_like(predictions)
+    following = final
+    for t in range(len(predictions) - 1, -1, -1):
+        targets[t] = following
+        following = (1.0 - lam) * predictions[t] + lam * following
+    return targets
+
+
+def td_update(network: NeuralEvaluator, inputs: np.ndarray, targets: np.ndarray, alpha: float) -> float:
+    """
+    Moves the network's outputs for ``inputs`` towards ``targets``.
+
+    Uses the cross-entropy gradient of the sigmoid outputs, so the output error is
+    applied without the sigmoid derivative.
+
+    Args:
+        network (NeuralEvaluator): Updated in place.
+        inputs (np.ndarray): N x INPUTS encoded positions.
+        targets (np.ndarray): N x 3 targets.
+        alpha (float): The learning rate.
+
+    Returns:
+        float: The mean squared error before the update.
+    """
+    weights = network.get_weights()
+    hidden, outputs = network.forward(inputs)
+    error = targets - outputs
+    hidden_error = (error @ weights['output_weights'].T) * hidden * (1.0 - hidden)
+    weights['output_weights'] += alpha * (hidden.T @ error)
+    weights['output_bias'] += alpha * error.sum(axis=0)
+    weights['hidden_weights'] += alpha * (inputs.T @ hidden_error)
+    weights['hidden_bias'] += alpha * hidden_error.sum(axis=0)
+    return float((error ** 2).mean())
+
+
+def play_game(network: NeuralEvaluator, dice: Dice) -> tuple:
+    """
+    Plays one self-play game with the 1-ply policy of ``network``.
+
+    Args:
+        network (NeuralEvaluator): The evaluator of both sides.
+        dice (Dice): The dice of the game.
+
+    Returns:
+        tuple: The cells (T x 26 int8 bytes), off counts (T x 2) and side on roll of every
+        position before a roll, the winner and the points won.
+    """
+    board = Board(Player("White", "white"), Player("Black", "black"))
+    cells, off, sides = [], [], []
+    mover = WHITE
+    while not board.is_game_over():
+        cells.append(board.get_cells().tobytes())
+        off.append(board.get_off_counts())
+        sides.append(mover)
+        apply_play(board, mover, choose_play(board, mover, expand_roll(*dice.roll()), network))
+        mover = 1 - mover
+    winner = WHITE if board.get_off_counts()[WHITE] == 15 else BLACK
+    return b''.join(cells), off, sides, winner, game_points(board, winner)
+
+
+def learn_game(network: NeuralEvaluator, trajectory: tuple, alpha: float, lam: float) -> float:
+    """
+    Trains the network on one game.
+
+    Args:
+        network (NeuralEvaluator): Updated in place.
+        trajectory (tuple): As returned by ``play_game``.
+        alpha (float): The learning rate, per position.
+        lam (float): The trace decay.
+
+    Returns:
+        float: The mean squared error of the game's positions before the update.
+    """
+    cells, off, sides, winner, points = trajectory
+    cells = np.frombuffer(cells, dtype=np.int8).reshape(-1, 26)
+    sides = np.asarray(sides)
+    inputs = encode_batch(cells, off, sides)
+    predictions = network.evaluate_batch(inputs)
+    # Work in white's view, so consecutive positions are comparable
+    black = sides == BLACK
+    predictions[black] = flip(predictions[black])
+    final = np.array([1.0, float(points >= GAMMON), 0.0])
+    if winner == BLACK:
+        final = flip(final)
+    targets = lambda_returns(predictions, final, lam)
+    targets[black] = flip(targets[black])
+    return td_update(network, inputs, targets, alpha)
+
+
+class WeightBroadcast:
+    """
+    Network weights in shared memory, published by the learner and read by the workers.
+
+    The block holds a version number followed by the flattened weights. A lock keeps
+    readers from seeing half-written weights.
+    """
+
+    def __init__(self, hidden: int, name: str = None, lock=None):
+        """
+        Creates the shared block, or attaches to an existing one when ``name`` is given.
+
+        Args:
+            hidden (int): Hidden units of the network.
+            name (str, optional): Name of an existing block.
+            lock (multiprocessing.Lock, optional): Lock shared with the other processes.
+        """
+        template = NeuralEvaluator(hidden=hidden, seed=None).get_weights()
+        self.__shapes__ = [(name_, template[name_].shape) for name_ in WEIGHT_NAMES]
+        size = sum(int(np.prod(shape)) for _, shape in self.__shapes__)
+        self.__owner__ = name is None
+        if self.__owner__:
+            self.__memory__ = shared_memory.SharedMemory(create=True, size=8 * (size + 1))
+        else:
+            self.__memory__ = shared_memory.SharedMemory(name=name)
+        self.__buffer__ = np.ndarray((size + 1,), dtype=np.float64, buffer=self.__memory__.buf)
+        self.__lock__ = lock if lock is not None else multiprocessing.Lock()
+        if self.__owner__:
+            self.__buffer__[0] = 0
+
+    def get_name(self) -> str:
+        """Returns the name workers attach with."""
+        return self.__memory__.name
+
+    def get_lock(self):
+        """Returns the lock guarding the block."""
+        return self.__lock__
+
+    def version(self) -> int:
+        """Returns how many times weights were published."""
+        return int(self.__buffer__[0])
+
+    def publish(self, network: NeuralEvaluator):
+        """Copies the network's weights into the block and bumps the version."""
+        weights = network.get_weights()
+        with self.__lock__:
+            start = 1
+            for name, shape in self.__shapes__:
+                end = start + int(np.prod(shape))
+                self.__buffer__[start:end] = weights[name].ravel()
+                start = end
+            self.__buffer__[0] += 1
+
+    def read(self) -> dict:
+        """Returns a copy of the published weights."""
+        with self.__lock__:
+            weights, start = {}, 1
+            for name, shape in self.__shapes__:
+                end = start + int(np.prod(shape))
+                weights[name] = self.__buffer__[start:end].reshape(shape).copy()
+                start = end
+        return weights
+
+    def close(self):
+        """Detaches, and frees the block if this process created it."""
+        del self.__buffer__
+        self.__memory__.close()
+        if self.__owner__:
+            self.__memory__.unlink()
+
+
+def _worker(name: str, hidden: int, lock, results, stop, seed: str):
+    """
+    Worker process: plays games with the latest published weights until told to stop.
+
+    Args:
+        name (str): Shared memory block of the weights.
+        hidden (int): Hidden units of the network.
+        lock: Lock of the shared block.
+        results (multiprocessing.Queue): Receives the trajectories.
+        stop (multiprocessing.Event): Set by the learner to end the worker.
+        seed (str): Seed of the worker's dice.
+    """
+    broadcast = WeightBroadcast(hidden, name=name, lock=lock)
+    network = NeuralEvaluator(hidden=hidden, seed=None)
+    dice = Dice(seed=seed)
+    version = -1
+    try:
+        while not stop.is_set():
+            if broadcast.version() != version:
+                version = broadcast.version()
+                network.set_weights(broadcast.read())
+            trajectory = play_game(network, dice)
+            while not stop.is_set():
+                try:
+                    results.put(trajectory, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+    finally:
+        broadcast.close()
+
+
+def load_checkpoint(path: str, hidden: int = DEFAULT_HIDDEN, seed: int = 0) -> tuple:
+    """
+    Loads a training checkpoint, or starts a new network if there is none.
+
+    Args:
+        path (str): The checkpoint file.
+        hidden (int, optional): Hidden units of a new network.
+        seed (int, optional): Seed of a new network's weights.
+
+    Returns:
+        tuple: The network and the number of games already trained.
+    """
+    if path and os.path.exists(path):
+        with np.load(path) as data:
+            games = int(data['games']) if 'games' in data.files else 0
+            return NeuralEvaluator(weights={name: data[name] for name in WEIGHT_NAMES}), games
+    return NeuralEvaluator(hidden=hidden, seed=seed), 0
+
+
+def save_checkpoint(path: str, network: NeuralEvaluator, games: int):
+    """Writes a checkpoint atomically, so an interruption never leaves a broken file."""
+    temporary = path + '.tmp.npz'
+    np.savez(temporary, games=np.array(games), **network.get_weights())
+    os.replace(temporary, path)
+
+
+def train(games: int, checkpoint: str = None, workers: int = None, hidden: int = DEFAULT_HIDDEN,
+          alpha: float = DEFAULT_ALPHA, lam: float = DEFAULT_LAMBDA, seed: int = 0,
+          broadcast_every: int = 10, checkpoint_every: int = 500, report_every: int = 100,
+          report: Optional[Callable] = print) -> dict:
+    """
+    Trains the network by self-play.
+
+    Args:
+        games (int): Games to train in this run.
+        checkpoint (str, optional): Checkpoint file, resumed from when it exists.
+        workers (int, optional): Self-play processes. Defaults to the CPU count.
+        hidden (int, optional): Hidden units of a new network. Defaults to 40.
+        alpha (float, optional): Learning rate per position. Defaults to 0.1.
+        lam (float, optional): Trace decay. Defaults to 0.7.
+        seed (int, optional): Seed of the initial weights and the workers' dice.
+        broadcast_every (int, optional): Games between weight publications. Defaults to 10.
+        checkpoint_every (int, optional): Games between checkpoints. Defaults to 500.
+        report_every (int, optional): Games between progress reports. Defaults to 100.
+        report (Callable, optional): Receives the progress lines. Defaults to ``print``, None is quiet.
+
+    Returns:
+        dict: games (total trained), run_games, seconds, games_per_second, positions_per_second
+        and the network.
+    """
+    network, done = load_checkpoint(checkpoint, hidden, seed)
+    hidden = network.get_hidden()
+    workers = workers or os.cpu_count()
+    broadcast = WeightBroadcast(hidden)
+    broadcast.publish(network)
+    results = multiprocessing.Queue(maxsize=4 * workers)
+    stop = multiprocessing.Event()
+    processes = [
+        multiprocessing.Process(
+            target=_worker,
+            args=(broadcast.get_name(), hidden, broadcast.get_lock(), results, stop, f"{seed}:{done}:{index}"),
+            daemon=True,
+        )
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    start = time.perf_counter()
+    trained = positions = 0
+    error = 0.0
+    try:
+        while trained < games:
+            trajectory = results.get()
+            error += learn_game(network, trajectory, alpha, lam)
+            trained += 1
+            positions += len(trajectory[2])
+            if trained % broadcast_every == 0:
+                broadcast.publish(network)
+            if checkpoint and trained % checkpoint_every == 0:
+                save_checkpoint(checkpoint, network, done + trained)
+            if report and trained % report_every == 0:
+                elapsed = time.perf_counter() - start
+                report(f"{done + trained} games  {trained / elapsed:.1f} games/s  "
+                       f"{positions / elapsed:.0f} positions/s  error {error / report_every:.4f}")
+                error = 0.0
+    finally:
+        stop.set()
+        # Drain the queue so workers blocked on it can see the stop flag
+        while any(process.is_alive() for process in processes):
+            try:
+                results.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        for process in processes:
+            process.join()
+        if checkpoint:
+            save_checkpoint(checkpoint, network, done + trained)
+        broadcast.close()
+
+    elapsed = time.perf_counter() - start
+    return {
+        'games': done + trained,
+        'run_games': trained,
+        'seconds': elapsed,
+        'games_per_second': trained / elapsed if elapsed else 0.0,
+        'positions_per_second': positions / elapsed if elapsed else 0.0,
+        'network': network,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the neural evaluator by TD(lambda) self-play.")
+    parser.add_argument('--games', type=int, default=10000, help="games to train (default: %(default)s)")
+    parser.add_argument('--checkpoint', default='weights.npz', help="checkpoint file (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=None, help="self-play processes (default: CPU count)")
+    parser.add_argument('--hidden', type=int, default=DEFAULT_HIDDEN, help="hidden units of a new network")
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA, help="learning rate")
+    parser.add_argument('--lam', type=float, default=DEFAULT_LAMBDA, help="trace decay")
+    parser.add_argument('--seed', type=int, default=0, help="seed of new weights and the dice")
+    args = parser.parse_args(argv)
+    try:
+        stats = train(args.games, args.checkpoint, args.workers, args.hidden, args.alpha, args.lam, args.seed)
+    except KeyboardInterrupt:
+        print("Interrupted, progress saved to", args.checkpoint)
+        return
+    print(f"Trained {stats['run_games']} games ({stats['games']} in total) "
+          f"at {stats['games_per_second']:.1f} games/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+from array import array
+
+# Bound types of stored values
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# key (8 bytes) + value (8 bytes) + depth (1 byte) + flag (1 byte)
+BYTES_PER_SLOT = 18
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table for the AI search.
+
+    Memory is allocated once as flat arrays sized from a byte budget. Each bucket
+    holds two slots: a depth-preferred slot that only gives way to searches at
+    least as deep, and an always-replace slot for everything else, so deep results
+    survive while recent shallow ones still get cached.
+    """
+
+    def __init__(self, budget_bytes: int = 8 * 1024 * 1024):
+        """
+        Initializes the table.
+
+        Args:
+            budget_bytes (int, optional): Memory budget for the entries. Defaults to 8 MiB.
+
+        Raises:
+            ValueError: If the budget is too small for a single bucket.
+        """
+        buckets = budget_bytes // (2 * BYTES_PER_SLOT)
+        if buckets < 1:
+            raise ValueError("Budget too small for a transposition table")
+        self.__buckets__ = buckets
+        self.__keys__ = array('Q', bytes(8 * 2 * buckets))
+        self.__values__ = array('d', bytes(8 * 2 * buckets))
+        self.__depths__ = array('b', [-1]) * (2 * buckets)
+        self.__flags__ = array('b', bytes(2 * buckets))
+        self.__probes__ = 0
+        self.__hits__ = 0
+        self.__stores__ = 0
+        self.__overwrites__ = 0
+
+    def probe(self, key: int, depth: int, alpha: float, beta: float):
+        """
+        Looks up a position.
+
+        Args:
+            key (int): 64-bit position key.
+            depth (int): Depth the caller needs.
+            alpha (float): Lower bound of the caller's window.
+            beta (float): Upper bound of the caller's window.
+
+        Returns:
+            float or None: A value that answers the search at this window, or None.
+        """
+        self.__probes__ += 1
+        slot = 2 * (key % self.__buckets__)
+        for index in (slot, slot + 1):
+            if self.__keys__[index] == key and self.__depths__[index] >= depth:
+                value = self.__values__[index]
+                flag = self.__flags__[index]
+                if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+                    self.__hits__ += 1
+                    return value
+        return None
+
+    def store(self, key: int, depth: int, value: float, flag: int):
+        """
+        Stores a search result.
+
+        Args:
+            key (int): 64-bit position key.
+            depth (int): Depth the value was searched to.
+            value (float): The value found.
+            flag (int): EXACT, LOWER (value is a lower bound) or UPPER (value is an upper bound).
+        """
+        self.__stores__ += 1
+        keys, depths = self.__keys__, self.__depths__
+        slot = 2 * (key % self.__buckets__)
+        if keys[slot] == key:
+            if depth < depths[slot]:
+                # Keep the deeper result for this position
+                return
+            index = slot
+        elif depth >= depths[slot]:
+            if depths[slot] >= 0:
+                # Demote the old deep entry to the always-replace slot
+                if depths[slot + 1] >= 0 and keys[slot + 1] != key:
+                    self.__overwrites__ += 1
+                self._write(slot + 1, keys[slot], depths[slot], self.__values__[slot], self.__flags__[slot])
+            index = slot
+        else:
+            index = slot + 1
+            if depths[index] >= 0 and keys[index] != key:
+                self.__overwrites__ += 1
+        self._write(index, key, depth, value, flag)
+
+    def _write(self, index: int, key: int, depth: int, value: float, flag: int):
+        """Writes one slot."""
+        self.__keys__[index] = key
+        self.__depths__[index] = depth
+        self.__values__[index] = value
+        self.__flags__[index] = flag
+
+    def clear(self):
+        """Empties the table and resets the counters."""
+        size = 2 * self.__buckets__
+        self.__depths__ = array('b', [-1]) * size
+        self.__probes__ = self.__hits__ = self.__stores__ = self.__overwrites__ = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the table statistics.
+
+        Returns:
+            dict: slots, probes, hits, stores and overwrites (valid entries lost to replacement).
+        """
+        return {
+            'slots': 2 * self.__buckets__,
+            'probes': self.__probes__,
+            'hits': self.__hits__,
+            'stores': self.__stores__,
+            'overwrites': self.__overwrites__,
+        }
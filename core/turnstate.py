@@ -0,0 +1,107 @@
+"""
+Whose turn it is, which dice are left and how many turns have been played.
+
+``Game`` owns the one ``TurnState`` of a game and changes it as the game goes on.
+The board and the dice hold the same object, so there is a single answer to
+"who is on turn with which dice" however the game is driven. Search code that
+plays turns in place can ``snapshot`` it and ``restore`` it afterwards.
+"""
+from .movetables import WHITE
+
+
+class TurnState:
+    """
+    The side to move, its remaining dice and the turn number.
+
+    The remaining dice are kept in one list that is changed in place, so
+    ``get_dice`` always reflects the dice played so far this turn.
+    """
+
+    def __init__(self, side: int = WHITE, dice=(), turn: int = 1):
+        """
+        Initializes the turn state.
+
+        Args:
+            side (int, optional): The side to move, WHITE or BLACK. Defaults to WHITE.
+            dice (Iterable[int], optional): The dice left to play. Defaults to none.
+            turn (int, optional): The number of the current turn, counting from 1. Defaults to 1.
+        """
+        self.__side__ = side
+        self.__dice__ = list(dice)
+        self.__turn__ = turn
+
+    def get_side(self) -> int:
+        """Returns the side to move, WHITE or BLACK."""
+        return self.__side__
+
+    def get_dice(self) -> list:
+        """
+        Returns the dice left to play this turn.
+
+        Returns:
+            list[int]: The dice, four of a kind after doubles. Treat it as read-only.
+        """
+        return self.__dice__
+
+    def get_turn(self) -> int:
+        """Returns the number of the current turn, counting from 1."""
+        return self.__turn__
+
+    def set_side(self, side: int):
+        """Gives the turn to ``side`` without starting a new turn, e.g. after the opening roll."""
+        self.__side__ = side
+
+    def set_dice(self, values):
+        """
+        Replaces the dice left to play.
+
+        Args:
+            values (Iterable[int]): The new dice.
+        """
+        self.__dice__[:] = values
+
+    def use_die(self, value: int):
+        """
+        Removes a die after it has been played.
+
+        Args:
+            value (int): The die value.
+
+        Raises:
+            ValueError: If the value is not among the remaining dice.
+        """
+        if value not in self.__dice__:
+            raise ValueError(f"Die value {value} not available in {self.__dice__}")
+        self.__dice__.remove(value)
+
+    def pass_turn(self):
+        """Gives the turn to the other side, drops any dice left and counts the new turn."""
+        self.__side__ = 1 - self.__side__
+        self.__dice__.clear()
+        self.__turn__ += 1
+
+    def snapshot(self) -> tuple:
+        """
+        Returns the state as a tuple that ``restore`` can bring back.
+
+        Returns:
+            tuple: (side, dice, turn) with the dice as a tuple.
+        """
+        return (self.__side__, tuple(self.__dice__), self.__turn__)
+
+    def restore(self, snapshot: tuple):
+        """
+        Brings back a state returned by ``snapshot``.
+
+        Args:
+            snapshot (tuple): The (side, dice, turn) tuple.
+        """
+        self.__side__, dice, self.__turn__ = snapshot
+        self.__dice__[:] = dice
+
+    def copy(self) -> 'TurnState':
+        """Returns an independent copy."""
+        return TurnState(self.__side__, self.__dice__, self.__turn__)
+
+    def __repr__(self):
+        return f"TurnState(side={self.__side__}, dice={self.__dice__}, turn={self.__turn__})"
@@ -0,0 +1,48 @@
+import random
+
+# Signed cell values range from -15 (all black) to 15 (all white)
+VALUES_PER_CELL = 31
+NUM_CELLS = 26
+
+# Keys come from a fixed seed so every process computes the same hashes
+_rng = random.Random(0x5EED_BAC6)
+
+# CELL_KEYS[cell * VALUES_PER_CELL + value + 15] is the key of ``value`` on ``cell``.
+# Empty cells get key 0 so a fresh board only mixes in the occupied cells.
+CELL_KEYS = [
+    0 if value == 0 else _rng.getrandbits(64)
+    for _ in range(NUM_CELLS)
+    for value in range(-15, 16)
+]
+
+# OFF_KEYS[side][count] is the key of ``count`` checkers borne off by ``side``
+OFF_KEYS = [[0] + [_rng.getrandbits(64) for _ in range(15)] for _ in range(2)]
+
+# Mixed in while black is the side to move
+SIDE_KEY = _rng.getrandbits(64)
+
+
+def cell_key(cell: int, value: int) -> int:
+    """Returns the key of a signed checker count on a cell."""
+    return CELL_KEYS[cell * VALUES_PER_CELL + value + 15]
+
+
+def compute_hash(cells, off, black_to_move: bool) -> int:
+    """
+    Computes a position hash from scratch.
+
+    Args:
+        cells (array): The 26 signed cell counts.
+        off (list): Checkers borne off per side.
+        black_to_move (bool): Whether black is the side to move.
+
+    Returns:
+        int: The 64-bit position hash.
+    """
+    value = 0
+    for cell, count in enumerate(cells):
+        value ^= CELL_KEYS[cell * VALUES_PER_CELL + count + 15]
+    value ^= OFF_KEYS[0][off[0]] ^ OFF_KEYS[1][off[1]]
+    if black_to_move:
+        value ^= SIDE_KEY
+    return value
@@ -2,11 +2,12 @@ import pygame
 import sys
 import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from core.game import Game
+from core.game import Game, NO_PLAY
 from core.player import Player
 from core.ai import AIPlayer
 from core.checkers import Checkers
@@ -33,6 +34,10 @@ POINT_WIDTH = BOARD_WIDTH / 13
 POINT_HEIGHT = BOARD_HEIGHT / 2.5
 CHECKER_RADIUS = int(POINT_WIDTH / 2.2)
 
+# AI turns: the search runs on a worker thread while the board keeps being drawn
+AI_MIN_DISPLAY_MS = 1000  # Minimum time the AI's dice stay on screen before it moves
+AI_TIME_BUDGET_MS = 3000  # Thinking time for AIs that search
+
 class BackgammonUI:
     def __init__(self, screen):
         self.screen = screen
@@ -63,6 +68,7 @@ class BackgammonUI:
         self.message = None
         self.message_timer = 0
         self.ai_turn_timer = None
+        self.ai_future = None
 
     def draw_board(self):
         pygame.draw.rect(self.screen, BOARD_COLOR, (BOARD_LEFT, BOARD_TOP, BOARD_WIDTH, BOARD_HEIGHT))
@@ -233,13 +239,19 @@ class BackgammonUI:
                 self.game = Game([p1, p2])
                 self.game_state = "initial_roll"
             elif self.game_over_buttons["main_menu"].collidepoint(pos):
+                self.cancel_ai_turn()
                 self.__init__(self.screen)
             return
 
         if self.ingame_buttons["exit"].collidepoint(pos):
+            self.cancel_ai_turn()
             self.game_state = "menu"
             self.game = None
             return
+
+        # While the AI thinks only the exit button works
+        if self.game_state == "ai_moving":
+            return
         
         if self.ingame_buttons["roll_dice"].collidepoint(pos) and not self.dice_rolled:
             # Button is now only for human players
@@ -248,10 +260,8 @@ class BackgammonUI:
 
             self.game.roll_dice()
             self.dice_rolled = True
-            current_player = self.game.get_current_player()
-            if not self.game.has_possible_moves(current_player):
-                self.message = "No Tienes Movimientos Posibles"
-                self.message_timer = pygame.time.get_ticks()
+            if self.game.roll_kind == NO_PLAY:
+                self.show_no_moves()
             return
 
         if not self.dice_rolled:
@@ -273,19 +283,62 @@ class BackgammonUI:
         elif isinstance(clicked_point, int):
             self.handle_selection(clicked_point)
 
+    def end_turn(self):
+        """Passes the turn to the other player."""
+        self.game.switch_player()
+        self.dice_rolled = False
+
+    def show_no_moves(self):
+        """Ends a turn that cannot be played, the message stays on screen while the game goes on."""
+        self.message = "No Tienes Movimientos Posibles"
+        self.message_timer = pygame.time.get_ticks()
+        self.end_turn()
+
+    def start_ai_turn(self):
+        """Submits the AI's move choice to the worker thread and starts the display timer."""
+        self.ai_turn_timer = pygame.time.get_ticks()
+        self.ai_future = self.game.start_ai_turn(self.ai_executor, time_budget_ms=AI_TIME_BUDGET_MS)
+        self.game_state = "ai_moving"
+
+    def finish_ai_turn(self):
+        """Applies the AI's moves once they are ready and the minimum display time has passed."""
+        if self.ai_future is None or not self.ai_future.done():
+            return
+        if pygame.time.get_ticks() - self.ai_turn_timer <= AI_MIN_DISPLAY_MS:
+            return
+        try:
+            moves = self.ai_future.result()
+        except Exception as e:
+            print(f"AI failed to choose its moves and has forfeited its turn. Error: {e}")
+            moves = []
+        self.ai_future = None
+        self.ai_turn_timer = None
+        self.game.apply_ai_moves(moves)
+        self.end_turn()
+        self.game_state = "playing"
+
+    def cancel_ai_turn(self):
+        """
+        Drops a pending AI move choice. A search that is already running works on its
+        own copy of the board, ends within its time budget and its result is ignored.
+        """
+        if self.ai_future is not None:
+            self.ai_future.cancel()
+            self.ai_future = None
+        self.ai_turn_timer = None
+
     def handle_selection(self, point_index):
         player = self.game.get_current_player()
-        dice = self.game.dice.get_values()
         
         if point_index == 'bar':
             if self.game.board.get_bar().get(player):
                 self.selected_checker_point = 'bar'
-                self.possible_moves = self.game.board.get_possible_moves_for_checker('bar', player, dice)
+                self.possible_moves = self.game.get_possible_moves('bar')
         else:
             point_content = self.game.board.get_point(point_index)
             if point_content and point_content[0].get_owner() == player:
                 self.selected_checker_point = point_index
-                self.possible_moves = self.game.board.get_possible_moves_for_checker(point_index, player, dice)
+                self.possible_moves = self.game.get_possible_moves(point_index)
             else:
                 self.selected_checker_point = None
                 self.possible_moves = []
@@ -303,13 +356,10 @@ class BackgammonUI:
             
             # If there are no dice left, the turn is over.
             if not self.game.dice.get_values():
-                self.game.switch_player()
-                self.dice_rolled = False
-            # If there ARE dice left, but no possible moves, show the message.
-            # The main loop will handle the turn switch after the message timer.
+                self.end_turn()
+            # If there ARE dice left, but no possible moves, the turn is over too.
             elif not self.game.has_possible_moves(current_player):
-                self.message = "No Tienes Movimientos Posibles"
-                self.message_timer = pygame.time.get_ticks()
+                self.show_no_moves()
         
         # Reset selection regardless of whether the move was successful or not
         self.selected_checker_point = None
@@ -516,6 +566,8 @@ class BackgammonUI:
             
     def run(self):
         running = True
+        # One worker is enough: only one AI thinks at a time
+        self.ai_executor = ThreadPoolExecutor(max_workers=1)
         
         while running:
             for event in pygame.event.get():
@@ -537,7 +589,7 @@ class BackgammonUI:
                                 self.dice_rolled = True  # The initial roll counts as the first turn's dice
                             else:
                                 self.game.determine_first_player()
-                    elif self.game_state == "playing":
+                    elif self.game_state in ("playing", "ai_moving"):
                         self.handle_click(pos)
                     elif self.game_state == "game_over":
                         self.handle_click(pos)  # Reuses the main click handler
@@ -547,8 +599,6 @@ class BackgammonUI:
 
             if self.message and pygame.time.get_ticks() - self.message_timer > 2000:
                 self.message = None
-                self.game.switch_player()
-                self.dice_rolled = False
                 
             current_player = self.game.get_current_player() if self.game else None
             
@@ -559,28 +609,18 @@ class BackgammonUI:
             # This logic block handles the entire AI turn sequence, including the special first turn.
             if is_ai_turn:
                 if not self.dice_rolled:
-                    # Normal turn start: Roll dice and set timer
+                    # Normal turn start. On the first turn the dice are already rolled.
                     self.game.roll_dice()
                     self.dice_rolled = True
-                    self.ai_turn_timer = pygame.time.get_ticks()
-                    if not self.game.has_possible_moves(current_player):
-                        self.message = "No Tienes Movimientos Posibles"
-                        self.message_timer = pygame.time.get_ticks()
-                    else:
-                        self.game_state = "ai_moving"
-                elif self.dice_rolled and self.game_state != "ai_moving":
-                    # Special case: First turn where dice are already rolled.
-                    # Start the timer and switch to moving state.
-                    self.ai_turn_timer = pygame.time.get_ticks()
-                    self.game_state = "ai_moving"
+                if self.game.play_forced_turn():
+                    # Nothing to choose: no search and no display delay
+                    self.end_turn()
+                else:
+                    self.start_ai_turn()
 
             if self.game_state == "ai_moving":
-                if self.ai_turn_timer is not None and pygame.time.get_ticks() - self.ai_turn_timer > 1000:
-                    self.game.play_ai_turn()
-                    self.game.switch_player()
-                    self.dice_rolled = False
-                    self.game_state = "playing"
-                    self.ai_turn_timer = None
+                # The search overlaps the display time, the board keeps being drawn meanwhile
+                self.finish_ai_turn()
 
             self.screen.fill(BACKGROUND_COLOR)
             if self.game_state in ["playing", "ai_rolling", "ai_moving"]:
@@ -600,6 +640,8 @@ class BackgammonUI:
             
             pygame.display.flip()
 
+        self.cancel_ai_turn()
+        self.ai_executor.shutdown(wait=False, cancel_futures=True)
         pygame.quit()
 
 def main():
@@ -1,8 +1,10 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from core.player import Player
 from core.ai import AIPlayer
 from core.board import Board
 from core.checkers import Checkers
+from core.game import Game
 
 class TestAIPlayer(unittest.TestCase):
     def setUp(self):
@@ -60,5 +62,18 @@ class TestAIPlayer(unittest.TestCase):
         
         self.assertIn((18, 'off'), moves)
 
+    def test_game_chooses_moves_in_the_background(self):
+        game = Game([self.p1, self.ai])
+        game.switch_player()
+        game.dice.set_values([6, 5])
+        before = game.board.get_cells().tobytes()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = game.start_ai_turn(executor)
+            moves = future.result()
+        # The search ran on a copy, the game only changes when the moves are applied
+        self.assertEqual(game.board.get_cells().tobytes(), before)
+        game.apply_ai_moves(moves)
+        self.assertEqual(game.dice.get_values(), [])
+
 if __name__ == "__main__":
     unittest.main()
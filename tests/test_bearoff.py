@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from core.board import Board, WHITE, BLACK
+from core.player import Player
+from core.checkers import Checkers
+from core.bearoff import (BearoffDatabase, build_database, position_index, position_count, home_counts,
+                          get_default_database, set_default_database, _positions)
+from core.evaluation import heuristic_evaluate
+
+
+class TestBearoffDatabase(unittest.TestCase):
+    """Tests for the one-sided bear-off database."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, 'bearoff.db')
+        build_database(cls.path, max_checkers=3)
+        cls.database = BearoffDatabase(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.database.close()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+        for i in range(24): self.board.get_points()[i] = []
+        self.previous = get_default_database()
+
+    def tearDown(self):
+        set_default_database(self.previous)
+
+    def test_index_follows_generation_order(self):
+        positions = _positions(3)
+        self.assertEqual(len(positions), position_count(3))
+        for index, counts in enumerate(positions):
+            self.assertEqual(position_index(counts, 3), index)
+
+    def test_known_expected_rolls(self):
+        self.assertAlmostEqual(self.database.expected_rolls((1, 0, 0, 0, 0, 0)), 1.0)
+        self.assertAlmostEqual(self.database.expected_rolls((0, 1, 0, 0, 0, 0)), 1.0)
+        # A lone checker on the six point fails to come off only with 11, 12, 13, 14, 23 or 33
+        self.assertAlmostEqual(self.database.expected_rolls((0, 0, 0, 0, 0, 1)), 1.25, places=5)
+
+    def test_distribution_sums_to_one(self):
+        dist = self.database.distribution((0, 0, 1, 0, 0, 2))
+        self.assertAlmostEqual(sum(dist), 1.0)
+        self.assertEqual(dist[0], 0.0)
+
+    def test_positions_beyond_the_database_are_rejected(self):
+        self.assertFalse(self.database.covers((0, 0, 0, 0, 0, 4)))
+        with self.assertRaises(ValueError):
+            self.database.expected_rolls((0, 0, 0, 0, 0, 4))
+
+    def test_rejects_other_files(self):
+        path = os.path.join(self.directory.name, 'other.db')
+        with open(path, 'wb') as handle:
+            handle.write(b'not a database')
+        with self.assertRaises(ValueError):
+            BearoffDatabase(path)
+
+    def test_race_win_probability(self):
+        self.board._set_off_board_count(self.white, 14)
+        self.board._set_off_board_count(self.black, 14)
+        self.board.get_points()[0] = [Checkers(self.white)]
+        self.board.get_points()[18] = [Checkers(self.black)]
+        self.assertEqual(home_counts(self.board, WHITE), (1, 0, 0, 0, 0, 0))
+        self.assertEqual(home_counts(self.board, BLACK), (0, 0, 0, 0, 0, 1))
+        self.assertAlmostEqual(self.database.win_probability(self.board, WHITE), 1.0)
+        self.assertAlmostEqual(self.database.win_probability(self.board, BLACK), 0.75, places=4)
+
+    def test_evaluator_reads_the_database_in_races(self):
+        self.board._set_off_board_count(self.white, 13)
+        self.board._set_off_board_count(self.black, 14)
+        self.board.get_points()[5] = [Checkers(self.white)] * 2
+        self.board.get_points()[23] = [Checkers(self.black)]
+        set_default_database(self.database)
+        win = self.database.win_probability(self.board, BLACK)
+        self.assertAlmostEqual(heuristic_evaluate(self.board, BLACK), 0.99 * (2 * win - 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
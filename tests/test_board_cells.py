@@ -0,0 +1,218 @@
+import unittest
+from core.board import Board, WHITE_BAR, BLACK_BAR, BLACK
+from core.player import Player
+from core.checkers import Checkers
+
+
+class TestBoardCells(unittest.TestCase):
+    """Tests for the compact integer representation of the board."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+
+    def test_initial_cells(self):
+        cells = self.board.get_cells()
+        self.assertEqual(len(cells), 26)
+        self.assertEqual(cells[23], 2)
+        self.assertEqual(cells[5], 5)
+        self.assertEqual(cells[0], -2)
+        self.assertEqual(cells[18], -5)
+        self.assertEqual(sum(c for c in cells if c > 0), 15)
+        self.assertEqual(sum(c for c in cells if c < 0), -15)
+
+    def test_get_point_compatibility_view(self):
+        point = self.board.get_point(12)
+        self.assertEqual(len(point), 5)
+        self.assertEqual(point[0].get_owner(), self.white)
+        self.assertEqual(self.board.get_point(1), [])
+        self.assertEqual(len(self.board.get_points()), 24)
+
+    def test_points_view_assignment_updates_cells(self):
+        self.board.get_points()[3] = [Checkers(self.black), Checkers(self.black)]
+        self.assertEqual(self.board.get_cells()[3], -2)
+        self.board.get_points()[3] = []
+        self.assertEqual(self.board.get_cells()[3], 0)
+
+    def test_bar_view(self):
+        self.assertFalse(self.board.get_bar().get(self.white))
+        self.board.get_bar()[self.black] = [Checkers(self.black)]
+        self.assertEqual(self.board.get_cells()[BLACK_BAR], -1)
+        self.assertEqual(len(self.board.get_bar()[self.black]), 1)
+        self.assertEqual(dict(self.board.get_bar().items())[self.white], [])
+
+    def test_hit_sends_checker_to_bar(self):
+        self.board.get_points()[20] = [Checkers(self.black)]
+        self.board.move_piece(23, 3, self.white)
+        cells = self.board.get_cells()
+        self.assertEqual(cells[20], 1)
+        self.assertEqual(cells[BLACK_BAR], -1)
+        self.assertEqual(cells[WHITE_BAR], 0)
+
+    def test_blocked_point_is_invalid(self):
+        # Black holds point 18 with five checkers, white cannot land there
+        self.assertFalse(self.board.is_valid_move(23, 5, self.white))
+        self.assertTrue(self.board.is_valid_move(23, 1, self.white))
+
+    def test_bear_off_with_higher_die(self):
+        for i in range(24): self.board.get_points()[i] = []
+        self.board._set_off_board_count(self.white, 14)
+        self.board.get_points()[2] = [Checkers(self.white)]
+        self.assertTrue(self.board.can_player_bear_off(self.white))
+        self.assertTrue(self.board.is_valid_move(2, 6, self.white))
+        self.board.move_piece(2, 6, self.white)
+        self.assertEqual(self.board.get_winner(), self.white)
+
+
+class TestMakeUnmake(unittest.TestCase):
+    """Tests for apply_move/undo_move."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+
+    def test_undo_restores_hit(self):
+        self.board.get_points()[20] = [Checkers(self.black)]
+        before = list(self.board.get_cells())
+        record = self.board.apply_move(23, 3, self.white)
+        self.assertEqual(self.board.get_cells()[BLACK_BAR], -1)
+        self.board.undo_move(record)
+        self.assertEqual(list(self.board.get_cells()), before)
+
+    def test_undo_restores_bear_off_and_winner(self):
+        for i in range(24): self.board.get_points()[i] = []
+        self.board._set_off_board_count(self.black, 14)
+        self.board.get_points()[23] = [Checkers(self.black)]
+        record = self.board.apply_move(23, 1, self.black)
+        self.assertEqual(self.board.get_winner(), self.black)
+        self.board.undo_move(record)
+        self.assertIsNone(self.board.get_winner())
+        self.assertEqual(self.board.get_off_board_count(self.black), 14)
+        self.assertEqual(self.board.get_cells()[23], -1)
+
+    def test_apply_invalid_move_raises(self):
+        with self.assertRaises(ValueError):
+            self.board.apply_move(23, 5, self.white)
+
+    def test_copy_is_independent(self):
+        copy = self.board.copy()
+        copy.move_piece(23, 3, self.white)
+        self.assertEqual(self.board.get_cells()[23], 2)
+        self.assertEqual(copy.get_cells()[23], 1)
+        self.assertNotEqual(copy.position_hash(), self.board.position_hash())
+        self.assertEqual(self.board.pip_count(self.white), 167)
+        self.assertIs(copy.get_current_player(), self.white)
+
+    def test_set_position_round_trip(self):
+        self.board.move_piece(23, 3, self.white)
+        other = Board(Player("A", "white"), Player("B", "black"))
+        other.set_position(self.board.get_cells().tolist(), self.board.get_off_counts())
+        self.assertEqual(other.position_hash(), self.board.position_hash())
+        self.assertEqual(other.pip_count(other.get_current_player()), self.board.pip_count(self.white))
+
+
+class TestPositionHash(unittest.TestCase):
+    """Tests for the incrementally maintained Zobrist hash."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+
+    def test_transposed_move_orders_share_a_hash(self):
+        other = Board(self.white, self.black)
+        self.board.move_piece(12, 6, self.white)
+        self.board.move_piece(7, 5, self.white)
+        other.move_piece(7, 5, self.white)
+        other.move_piece(12, 6, self.white)
+        self.assertEqual(self.board.position_hash(), other.position_hash())
+
+    def test_hash_tracks_hits_and_undo(self):
+        start = self.board.position_hash()
+        self.board.get_points()[20] = [Checkers(self.black)]
+        with_blot = self.board.position_hash()
+        self.assertNotEqual(start, with_blot)
+        record = self.board.apply_move(23, 3, self.white)
+        self.assertNotEqual(self.board.position_hash(), with_blot)
+        self.board.undo_move(record)
+        self.assertEqual(self.board.position_hash(), with_blot)
+
+    def test_side_to_move_changes_hash(self):
+        turn = self.board.get_turn_state()
+        start = self.board.position_hash()
+        turn.pass_turn()
+        self.assertNotEqual(self.board.position_hash(), start)
+        self.assertEqual(self.board.position_hash(), self.board.position_key(BLACK))
+        turn.pass_turn()
+        self.assertEqual(self.board.position_hash(), start)
+
+
+class TestIncrementalCounters(unittest.TestCase):
+    """Tests for the incrementally maintained pip and home-board counters."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+
+    def test_initial_pip_counts(self):
+        self.assertEqual(self.board.pip_count(self.white), 167)
+        self.assertEqual(self.board.pip_count(self.black), 167)
+        self.assertEqual(self.board.checkers_outside_home(self.white), 10)
+
+    def test_hit_updates_both_players(self):
+        self.board.get_points()[20] = [Checkers(self.black)]
+        black_pips = self.board.pip_count(self.black)
+        record = self.board.apply_move(23, 3, self.white)
+        self.assertEqual(self.board.pip_count(self.white), 164)
+        # The hit checker goes from 4 pips away to 25 on the bar
+        self.assertEqual(self.board.pip_count(self.black), black_pips + 21)
+        self.board.undo_move(record)
+        self.assertEqual(self.board.pip_count(self.black), black_pips)
+
+    def test_overshoot_only_from_highest_point(self):
+        for i in range(24): self.board.get_points()[i] = []
+        self.board._set_off_board_count(self.white, 13)
+        self.board.get_points()[1] = [Checkers(self.white)]
+        self.board.get_points()[3] = [Checkers(self.white)]
+        self.assertEqual(self.board.checkers_outside_home(self.white), 0)
+        self.assertFalse(self.board.is_valid_move(1, 6, self.white))
+        self.assertTrue(self.board.is_valid_move(3, 6, self.white))
+        self.board.move_piece(3, 6, self.white)
+        self.assertTrue(self.board.is_valid_move(1, 6, self.white))
+
+
+class TestOccupancyMasks(unittest.TestCase):
+    """Tests for the per-player point bitmasks."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+
+    def test_initial_masks(self):
+        owned, blocked, blots = self.board.get_masks(self.white)
+        self.assertEqual(owned, (1 << 23) | (1 << 12) | (1 << 7) | (1 << 5))
+        self.assertEqual(blocked, (1 << 0) | (1 << 11) | (1 << 16) | (1 << 18))
+        self.assertEqual(blots, 0)
+
+    def test_masks_follow_moves(self):
+        self.board.move_piece(23, 1, self.white)
+        owned, _, blots = self.board.get_masks(self.white)
+        self.assertEqual(blots, (1 << 23) | (1 << 22))
+        self.assertTrue(owned & (1 << 22))
+
+    def test_no_moves_against_closed_board(self):
+        for i in range(24): self.board.get_points()[i] = []
+        for i in range(18, 24): self.board.get_points()[i] = [Checkers(self.black)] * 2
+        self.board.get_points()[5] = [Checkers(self.white)] * 14
+        self.board.get_bar()[self.white] = [Checkers(self.white)]
+        self.assertFalse(self.board.has_any_valid_moves(self.white, [1, 2, 3, 4, 5, 6]))
+        self.board.get_points()[20] = []
+        self.assertTrue(self.board.has_any_valid_moves(self.white, [4]))
+
+
+if __name__ == "__main__":
+    unittest.main()
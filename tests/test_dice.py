@@ -0,0 +1,69 @@
+import pickle
+import unittest
+from core.dice import Dice, DiceSource, RandomSource, BufferedSource, ScriptedSource
+from core.game import Game
+from core.player import Player
+
+
+class TestDiceSources(unittest.TestCase):
+    """Tests for the dice sources."""
+
+    def _rolls(self, source, count=50):
+        return [source.roll() for _ in range(count)]
+
+    def test_seeded_source_matches_seeded_dice(self):
+        dice = Dice(seed=7)
+        source = RandomSource(7)
+        for _ in range(20):
+            self.assertEqual(tuple(dice.roll()), source.roll())
+
+    def test_children_are_reproducible_and_independent(self):
+        for source_class in (RandomSource, BufferedSource):
+            parent = source_class(3)
+            self.assertEqual(self._rolls(parent.spawn(1)), self._rolls(source_class(3).spawn(1)))
+            self.assertNotEqual(self._rolls(parent.spawn(1)), self._rolls(parent.spawn(2)))
+
+    def test_buffered_values_span_refills(self):
+        first, second = BufferedSource(5, size=3), BufferedSource(5, size=3)
+        values = [die for _ in range(100) for die in first.roll()]
+        self.assertEqual(set(values), {1, 2, 3, 4, 5, 6})
+        self.assertEqual(values, [die for _ in range(100) for die in second.roll()])
+
+    def test_sources_can_be_sent_to_workers(self):
+        for source in (RandomSource(), RandomSource(1), BufferedSource(1), ScriptedSource([(1, 2)])):
+            self.assertEqual(type(pickle.loads(pickle.dumps(source))), type(source))
+
+    def test_scripted_source(self):
+        source = ScriptedSource([(3, 1), 6, 6])
+        self.assertEqual(source.roll(), (3, 1))
+        self.assertEqual(source.remaining(), 2)
+        self.assertEqual(source.roll(), (6, 6))
+        with self.assertRaises(IndexError):
+            source.roll_one()
+        looping = ScriptedSource([2, 5], repeat=True)
+        self.assertEqual(self._rolls(looping, 3), [(2, 5)] * 3)
+        with self.assertRaises(ValueError):
+            ScriptedSource([7])
+
+    def test_incomplete_source_cannot_be_created(self):
+        class OnlyRolls(DiceSource):
+            def roll_one(self):
+                return 4
+        with self.assertRaises(TypeError):
+            OnlyRolls()
+
+    def test_dice_and_game_use_the_source(self):
+        dice = Dice(source=ScriptedSource([(4, 4), (2, 1)]))
+        self.assertEqual(dice.roll(), [4, 4])
+        self.assertEqual(dice.roll(), [2, 1])
+        game = Game([Player("A", "white"), Player("B", "black")], dice_source=ScriptedSource([5, 2, (6, 6)]))
+        game.determine_first_player()
+        self.assertIs(game.initial_roll_winner, game.players[0])
+        self.assertEqual(game.dice.get_values(), [5, 2])
+        game.switch_player()
+        game.roll_dice()
+        self.assertEqual(game.dice.get_values(), [6, 6, 6, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from core.player import Player
+from core.checkers import Checkers
+from core.ai import AIPlayer
+from core.game import Game, classify_plays, NO_PLAY, FORCED, CHOICE
+
+
+class RecordingAI(AIPlayer):
+    """AI that records whether it was asked to choose."""
+
+    def __init__(self, name, color):
+        super().__init__(name, color)
+        self.calls = 0
+
+    def choose_moves(self, board, dice, time_budget_ms=None):
+        self.calls += 1
+        return super().choose_moves(board, dice, time_budget_ms)
+
+
+class TestRollClassification(unittest.TestCase):
+    """Tests for the no-play and forced-play fast paths."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.ai = RecordingAI("Computer", "black")
+        self.game = Game([self.white, self.ai])
+        self.game.switch_player()
+        self.board = self.game.board
+
+    def _clear(self):
+        for i in range(24):
+            self.board.get_points()[i] = []
+
+    def test_classify_plays(self):
+        self.assertEqual(classify_plays([()]), NO_PLAY)
+        self.assertEqual(classify_plays([((0, 1, 1),)]), FORCED)
+        self.assertEqual(classify_plays([((0, 1, 1),), ((2, 3, 1),)]), CHOICE)
+
+    def test_opening_roll_is_a_choice(self):
+        self.game.dice.set_values([3, 1])
+        self.assertEqual(self.game.classify_roll(), CHOICE)
+        self.assertFalse(self.game.play_forced_turn())
+        self.assertEqual(self.game.dice.get_values(), [3, 1])
+
+    def test_legal_moves_use_up_the_turn_dice(self):
+        self.game.dice.set_values([3, 1])
+        moves = self.game.get_legal_moves()
+        self.assertIn((11, 14, 3), moves)
+        self.assertEqual(self.game.move(11, 14, 3), 3)
+        self.assertEqual(self.game.dice.get_values(), [1])
+        self.assertTrue(all(die == 1 for _, _, die in self.game.get_legal_moves()))
+
+    def test_closed_board_is_a_no_play(self):
+        self._clear()
+        self.board.get_bar()[self.ai] = [Checkers(self.ai)]
+        # White holds its whole home board, where black has to enter
+        for point in range(6):
+            self.board.get_points()[point] = [Checkers(self.white)] * 2
+        self.board.get_points()[12] = [Checkers(self.ai)] * 14
+        self.game.dice.set_values([6, 5])
+        self.assertEqual(self.game.classify_roll(), NO_PLAY)
+        self.game.play_ai_turn()
+        self.assertEqual(self.ai.calls, 0)
+        self.assertEqual(self.game.dice.get_values(), [])
+
+    def test_forced_play_is_applied_without_asking_the_ai(self):
+        self._clear()
+        self.board._set_off_board_count(self.ai, 14)
+        self.board.get_points()[22] = [Checkers(self.ai)]
+        self.board.get_points()[0] = [Checkers(self.white)] * 15
+        self.game.dice.set_values([1, 2])
+        self.assertEqual(self.game.classify_roll(), FORCED)
+        self.assertEqual(self.game.roll_kind, FORCED)
+        self.game.play_ai_turn()
+        self.assertEqual(self.ai.calls, 0)
+        self.assertTrue(self.game.is_game_over())
+
+    def test_first_roll_is_classified(self):
+        game = Game([self.white, self.ai])
+        game.determine_first_player()
+        self.assertEqual(game.roll_kind, CHOICE)
+
+
+if __name__ == "__main__":
+    unittest.main()
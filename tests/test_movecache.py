@@ -0,0 +1,54 @@
+import unittest
+from core.board import Board
+from core.player import Player
+from core.game import Game
+from core.movecache import MoveCache
+
+
+class TestMoveCache(unittest.TestCase):
+    """Tests for the LRU legal-move cache."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+        self.cache = MoveCache(maxsize=2)
+
+    def test_hit_on_same_position_and_dice(self):
+        first = self.cache.get_plays(self.board, self.white, [3, 1])
+        second = self.cache.get_plays(self.board, self.white, [1, 3])
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_position_change_misses(self):
+        self.cache.get_moves(self.board, self.white, [3, 1])
+        self.board.move_piece(23, 1, self.white)
+        self.cache.get_moves(self.board, self.white, [3, 1])
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_side_to_move_is_part_of_the_key(self):
+        self.cache.get_moves(self.board, self.white, [3, 1])
+        self.cache.get_moves(self.board, self.black, [3, 1])
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_lru_eviction(self):
+        self.cache.get_moves(self.board, self.white, [3, 1])
+        self.cache.get_moves(self.board, self.white, [6, 5])
+        self.cache.get_moves(self.board, self.white, [3, 1])
+        self.cache.get_moves(self.board, self.white, [4, 2])
+        self.assertEqual(len(self.cache), 2)
+        # [6, 5] was the least recently used entry
+        self.cache.get_moves(self.board, self.white, [6, 5])
+        self.assertEqual(self.cache.stats()['misses'], 4)
+
+    def test_game_possible_moves(self):
+        game = Game([self.white, self.black], move_cache=self.cache)
+        game.dice.set_values([6, 5])
+        self.assertIn(17, game.get_possible_moves(23))
+        self.assertTrue(game.has_possible_moves(self.white))
+        self.assertEqual(self.cache.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
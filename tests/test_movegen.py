@@ -0,0 +1,95 @@
+import unittest
+from core.board import Board
+from core.player import Player
+from core.checkers import Checkers
+from core.movegen import generate_plays, generate_side_plays, generate_roll_plays, apply_play, ROLLS, ROLL_INDEX
+from core.movetables import WHITE, BLACK
+from core.dice import RandomSource
+
+
+class TestGeneratePlays(unittest.TestCase):
+    """Tests for the full-turn legal move generator."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+
+    def _clear(self):
+        for i in range(24): self.board.get_points()[i] = []
+
+    def test_opening_roll_plays_are_distinct_and_use_both_dice(self):
+        before = self.board.get_cells().tobytes()
+        plays = generate_plays(self.board, self.white, [3, 1])
+        self.assertEqual(self.board.get_cells().tobytes(), before)
+        self.assertTrue(all(len(play) == 2 for play in plays))
+        # Making the 5-point (8/5 6/5) is one of the plays
+        self.assertIn(sorted([(7, 4, 3), (5, 4, 1)]), [sorted(play) for play in plays])
+
+        finals = set()
+        for play in plays:
+            records = [self.board.apply_move(f, die, self.white) for f, _, die in play]
+            finals.add(self.board.get_cells().tobytes())
+            for record in reversed(records): self.board.undo_move(record)
+        self.assertEqual(len(finals), len(plays))
+
+    def test_doubles_play_four_moves(self):
+        plays = generate_plays(self.board, self.black, [6, 6, 6, 6])
+        self.assertTrue(plays)
+        self.assertTrue(all(len(play) == 4 for play in plays))
+
+    def test_no_legal_move_returns_empty_play(self):
+        # White on the bar against a closed black home board
+        self._clear()
+        for i in range(18, 24): self.board.get_points()[i] = [Checkers(self.black)] * 2
+        self.board.get_bar()[self.white] = [Checkers(self.white)]
+        self.board.get_points()[5] = [Checkers(self.white)] * 14
+        self.assertEqual(generate_plays(self.board, self.white, [4, 2]), [()])
+
+    def test_larger_die_is_forced_when_only_one_can_be_played(self):
+        # White's last checker on 11 can play a 6 or a 5, but the other die is
+        # blocked afterwards by black's point on 0
+        self._clear()
+        self.board._set_off_board_count(self.white, 14)
+        self.board.get_points()[11] = [Checkers(self.white)]
+        self.board.get_points()[0] = [Checkers(self.black)] * 2
+        self.board.get_points()[23] = [Checkers(self.black)] * 13
+        plays = generate_plays(self.board, self.white, [5, 6])
+        self.assertEqual(plays, [((11, 5, 6),)])
+
+
+class TestGenerateRollPlays(unittest.TestCase):
+    """Tests for the all-rolls move generator used by chance nodes."""
+
+    def _positions(self):
+        dice = RandomSource(11)
+        for game in range(12):
+            board = Board(Player("White", "white"), Player("Black", "black"), random_positions=game % 3 == 0)
+            side = WHITE
+            for _ in range(game * 8):
+                if board.is_game_over():
+                    break
+                die1, die2 = dice.roll()
+                roll = [die1] * 4 if die1 == die2 else [die1, die2]
+                plays = generate_side_plays(board, side, roll)
+                apply_play(board, side, plays[dice.roll_one() % len(plays)])
+                side = 1 - side
+            yield board
+
+    def test_chance_table(self):
+        self.assertEqual(len(ROLLS), 21)
+        self.assertAlmostEqual(sum(probability for _, probability in ROLLS), 1.0)
+        self.assertEqual(ROLLS[ROLL_INDEX[5][2]][0], (2, 5))
+        self.assertEqual(ROLLS[ROLL_INDEX[4][4]], ((4, 4, 4, 4), 1 / 36))
+
+    def test_matches_one_roll_at_a_time(self):
+        for board in self._positions():
+            before = board.position_hash()
+            for side in (WHITE, BLACK):
+                for (dice, _), plays in zip(ROLLS, generate_roll_plays(board, side)):
+                    self.assertEqual(plays, generate_side_plays(board, side, dice))
+            self.assertEqual(board.position_hash(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
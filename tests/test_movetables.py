@@ -0,0 +1,37 @@
+import unittest
+from core.movetables import (
+    WHITE, BLACK, WHITE_BAR, BLACK_BAR, OFF, NO_MOVE,
+    DESTINATIONS, BEAR_OFF_DIE, dice_for_move,
+)
+
+
+class TestMoveTables(unittest.TestCase):
+    """Tests for the precomputed move tables."""
+
+    def test_point_to_point(self):
+        self.assertEqual(DESTINATIONS[WHITE][23][5], 18)
+        self.assertEqual(DESTINATIONS[BLACK][0][5], 5)
+
+    def test_bar_entry(self):
+        self.assertEqual(DESTINATIONS[WHITE][WHITE_BAR][1], 23)
+        self.assertEqual(DESTINATIONS[BLACK][BLACK_BAR][6], 5)
+        self.assertEqual(DESTINATIONS[WHITE][BLACK_BAR][3], NO_MOVE)
+
+    def test_bear_off(self):
+        self.assertEqual(DESTINATIONS[WHITE][2][3], OFF)
+        self.assertEqual(DESTINATIONS[WHITE][2][6], OFF)
+        self.assertEqual(DESTINATIONS[BLACK][20][4], OFF)
+        self.assertEqual(BEAR_OFF_DIE[WHITE][2], 3)
+        self.assertEqual(BEAR_OFF_DIE[BLACK][20], 4)
+        self.assertEqual(BEAR_OFF_DIE[WHITE][12], 0)
+
+    def test_dice_for_move(self):
+        self.assertEqual(dice_for_move(23, 21, WHITE), (2,))
+        self.assertEqual(dice_for_move('bar', 2, BLACK), (3,))
+        self.assertEqual(dice_for_move(3, 'off', WHITE), (4, 5, 6))
+        # Moving backwards is never possible
+        self.assertEqual(dice_for_move(21, 23, WHITE), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from core.board import Board, WHITE, BLACK
+from core.player import Player
+from core.movegen import generate_plays, generate_side_plays, apply_play, undo_play
+from core.search import SearchAIPlayer
+
+try:
+    import numpy as np
+    from core.neural import NeuralEvaluator, encode, encode_batch, INPUTS, OUTPUTS
+except ImportError:
+    np = None
+
+
+@unittest.skipUnless(np is not None, "numpy is not installed")
+class TestNeuralEvaluator(unittest.TestCase):
+    """Tests for the NumPy MLP evaluator."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+        self.network = NeuralEvaluator(hidden=8, seed=1)
+
+    def test_encoding_is_from_the_side_on_roll(self):
+        inputs = encode(self.board, WHITE)
+        self.assertEqual(inputs.shape, (INPUTS,))
+        # The opening position looks the same to both sides
+        np.testing.assert_array_equal(inputs, encode(self.board, BLACK))
+        self.board.move_piece(23, 3, self.white)
+        self.assertFalse(np.array_equal(encode(self.board, WHITE), encode(self.board, BLACK)))
+
+    def test_batch_matches_single_positions(self):
+        cells = [self.board.get_cells().tolist()] * 2
+        batch = encode_batch(cells, [(0, 0)] * 2, [WHITE, BLACK])
+        outputs = self.network.evaluate_batch(batch)
+        self.assertEqual(outputs.shape, (2, OUTPUTS))
+        np.testing.assert_allclose(outputs[0], self.network.evaluate_batch(encode(self.board, WHITE))[0])
+
+    def test_evaluate_plays_matches_calls(self):
+        plays = generate_side_plays(self.board, WHITE, (1, 3))
+        values = self.network.evaluate_plays(self.board, WHITE, plays)
+        for play, value in zip(plays, values):
+            records = apply_play(self.board, WHITE, play)
+            self.assertAlmostEqual(value, -self.network(self.board, BLACK))
+            undo_play(self.board, records)
+        self.assertTrue(all(-1 < value < 1 for value in values))
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'weights.npz')
+            self.network.save(path)
+            loaded = NeuralEvaluator.load(path)
+        self.assertEqual(loaded.get_hidden(), 8)
+        self.assertAlmostEqual(loaded(self.board, WHITE), self.network(self.board, WHITE))
+
+    def test_rejects_mismatched_weights(self):
+        weights = dict(self.network.get_weights())
+        weights['output_bias'] = np.zeros(2)
+        with self.assertRaises(ValueError):
+            NeuralEvaluator(weights=weights)
+
+    def test_plugs_into_the_search(self):
+        ai = SearchAIPlayer("Computer", "black", depth=1, evaluator=self.network)
+        board = Board(self.white, ai)
+        moves = ai.choose_moves(board, [6, 5])
+        self.assertIn(tuple(moves), generate_plays(board, ai, [6, 5]))
+
+
+if __name__ == "__main__":
+    unittest.main()
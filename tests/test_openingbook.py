@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from core.board import Board, WHITE, BLACK
+from core.player import Player
+from core.movegen import generate_side_plays
+from core.openingbook import OpeningBook, OPENING_ROLLS, get_default_book, mirror_play, best_play, is_separated
+from core.search import SearchAIPlayer
+
+
+class TestOpeningBook(unittest.TestCase):
+    """Tests for the opening book."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+
+    def test_opening_rolls(self):
+        self.assertEqual(len(OPENING_ROLLS), 15)
+        self.assertTrue(all(die1 < die2 for die1, die2 in OPENING_ROLLS))
+
+    def test_lookup_ignores_dice_order_and_side(self):
+        book = OpeningBook()
+        play = ((7, 4, 3), (5, 4, 1))
+        book.add(self.board, WHITE, (3, 1), play, 0.1, 0.01)
+        self.assertEqual(book.lookup(self.board, WHITE, [1, 3]), play)
+        self.assertIsNone(book.lookup(self.board, BLACK, [1, 3]))
+        self.assertIsNone(book.lookup(self.board, WHITE, [4, 2]))
+
+    def test_lookup_rejects_illegal_plays(self):
+        book = OpeningBook()
+        book.add(self.board, WHITE, (3, 1), ((7, 4, 3), (7, 6, 1), (6, 5, 1)))
+        self.assertIsNone(book.lookup(self.board, WHITE, (3, 1)))
+
+    def test_save_and_load(self):
+        book = OpeningBook()
+        play = ((12, 6, 6), (12, 7, 5))
+        book.add(self.board, WHITE, (6, 5), play, 0.2, 0.02)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'book.json')
+            book.save(path)
+            loaded = OpeningBook.load(path)
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(loaded.lookup(self.board, WHITE, (5, 6)), play)
+
+    def test_mirror_play(self):
+        self.assertEqual(mirror_play(((7, 4, 3), ('bar', 20, 4), (2, 'off', 3))),
+                         ((16, 19, 3), ('bar', 3, 4), (21, 'off', 3)))
+
+    def test_default_book_holds_legal_plays_for_both_sides(self):
+        book = get_default_book()
+        self.assertGreater(len(book), 0)
+        for dice in OPENING_ROLLS:
+            white = book.lookup(self.board, WHITE, dice)
+            black = book.lookup(self.board, BLACK, dice)
+            self.assertEqual(black, None if white is None else mirror_play(white))
+            if white is not None:
+                self.assertIn(white, generate_side_plays(self.board, WHITE, dice))
+
+    def test_default_book_makes_points_and_skips_close_calls(self):
+        book = get_default_book()
+        # 4-2 makes the 4-point (8/4 6/4)
+        self.assertEqual(sorted(book.lookup(self.board, WHITE, (4, 2))), [(5, 3, 2), (7, 3, 4)])
+        # 5-1 candidates are too close to call at the book's trial count, so the search decides
+        self.assertIsNone(book.lookup(self.board, WHITE, (5, 1)))
+
+    def test_search_plays_from_the_book(self):
+        book = OpeningBook()
+        play = ((12, 6, 6), (12, 7, 5))
+        book.add(self.board, WHITE, (6, 5), play)
+        ai = SearchAIPlayer("Computer", "white", depth=2, opening_book=book)
+        board = Board(ai, self.black)
+        self.assertEqual(tuple(ai.choose_moves(board, [6, 5])), play)
+        self.assertEqual(ai.get_nodes(), 0)
+
+    def test_best_play_is_a_rolled_out_candidate(self):
+        play, stats, runner_up = best_play(self.board, WHITE, (3, 1), trials=36, candidates=2, seed=1, workers=1)
+        self.assertIn(play, generate_side_plays(self.board, WHITE, (3, 1)))
+        self.assertGreaterEqual(stats['equity'], runner_up['equity'])
+
+    def test_close_candidates_are_not_separated(self):
+        best = {'equity': 0.10, 'std_error': 0.03}
+        self.assertFalse(is_separated(best, {'equity': 0.05, 'std_error': 0.03}))
+        self.assertTrue(is_separated(best, {'equity': -0.10, 'std_error': 0.03}))
+        self.assertTrue(is_separated(best, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from core.board import Board, WHITE, BLACK
+from core.player import Player
+from core.checkers import Checkers
+from core.movegen import generate_plays
+from core.dice import Dice
+from core.rollout import (rollout, game_points, summarize, add_result, TrialDice, expand_roll, OUTCOMES,
+                          NUM_COUNTERS, SINGLE, GAMMON, BACKGAMMON)
+
+
+class TestRollout(unittest.TestCase):
+    """Tests for Monte Carlo rollouts."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.board = Board(self.white, self.black)
+        for i in range(24): self.board.get_points()[i] = []
+
+    def _race(self):
+        # Short race: a few checkers each in the home boards
+        self.board._set_off_board_count(self.white, 12)
+        self.board._set_off_board_count(self.black, 12)
+        self.board.get_points()[3] = [Checkers(self.white)] * 3
+        self.board.get_points()[21] = [Checkers(self.black)] * 3
+
+    def test_game_points(self):
+        self.board._set_off_board_count(self.white, 15)
+        self.board.get_points()[12] = [Checkers(self.black)] * 15
+        self.assertEqual(game_points(self.board, WHITE), GAMMON)
+        self.board.get_points()[12] = [Checkers(self.black)] * 14
+        self.board.get_points()[2] = [Checkers(self.black)]
+        self.assertEqual(game_points(self.board, WHITE), BACKGAMMON)
+        self.board._set_off_board_count(self.black, 1)
+        self.assertEqual(game_points(self.board, WHITE), SINGLE)
+
+    def test_summarize(self):
+        counters = [0] * NUM_COUNTERS
+        for points in (1, -1, 2, -3):
+            add_result(counters, points)
+        stats = summarize(counters)
+        self.assertEqual(stats['trials'], 4)
+        self.assertAlmostEqual(stats['equity'], -0.25)
+        self.assertAlmostEqual(stats['win_rate'], 0.5)
+        self.assertAlmostEqual(stats['gammon_rate'], 0.25)
+        self.assertAlmostEqual(stats['backgammon_loss_rate'], 0.25)
+        self.assertGreater(stats['std_error'], 0)
+
+    def test_winning_play_needs_no_trials(self):
+        self.board._set_off_board_count(self.white, 14)
+        self.board.get_points()[0] = [Checkers(self.white)]
+        self.board.get_points()[12] = [Checkers(self.black)] * 15
+        play = generate_plays(self.board, self.white, [1, 2])[0]
+        stats = rollout(self.board, self.white, play, trials=10)
+        self.assertEqual(stats['equity'], GAMMON)
+        self.assertEqual(stats['std_error'], 0.0)
+
+    def test_same_seed_same_result_with_any_worker_count(self):
+        self._race()
+        play = generate_plays(self.board, self.white, [2, 1])[0]
+        before = self.board.get_cells().tobytes()
+        inline = rollout(self.board, self.white, play, trials=24, seed=7, workers=1, batch_size=5)
+        pooled = rollout(self.board, self.white, play, trials=24, seed=7, workers=2, batch_size=5)
+        self.assertEqual(inline, pooled)
+        self.assertEqual(inline['trials'], 24)
+        self.assertEqual(self.board.get_cells().tobytes(), before)
+        self.assertTrue(-3 <= inline['equity'] <= 3)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            rollout(self.board, self.white, (), trials=0)
+        with self.assertRaises(ValueError):
+            rollout(self.board, self.white, (), stratify=3)
+
+    def test_variance_reductions_are_reported_separately(self):
+        self._race()
+        play = generate_plays(self.board, self.white, [2, 1])[0]
+        stats = rollout(self.board, self.white, play, trials=36, workers=1, control_variate=True)
+        for name in ('stratified', 'rotated', 'control_variate'):
+            self.assertIn(name, stats)
+            self.assertGreaterEqual(stats[name]['std_error'], 0.0)
+        self.assertAlmostEqual(stats['stratified']['equity'], stats['equity'])
+        plain = rollout(self.board, self.white, play, trials=36, workers=1, stratify=0, rotate=False)
+        self.assertNotIn('stratified', plain)
+        self.assertNotIn('rotated', plain)
+
+
+class TestTrialDice(unittest.TestCase):
+    """Tests for the dice of rollout trials."""
+
+    def test_seeded_dice_repeat(self):
+        first, second = Dice(seed=3), Dice(seed=3)
+        self.assertEqual([first.roll()[:] for _ in range(10)], [second.roll()[:] for _ in range(10)])
+
+    def test_first_roll_is_stratified(self):
+        rolls = [TrialDice(0, trial, stratify=1).roll() for trial in range(36)]
+        self.assertEqual(sorted(rolls), sorted(expand_roll(*outcome) for outcome in OUTCOMES))
+
+    def test_second_roll_is_stratified(self):
+        rolls = set()
+        for trial in range(36 * 36):
+            dice = TrialDice(0, trial, stratify=2)
+            rolls.add((dice.roll(), dice.roll()))
+        self.assertEqual(len(rolls), 21 * 21)
+
+    def test_rotation_shifts_a_shared_stream(self):
+        groups = [TrialDice(5, trial, rotate=True) for trial in range(6)]
+        for _ in range(5):
+            rolls = [dice.roll() for dice in groups]
+            # Trial k of the group rolls the first trial's dice shifted by k faces
+            base = rolls[0]
+            for shift, roll in enumerate(rolls):
+                expected = expand_roll(*[(die - 1 + shift) % 6 + 1 for die in base[:2]])
+                self.assertEqual(roll, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
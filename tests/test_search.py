@@ -0,0 +1,66 @@
+import unittest
+from core.board import Board
+from core.player import Player
+from core.checkers import Checkers
+from core.game import Game
+from core.movegen import generate_plays
+from core.openingbook import OpeningBook
+from core.search import SearchAIPlayer, ROLLS
+
+
+class TestSearchAIPlayer(unittest.TestCase):
+    """Tests for the expectiminimax AI."""
+
+    def setUp(self):
+        self.human = Player("Human", "white")
+        # Searches from the opening position, so keep the book out of the way
+        self.ai = SearchAIPlayer("Computer", "black", depth=2, opening_book=OpeningBook())
+        self.board = Board(self.human, self.ai)
+
+    def test_rolls_cover_all_outcomes(self):
+        self.assertEqual(len(ROLLS), 21)
+        self.assertAlmostEqual(sum(probability for _, probability in ROLLS), 1.0)
+
+    def test_chooses_a_legal_play_and_restores_the_board(self):
+        before = self.board.get_cells().tobytes()
+        moves = self.ai.choose_moves(self.board, [6, 5])
+        self.assertEqual(self.board.get_cells().tobytes(), before)
+        self.assertIn(tuple(moves), generate_plays(self.board, self.ai, [6, 5]))
+        self.assertGreater(self.ai.get_nodes(), 0)
+
+    def test_takes_the_winning_bear_off(self):
+        for i in range(24): self.board.get_points()[i] = []
+        self.board._set_off_board_count(self.ai, 13)
+        self.board.get_points()[22] = [Checkers(self.ai)]
+        self.board.get_points()[23] = [Checkers(self.ai)]
+        self.board.get_points()[5] = [Checkers(self.human)] * 15
+        moves = self.ai.choose_moves(self.board, [2, 1])
+        self.assertEqual(sorted(move[1] for move in moves), ['off', 'off'])
+
+    def test_time_budget_deepens_and_restores_the_board(self):
+        before = self.board.get_cells().tobytes()
+        moves = self.ai.choose_moves(self.board, [6, 5], time_budget_ms=100)
+        self.assertEqual(self.board.get_cells().tobytes(), before)
+        self.assertIn(tuple(moves), generate_plays(self.board, self.ai, [6, 5]))
+        self.assertGreaterEqual(self.ai.get_depth_reached(), 1)
+        self.assertGreater(self.ai.get_nodes(), 0)
+
+    def test_time_budget_still_returns_a_play_when_exhausted(self):
+        moves = self.ai.choose_moves(self.board, [4, 2], time_budget_ms=0)
+        self.assertIn(tuple(moves), generate_plays(self.board, self.ai, [4, 2]))
+        self.assertEqual(self.ai.get_depth_reached(), 0)
+
+    def test_invalid_depth(self):
+        with self.assertRaises(ValueError):
+            SearchAIPlayer("Computer", "black", depth=0)
+
+    def test_game_plays_the_whole_turn(self):
+        game = Game([self.human, SearchAIPlayer("Computer", "black", depth=1)])
+        game.switch_player()
+        game.dice.set_values([6, 5])
+        game.play_ai_turn()
+        self.assertEqual(game.dice.get_values(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
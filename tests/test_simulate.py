@@ -0,0 +1,49 @@
+import unittest
+from core.ai import AIPlayer
+from core.dice import Dice
+from core.search import SearchAIPlayer
+from core.simulate import make_player, play_game, simulate, format_summary, PHASES
+
+
+class TestSimulate(unittest.TestCase):
+    """Tests for the headless AI-vs-AI simulator."""
+
+    def test_make_player(self):
+        self.assertIs(type(make_player('greedy', "A", 'white')), AIPlayer)
+        player = make_player('search:1', "B", 'black')
+        self.assertIsInstance(player, SearchAIPlayer)
+        self.assertEqual(player.get_depth(), 1)
+        for spec in ('bogus', 'search:x', 'greedy:2', 'neural'):
+            with self.assertRaises(ValueError):
+                make_player(spec, "C", 'white')
+
+    def test_play_game(self):
+        winner, points, turns, phases, decisions, thinking = play_game(('greedy', 'greedy'), True, Dice(seed=3))
+        self.assertIn(winner, (0, 1))
+        self.assertIn(points, (1, 2, 3))
+        self.assertGreater(turns, 10)
+        self.assertEqual(len(phases), len(PHASES))
+        self.assertGreater(sum(decisions), 0)
+
+    def test_summary(self):
+        summary = simulate(4, 'greedy', 'search:1', seed=1)
+        self.assertEqual(summary['games'], 4)
+        self.assertEqual(sum(player['wins'] for player in summary['players']), 4)
+        self.assertAlmostEqual(sum(player['points_per_game'] for player in summary['players']), 0.0)
+        self.assertGreater(summary['games_per_second'], 0)
+        self.assertEqual(set(summary['phase_seconds']), set(PHASES))
+        self.assertEqual(len(format_summary(summary)), 4)
+
+    def test_same_games_for_any_batching(self):
+        first = simulate(6, seed=5, batch_size=1)
+        second = simulate(6, seed=5, batch_size=4, workers=2)
+        self.assertEqual(first['players'][0]['wins'], second['players'][0]['wins'])
+        self.assertEqual(first['average_turns'], second['average_turns'])
+
+    def test_rejects_no_games(self):
+        with self.assertRaises(ValueError):
+            simulate(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from core.sprt import SPRT, H0, H1, win_probability, format_sprt
+from core.simulate import simulate
+from core.tournament import run_tournament
+
+
+class TestSPRT(unittest.TestCase):
+    """Tests for the sequential probability ratio test."""
+
+    def test_win_probability(self):
+        self.assertAlmostEqual(win_probability(0), 0.5)
+        self.assertAlmostEqual(win_probability(400), 10 / 11)
+
+    def test_bounds(self):
+        lower, upper = SPRT(alpha=0.05, beta=0.05).get_bounds()
+        self.assertAlmostEqual(lower, -upper)
+        self.assertAlmostEqual(upper, 2.944, places=3)
+
+    def test_accepts_h1_on_wins_and_h0_on_losses(self):
+        test = SPRT(0, 35)
+        while test.add(True) is None:
+            pass
+        self.assertEqual(test.get_result(), H1)
+        self.assertGreaterEqual(test.llr(), test.get_bounds()[1])
+        test = SPRT(0, 35)
+        while test.add(False) is None:
+            pass
+        self.assertEqual(test.get_result(), H0)
+
+    def test_games_after_the_result_are_ignored(self):
+        test = SPRT(0, 35)
+        while test.add(True) is None:
+            pass
+        games = test.stats()['games']
+        test.add(False)
+        self.assertEqual(test.stats()['games'], games)
+        self.assertIn("H1 accepted", format_sprt(test.stats()))
+
+    def test_out_of_order_games_wait_for_earlier_ones(self):
+        test = SPRT(0, 35)
+        test.add(True, 1)
+        self.assertEqual(test.stats()['games'], 0)
+        test.add(False, 0)
+        self.assertEqual(test.stats()['wins'], 1)
+        self.assertEqual(test.stats()['losses'], 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SPRT(35, 0)
+        with self.assertRaises(ValueError):
+            SPRT(0, 35, alpha=0)
+
+    def test_simulation_stops_early(self):
+        summary = simulate(200, 'greedy', 'search:1', seed=2, batch_size=5, sprt={'elo0': 0, 'elo1': 35})
+        self.assertEqual(summary['sprt']['result'], H1)
+        self.assertLess(summary['games'], 200)
+
+    def test_tournament_stops_decided_pairs(self):
+        summary = run_tournament(['greedy', 'search:1'], 200, report=None, sprt={'elo0': 0, 'elo1': 35})
+        self.assertEqual(summary['pairs'][0]['sprt']['result'], H1)
+        self.assertLess(summary['games'], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
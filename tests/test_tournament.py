@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+from core.tournament import run_tournament, load_results, format_standings
+
+
+class TestTournament(unittest.TestCase):
+    """Tests for the round-robin tournament runner."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'results.jsonl')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_robin_streams_every_game(self):
+        summary = run_tournament(['greedy', 'search:1'], 4, self.path, report=None)
+        self.assertEqual(summary['games'], 4)
+        records = load_results(self.path)
+        self.assertEqual(sorted(record['game'] for record in records), [0, 1, 2, 3])
+        standings = summary['standings']
+        self.assertEqual(sum(row['wins'] for row in standings), 4)
+        self.assertGreaterEqual(standings[0]['points_per_game'], standings[1]['points_per_game'])
+        self.assertTrue(format_standings(summary))
+
+    def test_every_pair_plays(self):
+        summary = run_tournament(['greedy', 'search:1', 'search:2'], 1, report=None)
+        self.assertEqual(len(summary['pairs']), 3)
+        self.assertEqual(summary['games'], 3)
+        self.assertTrue(all(row['games'] == 2 for row in summary['standings']))
+
+    def test_resumes_from_a_partial_file(self):
+        fresh = run_tournament(['greedy', 'search:1'], 6, report=None)
+        run_tournament(['greedy', 'search:1'], 3, self.path, report=None)
+        with open(self.path, 'a', encoding='utf-8') as handle:
+            handle.write('{"player1": "greedy", "play')
+        resumed = run_tournament(['greedy', 'search:1'], 6, self.path, report=None)
+        self.assertEqual(resumed['run_games'], 3)
+        self.assertEqual(resumed['games'], 6)
+        self.assertEqual([row['wins'] for row in resumed['standings']],
+                         [row['wins'] for row in fresh['standings']])
+        with open(self.path, encoding='utf-8') as handle:
+            self.assertEqual(len([json.loads(line) for line in handle]), 6)
+
+    def test_parallel_matches_inline(self):
+        inline = run_tournament(['greedy', 'search:1'], 4, report=None)
+        parallel = run_tournament(['greedy', 'search:1'], 4, workers=2, batch_size=1, report=None)
+        self.assertEqual(inline['pairs'][0]['players'][0]['wins'], parallel['pairs'][0]['players'][0]['wins'])
+        self.assertEqual(inline['pairs'][0]['average_turns'], parallel['pairs'][0]['average_turns'])
+
+    def test_rejects_duplicate_entrants(self):
+        with self.assertRaises(ValueError):
+            run_tournament(['greedy', 'greedy'], 2, report=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
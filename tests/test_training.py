@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+    from core.neural import NeuralEvaluator
+    from core.dice import Dice
+    from core.training import (flip, lambda_returns, td_update, play_game, learn_game, WeightBroadcast,
+                               load_checkpoint, train)
+except ImportError:
+    np = None
+
+
+@unittest.skipUnless(np is not None, "numpy is not installed")
+class TestTraining(unittest.TestCase):
+    """Tests for the TD(lambda) self-play trainer."""
+
+    def setUp(self):
+        self.network = NeuralEvaluator(hidden=6, seed=2)
+
+    def test_flip_swaps_the_view(self):
+        values = np.array([0.7, 0.2, 0.1])
+        np.testing.assert_allclose(flip(values), [0.3, 0.1, 0.2])
+        np.testing.assert_allclose(flip(flip(values)), values)
+
+    def test_lambda_returns(self):
+        predictions = np.array([[0.5, 0, 0], [0.6, 0, 0], [0.8, 0, 0]])
+        final = np.array([1.0, 0.0, 0.0])
+        np.testing.assert_allclose(lambda_returns(predictions, final, 1.0)[:, 0], [1.0, 1.0, 1.0])
+        np.testing.assert_allclose(lambda_returns(predictions, final, 0.0)[:, 0], [0.6, 0.8, 1.0])
+
+    def test_td_update_moves_towards_targets(self):
+        inputs = np.random.default_rng(0).random((5, 196))
+        targets = np.tile([1.0, 0.0, 0.0], (5, 1))
+        first = td_update(self.network, inputs, targets, 0.01)
+        for _ in range(20):
+            last = td_update(self.network, inputs, targets, 0.01)
+        self.assertLess(last, first)
+
+    def test_play_and_learn_a_game(self):
+        trajectory = play_game(self.network, Dice(seed=1))
+        cells, off, sides, winner, points = trajectory
+        self.assertEqual(len(cells), 26 * len(sides))
+        self.assertEqual(len(off), len(sides))
+        self.assertIn(points, (1, 2, 3))
+        before = self.network.get_weights()['output_bias'].copy()
+        learn_game(self.network, trajectory, 0.1, 0.7)
+        self.assertFalse(np.array_equal(before, self.network.get_weights()['output_bias']))
+
+    def test_broadcast_round_trip(self):
+        broadcast = WeightBroadcast(6)
+        try:
+            broadcast.publish(self.network)
+            reader = WeightBroadcast(6, name=broadcast.get_name(), lock=broadcast.get_lock())
+            weights = reader.read()
+            reader.close()
+            self.assertEqual(broadcast.version(), 1)
+            np.testing.assert_array_equal(weights['hidden_weights'], self.network.get_weights()['hidden_weights'])
+        finally:
+            broadcast.close()
+
+    def test_checkpoint_and_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'weights.npz')
+            stats = train(2, path, workers=1, hidden=6, report=None)
+            self.assertEqual(stats['games'], 2)
+            self.assertGreater(stats['games_per_second'], 0)
+            stats = train(1, path, workers=1, report=None)
+            self.assertEqual(stats['games'], 3)
+            network, games = load_checkpoint(path)
+            self.assertEqual(games, 3)
+            self.assertEqual(network.get_hidden(), 6)
+            # Checkpoints load as evaluators too
+            self.assertEqual(NeuralEvaluator.load(path).get_hidden(), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from core.board import Board, WHITE, BLACK
+from core.player import Player
+from core.openingbook import OpeningBook
+from core.search import SearchAIPlayer
+from core.transposition import TranspositionTable, EXACT, LOWER, UPPER, BYTES_PER_SLOT
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Tests for the search transposition table."""
+
+    def setUp(self):
+        # Two buckets, so keys 0, 2, 4... share the first one
+        self.table = TranspositionTable(budget_bytes=4 * BYTES_PER_SLOT)
+
+    def test_budget_sets_the_size(self):
+        self.assertEqual(self.table.stats()['slots'], 4)
+        with self.assertRaises(ValueError):
+            TranspositionTable(budget_bytes=BYTES_PER_SLOT)
+
+    def test_exact_hit(self):
+        self.table.store(10, 2, 0.25, EXACT)
+        self.assertEqual(self.table.probe(10, 2, -1.0, 1.0), 0.25)
+        self.assertEqual(self.table.probe(10, 1, -1.0, 1.0), 0.25)
+        self.assertEqual(self.table.stats()['hits'], 2)
+
+    def test_shallow_entry_does_not_answer_deeper_probe(self):
+        self.table.store(10, 1, 0.25, EXACT)
+        self.assertIsNone(self.table.probe(10, 2, -1.0, 1.0))
+        self.assertIsNone(self.table.probe(12, 1, -1.0, 1.0))
+        self.assertEqual(self.table.stats()['probes'], 2)
+        self.assertEqual(self.table.stats()['hits'], 0)
+
+    def test_bounds_only_answer_outside_the_window(self):
+        self.table.store(10, 2, 0.5, LOWER)
+        self.assertEqual(self.table.probe(10, 2, 0.0, 0.4), 0.5)
+        self.assertIsNone(self.table.probe(10, 2, 0.0, 0.6))
+        self.table.store(12, 2, -0.5, UPPER)
+        self.assertEqual(self.table.probe(12, 2, -0.4, 0.0), -0.5)
+        self.assertIsNone(self.table.probe(12, 2, -0.6, 0.0))
+
+    def test_depth_preferred_slot_keeps_deep_entries(self):
+        self.table.store(10, 3, 0.1, EXACT)
+        self.table.store(12, 1, 0.2, EXACT)
+        self.table.store(14, 1, 0.3, EXACT)
+        self.assertEqual(self.table.probe(10, 3, -1.0, 1.0), 0.1)
+        self.assertIsNone(self.table.probe(12, 1, -1.0, 1.0))
+        self.assertEqual(self.table.probe(14, 1, -1.0, 1.0), 0.3)
+        self.assertEqual(self.table.stats()['overwrites'], 1)
+
+    def test_deeper_store_demotes_the_old_entry(self):
+        self.table.store(10, 1, 0.1, EXACT)
+        self.table.store(12, 2, 0.2, EXACT)
+        self.assertEqual(self.table.probe(10, 1, -1.0, 1.0), 0.1)
+        self.assertEqual(self.table.probe(12, 2, -1.0, 1.0), 0.2)
+        self.assertEqual(self.table.stats()['overwrites'], 0)
+
+    def test_clear(self):
+        self.table.store(10, 1, 0.1, EXACT)
+        self.table.clear()
+        self.assertIsNone(self.table.probe(10, 1, -1.0, 1.0))
+        self.assertEqual(self.table.stats()['hits'], 0)
+
+
+class TestSearchWithTable(unittest.TestCase):
+    """The transposition table must not change the search result."""
+
+    def setUp(self):
+        self.human = Player("Human", "white")
+        # Searches from the opening position, so keep the book out of the way
+        self.ai = SearchAIPlayer("Computer", "black", depth=2, opening_book=OpeningBook())
+        self.board = Board(self.human, self.ai)
+
+    def test_position_key_includes_side_to_move(self):
+        self.assertNotEqual(self.board.position_key(WHITE), self.board.position_key(BLACK))
+        self.assertEqual(self.board.position_key(WHITE), self.board.position_hash())
+
+    def test_same_play_with_a_warm_table(self):
+        first = self.ai.choose_moves(self.board, [4, 2])
+        cold_nodes = self.ai.get_nodes()
+        second = self.ai.choose_moves(self.board, [4, 2])
+        self.assertEqual(first, second)
+        self.assertLess(self.ai.get_nodes(), cold_nodes)
+        self.assertGreater(self.ai.get_transposition_table().stats()['hits'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
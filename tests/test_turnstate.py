@@ -0,0 +1,65 @@
+import unittest
+from core.turnstate import TurnState
+from core.movetables import WHITE, BLACK
+from core.dice import ScriptedSource
+from core.game import Game
+from core.player import Player
+
+
+class TestTurnState(unittest.TestCase):
+    """Tests for the turn state shared by the game, board and dice."""
+
+    def setUp(self):
+        self.white = Player("White", "white")
+        self.black = Player("Black", "black")
+        self.game = Game([self.white, self.black], dice_source=ScriptedSource([(3, 1), (6, 6)]))
+
+    def test_pass_turn(self):
+        turn = TurnState(WHITE, [3, 1])
+        turn.use_die(3)
+        self.assertEqual(turn.get_dice(), [1])
+        turn.pass_turn()
+        self.assertEqual(turn.snapshot(), (BLACK, (), 2))
+        with self.assertRaises(ValueError):
+            turn.use_die(1)
+
+    def test_snapshot_and_restore(self):
+        turn = TurnState(BLACK, [5, 5, 5, 5], 7)
+        saved = turn.snapshot()
+        dice = turn.get_dice()
+        turn.use_die(5)
+        turn.pass_turn()
+        turn.restore(saved)
+        self.assertEqual(turn.snapshot(), saved)
+        self.assertIs(turn.get_dice(), dice)
+
+    def test_game_board_and_dice_share_one_state(self):
+        turn = self.game.turn_state
+        self.assertIs(self.game.board.get_turn_state(), turn)
+        self.assertIs(self.game.dice.get_turn_state(), turn)
+        self.game.roll_dice()
+        self.assertEqual(turn.get_dice(), [3, 1])
+        self.game.move(7, 4)
+        self.assertEqual(self.game.dice.get_values(), [1])
+        self.game.switch_player()
+        self.assertIs(self.game.board.get_current_player(), self.black)
+        self.assertEqual(turn.get_turn(), 2)
+        self.game.roll_dice()
+        self.assertEqual(turn.get_dice(), [6, 6, 6, 6])
+
+    def test_hash_follows_the_game(self):
+        board = self.game.board
+        self.assertEqual(board.position_hash(), board.position_key(WHITE))
+        self.game.switch_player()
+        self.assertEqual(board.position_hash(), board.position_key(BLACK))
+
+    def test_board_copy_has_its_own_state(self):
+        self.game.roll_dice()
+        copy = self.game.board.copy()
+        self.game.switch_player()
+        self.assertIs(copy.get_current_player(), self.white)
+        self.assertEqual(copy.get_turn_state().get_dice(), [3, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()